@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import jsch
+
+
+def write_tree(path, count, fan_out):
+    # Each file references a shared definitions file and up to fan_out of
+    # the files after it, so most files are referenced many times over.
+    os.makedirs(os.path.join(path, 'types'))
+    with open(os.path.join(path, 'common.json'), 'w') as fp:
+        json.dump({'definitions': {
+            'id': {'type': 'integer', 'minimum': 1},
+            'name': {'type': 'string', 'maxLength': 64}
+        }}, fp)
+    for index in range(count):
+        properties = {
+            'id': {'$ref': '../common.json#/definitions/id'},
+            'name': {'$ref': '../common.json#/definitions/name'}
+        }
+        for offset in range(1, fan_out + 1):
+            if index + offset < count:
+                properties['child{0}'.format(offset)] = {
+                    '$ref': 'type{0}.json'.format(index + offset)
+                }
+        with open(os.path.join(
+                path, 'types', 'type{0}.json'.format(index)), 'w') as fp:
+            json.dump({'type': 'object', 'properties': properties}, fp)
+    with open(os.path.join(path, 'root.json'), 'w') as fp:
+        json.dump({'$ref': 'types/type0.json'}, fp)
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--fan-out', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        write_tree(path, args.count, args.fan_out)
+        store = jsch.DirectoryStore(path)
+        result = []
+        seconds = timed(lambda: result.append(
+            jsch.bundle(store['root.json'], store, name='root.json')
+        ))
+        bundled = result[0]
+        print('bundle {0} files  {1:8.4f}s  {2} definitions'.format(
+            args.count + 2, seconds, len(bundled.definitions)
+        ))
+        print('bundle again (loaded) {0:8.4f}s'.format(timed(
+            lambda: jsch.bundle(store['root.json'], store, name='root.json')
+        )))
+        print('asjson                {0:8.4f}s'.format(
+            timed(bundled.asjson)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import time
+
+import jsch
+
+
+def make_schema():
+    return jsch.Object(
+        properties={
+            'id': jsch.Integer(minimum=1),
+            'price': jsch.Number(minimum=0),
+            'paid': jsch.Boolean(),
+            'note': jsch.Schema(type=['string', 'null']),
+            'quantities': jsch.Array(items=jsch.Integer(minimum=0))
+        },
+        required=['id', 'price', 'paid']
+    )
+
+
+def make_rows(count):
+    return [
+        {
+            'id': str(index + 1),
+            'price': '{0}.{1:02d}'.format(index % 100, index % 97),
+            'paid': 'true' if index % 2 else 'false',
+            'note': 'row {0}'.format(index),
+            'quantities': [str(index % 7), str(index % 5)]
+        }
+        for index in range(count)
+    ]
+
+
+def convert_by_hand(row):
+    row = dict(row)
+    row['id'] = int(row['id'])
+    row['price'] = float(row['price'])
+    row['paid'] = row['paid'] == 'true'
+    row['quantities'] = [int(value) for value in row['quantities']]
+    return row
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    schema = make_schema()
+    rows = make_rows(args.count)
+    validator = jsch.compile_schema(schema)
+    coercer = jsch.Coercer(schema)
+
+    def by_hand():
+        for row in rows:
+            validator.validate(convert_by_hand(row))
+
+    def compiled():
+        for row in rows:
+            coercer.coerce(row)
+
+    print('by hand  {0:8.4f}s'.format(timed(by_hand)))
+    print('coercer  {0:8.4f}s'.format(timed(compiled)))
+
+
+if __name__ == '__main__':
+    main()
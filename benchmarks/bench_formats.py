@@ -0,0 +1,102 @@
+import argparse
+import datetime
+import ipaddress
+import random
+import time
+import uuid
+
+from jsch.formats import format_checker
+
+
+# Checks written the usual way, parsing with the standard library and
+# catching the exception raised for invalid values.
+def parse_date_time(value):
+    try:
+        datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return False
+    return True
+
+
+def parse_uuid(value):
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_address(constructor):
+    def parse(value):
+        try:
+            constructor(value)
+        except ValueError:
+            return False
+        return True
+    return parse
+
+
+def make_values(count, invalid_share):
+    rng = random.Random(0)
+
+    def pick(valid, invalid):
+        return invalid() if rng.random() < invalid_share else valid()
+    return {
+        'date-time': [pick(
+            lambda: '2024-{0:02}-{1:02}T12:{2:02}:00Z'.format(
+                rng.randrange(1, 13), rng.randrange(1, 29),
+                rng.randrange(60)
+            ),
+            lambda: '2024-02-30T12:00:00Z'
+        ) for _ in range(count)],
+        'uuid': [pick(
+            lambda: str(uuid.UUID(int=rng.getrandbits(128))),
+            lambda: 'not-a-uuid'
+        ) for _ in range(count)],
+        'ipv4': [pick(
+            lambda: '10.{0}.{1}.{2}'.format(
+                rng.randrange(256), rng.randrange(256), rng.randrange(256)
+            ),
+            lambda: '10.0.0.256'
+        ) for _ in range(count)],
+        'ipv6': [pick(
+            lambda: 'fe80::{0:x}:{1:x}'.format(
+                rng.randrange(65536), rng.randrange(65536)
+            ),
+            lambda: 'fe80::1::2'
+        ) for _ in range(count)]
+    }
+
+
+PARSERS = {
+    'date-time': parse_date_time,
+    'uuid': parse_uuid,
+    'ipv4': parse_address(ipaddress.IPv4Address),
+    'ipv6': parse_address(ipaddress.IPv6Address)
+}
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--invalid-share', type=float, default=0.1)
+    args = parser.parse_args()
+
+    for name, values in make_values(args.count, args.invalid_share).items():
+        checker = format_checker(name)
+        parse = PARSERS[name]
+        print('{0:9} checker {1:8.4f}s  parsing {2:8.4f}s'.format(
+            name,
+            timed(lambda: [checker(value) for value in values]),
+            timed(lambda: [parse(value) for value in values])
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import io
+import time
+
+import jsch
+from jsch import generator
+
+
+def make_schema():
+    return jsch.Object(
+        properties={
+            'id': jsch.Integer(minimum=1),
+            'name': jsch.String(min_length=3, max_length=24),
+            'price': jsch.Number(minimum=0, maximum=1000, multiple_of=0.01),
+            'status': jsch.String(enum=['new', 'paid', 'shipped']),
+            'tags': jsch.Array(items=jsch.String(max_length=8), max_items=6),
+            'address': jsch.Object(
+                properties={
+                    'street': jsch.String(),
+                    'city': jsch.String(),
+                    'zip': jsch.String(min_length=5, max_length=10)
+                },
+                required=['street', 'city']
+            )
+        },
+        required=['id', 'name', 'status']
+    )
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    schema = make_schema()
+    modes = [False] if generator.numpy is None else [False, True]
+    for use_numpy in modes:
+        label = 'numpy' if use_numpy else 'random'
+        document_generator = jsch.DocumentGenerator(
+            schema, seed=0, use_numpy=use_numpy
+        )
+        single = timed(lambda: [
+            document_generator.generate()
+            for _ in range(args.count // 10)
+        ]) * 10
+        batches = timed(lambda: list(
+            document_generator.iter_batches(args.count, args.batch_size)
+        ))
+        ndjson = timed(lambda: document_generator.dump_ndjson(
+            io.StringIO(), args.count, args.batch_size
+        ))
+        print(
+            '{0:<7} single {1:8.4f}s  batches {2:8.4f}s  '
+            'ndjson {3:8.4f}s'.format(label, single, batches, ndjson)
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import random
+import time
+
+import jsch
+from jsch.validator import Compiler
+
+
+class ItemByItemCompiler(Compiler):
+    def compile_homogeneous(self, schema):
+        return None
+
+
+def make_cases(count):
+    rng = random.Random(0)
+    return [
+        ('integers', jsch.Array(items=jsch.Integer(minimum=0)),
+         [rng.randrange(1000) for _ in range(count)]),
+        ('numbers', jsch.Array(items=jsch.Number(maximum=1)),
+         [rng.random() for _ in range(count)]),
+        ('strings', jsch.Array(items=jsch.String(max_length=8)),
+         ['s{0}'.format(rng.randrange(1000)) for _ in range(count)]),
+        ('patterns', jsch.Array(items=jsch.String(pattern='^s[0-9]+$')),
+         ['s{0}'.format(rng.randrange(1000)) for _ in range(count)]),
+        ('tuple', jsch.Array(
+            items=[jsch.String(), jsch.Integer()],
+            additional_items=jsch.Integer(minimum=0)
+        ), ['a', 1] + [rng.randrange(1000) for _ in range(count)])
+    ]
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for name, schema, instance in make_cases(args.count):
+        fast = jsch.compile_schema(schema)
+        slow = ItemByItemCompiler(schema).compile(schema)
+        print('{0:9} whole list {1:8.4f}s  item by item {2:8.4f}s'.format(
+            name,
+            timed(lambda: fast.is_valid(instance), args.repeat),
+            timed(lambda: slow.is_valid(instance), args.repeat)
+        ))
+
+
+if __name__ == '__main__':
+    main()
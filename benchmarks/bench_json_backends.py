@@ -0,0 +1,55 @@
+import argparse
+import time
+
+import jsch
+from jsch.backends import available_json_backends, load_json_backend
+
+
+def make_tree(depth, width):
+    if depth == 0:
+        return jsch.String(max_length=32, pattern='^[a-z]+$', title='Leaf')
+    return jsch.Object(
+        title='Node',
+        properties={
+            'child{0}'.format(index): make_tree(depth - 1, width)
+            for index in range(width)
+        },
+        required=['child0'],
+        min_properties=1
+    )
+
+
+def timed(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--width', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    schema = make_tree(args.depth, args.width)
+    schema_dict = schema.asdict()
+    reference = load_json_backend('json').dumps(schema_dict)
+    print('output size: {0} bytes'.format(len(reference)))
+    for name in available_json_backends():
+        backend = load_json_backend(name)
+        text = backend.dumps(schema_dict)
+        assert text == reference, name
+        dumps = timed(lambda: backend.dumps(schema_dict), args.repeat)
+        loads = timed(lambda: backend.loads(text), args.repeat)
+        print('{0:<10} dumps {1:8.4f}s  loads {2:8.4f}s'.format(
+            name, dumps, loads
+        ))
+
+
+if __name__ == '__main__':
+    main()
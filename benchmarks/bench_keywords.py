@@ -0,0 +1,68 @@
+import argparse
+import time
+
+import jsch
+from jsch.schema import KEYWORDS, SCHEMA_VALIDATION_FUNCTIONS
+from jsch.validator import fail
+
+
+def validate_every_keyword(kwargs):
+    # What creating a schema cost when every keyword was validated, used or
+    # not.
+    for key in KEYWORDS:
+        SCHEMA_VALIDATION_FUNCTIONS[key](kwargs)
+
+
+def make_kwargs(count):
+    return [
+        {'type': 'string', 'max_length': index % 64, 'title': 'field'}
+        for index in range(count)
+    ]
+
+
+def register_keywords(count):
+    for index in range(count):
+        jsch.register_keyword(
+            'x_custom_{0}'.format(index), 'x-custom{0}'.format(index),
+            compile=lambda schema, compiler: (
+                lambda instance: True, fail("must pass")
+            )
+        )
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def report(label, kwargs_list):
+    schemas = [jsch.Schema(**kwargs) for kwargs in kwargs_list[:1000]]
+    documents = ['abc'] * len(kwargs_list)
+    validator = jsch.compile_schema(schemas[0])
+    print('{0:24} create {1:8.4f}s  validate every keyword {2:8.4f}s  '
+          'is_valid {3:8.4f}s'.format(
+              label,
+              timed(lambda: [jsch.Schema(**kwargs)
+                             for kwargs in kwargs_list]),
+              timed(lambda: [validate_every_keyword(kwargs)
+                             for kwargs in kwargs_list]),
+              timed(lambda: [validator.is_valid(document)
+                             for document in documents])
+          ))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--keywords', type=int, default=50)
+    args = parser.parse_args()
+
+    kwargs_list = make_kwargs(args.count)
+    report('built-in keywords', kwargs_list)
+    register_keywords(args.keywords)
+    report('{0} custom keywords'.format(args.keywords), kwargs_list)
+
+
+if __name__ == '__main__':
+    main()
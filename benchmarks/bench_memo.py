@@ -0,0 +1,94 @@
+import argparse
+import random
+import time
+
+import jsch
+
+
+def make_schema():
+    device = jsch.Object(
+        properties={
+            'os': jsch.String(enum=['ios', 'android', 'web']),
+            'model': jsch.String(pattern='^[A-Z][a-z0-9]+$'),
+            'version': jsch.Array(items=jsch.Integer(minimum=0), max_items=4)
+        },
+        required=['os', 'model']
+    )
+    geo = jsch.Object(properties={
+        'country': jsch.String(min_length=2, max_length=2),
+        'lat': jsch.Number(minimum=-90, maximum=90),
+        'lon': jsch.Number(minimum=-180, maximum=180)
+    })
+    return jsch.Array(items=jsch.Object(
+        properties={
+            'id': jsch.Integer(minimum=1),
+            'device': device,
+            'geo': geo
+        },
+        required=['id', 'device']
+    ))
+
+
+def make_batch(count, distinct):
+    rng = random.Random(0)
+    devices = [
+        {
+            'os': rng.choice(['ios', 'android', 'web']),
+            'model': 'M{0}'.format(index),
+            'version': [rng.randrange(10) for _ in range(3)]
+        }
+        for index in range(distinct)
+    ]
+    geos = [
+        {'country': 'GB', 'lat': rng.uniform(-90, 90), 'lon': 0.5}
+        for _ in range(distinct)
+    ]
+    return [
+        {
+            'id': index + 1,
+            'device': dict(rng.choice(devices)),
+            'geo': dict(rng.choice(geos))
+        }
+        for index in range(count)
+    ]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--distinct', type=int, default=50)
+    args = parser.parse_args()
+
+    schema = make_schema()
+    batch = make_batch(args.count, args.distinct)
+    validator = jsch.compile_schema(schema)
+    memoized = jsch.compile_memoized(schema)
+    print('plain     {0:8.4f}s'.format(
+        timed(lambda: validator.is_valid(batch))
+    ))
+    print('memoized  {0:8.4f}s  hit rate {1:.2%}'.format(
+        timed(lambda: memoized.is_valid(batch)), memoized.memo.hit_rate
+    ))
+
+    # Large nested documents are too big to memoize, and should cost no
+    # more than validating them without the memo.
+    schema = jsch.Array(items=jsch.Array(items=jsch.Integer()))
+    document = [list(range(20000)) for _ in range(50)]
+    validator = jsch.compile_schema(schema)
+    memoized = jsch.compile_memoized(schema)
+    print('large plain     {0:8.4f}s'.format(
+        timed(lambda: validator.is_valid(document))
+    ))
+    print('large memoized  {0:8.4f}s'.format(
+        timed(lambda: memoized.is_valid(document))
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import random
+import re
+import time
+
+import jsch
+
+
+def make_schema(patterns):
+    return jsch.Object(
+        properties={
+            'name': jsch.String(),
+            'version': jsch.Integer(minimum=1)
+        },
+        pattern_properties={
+            '^{0}_[a-z0-9_]+$'.format(prefix): jsch.Schema(
+                type=['string', 'integer', 'boolean']
+            )
+            for prefix in patterns
+        },
+        additional_properties=False
+    )
+
+
+def make_config(prefixes, keys):
+    rng = random.Random(0)
+    config = {'name': 'service', 'version': 3}
+    for index in range(keys):
+        name = '{0}_key_{1}'.format(rng.choice(prefixes), index)
+        config[name] = rng.choice(['on', 1, True])
+    return config
+
+
+def compile_naive(schema):
+    # Every name against every pattern, as the validator used to do.
+    properties = schema.properties
+    patterns = [
+        (re.compile(pattern).search, jsch.compile_schema(pattern_schema))
+        for pattern, pattern_schema in schema.pattern_properties.items()
+    ]
+    validators = {
+        name: jsch.compile_schema(property_schema)
+        for name, property_schema in properties.items()
+    }
+
+    def is_valid(config):
+        for name, value in config.items():
+            matched = name in properties
+            if matched and not validators[name].is_valid(value):
+                return False
+            for search, validator in patterns:
+                if search(name):
+                    matched = True
+                    if not validator.is_valid(value):
+                        return False
+            if not matched:
+                return False
+        return True
+    return is_valid
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--patterns', type=int, default=40)
+    parser.add_argument('--keys', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    prefixes = ['p{0}'.format(index) for index in range(args.patterns)]
+    schema = make_schema(prefixes)
+    config = make_config(prefixes, args.keys)
+    validator = jsch.compile_schema(schema)
+    naive_is_valid = compile_naive(schema)
+    assert validator.is_valid(config) and naive_is_valid(config)
+    print('combined  {0:8.4f}s'.format(
+        timed(lambda: validator.is_valid(config), args.repeat)
+    ))
+    print('naive     {0:8.4f}s'.format(
+        timed(lambda: naive_is_valid(config), args.repeat)
+    ))
+
+
+if __name__ == '__main__':
+    main()
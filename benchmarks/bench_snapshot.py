@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import jsch
+from jsch.snapshot import dump_snapshot, load_snapshot
+
+
+def make_schema(index):
+    return jsch.Object(
+        title='Record {0}'.format(index),
+        properties={
+            'id': jsch.Integer(minimum=0),
+            'name': jsch.String(max_length=64, pattern='^[a-z]+$'),
+            'tags': jsch.Array(items=jsch.String(), unique_items=True),
+            'address': jsch.Object(
+                properties={
+                    'street': jsch.String(),
+                    'city': jsch.String(),
+                    'zip': jsch.String(min_length=5, max_length=10)
+                },
+                required=['street', 'city']
+            )
+        },
+        required=['id', 'name'],
+        additional_properties=False
+    )
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    schemas = {
+        'schema-{0}'.format(index): make_schema(index)
+        for index in range(args.count)
+    }
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, 'registry.json')
+    snapshot_path = os.path.join(directory, 'registry.snap')
+    with open(json_path, 'w') as fp:
+        json.dump({n: s.asdict() for n, s in schemas.items()}, fp,
+                  cls=jsch.schema.SchemaJsonEncoder)
+    with open(snapshot_path, 'wb') as fp:
+        dump_snapshot(schemas, fp)
+
+    def json_reload():
+        with open(json_path) as fp:
+            return {
+                name: jsch.Schema.fromdict(schema_dict)
+                for name, schema_dict in json.load(fp).items()
+            }
+
+    def snapshot_open():
+        return load_snapshot(snapshot_path)
+
+    def snapshot_materialize():
+        snapshot = load_snapshot(snapshot_path)
+        for schema in snapshot.values():
+            schema.properties['address'].properties
+        return snapshot
+
+    print('schemas: {0}'.format(args.count))
+    for name, function in [
+            ('json reload', json_reload),
+            ('snapshot open', snapshot_open),
+            ('snapshot open + full access', snapshot_materialize)]:
+        elapsed, _ = timed(function)
+        print('{0:<30} {1:8.3f}s'.format(name, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import os
+import sys
+import threading
+import time
+
+import jsch
+
+
+def make_schema():
+    return jsch.Object(
+        properties={
+            'id': jsch.Integer(minimum=1),
+            'name': jsch.String(min_length=1, max_length=32),
+            'tags': jsch.Array(items=jsch.String(pattern='^[a-z]+$')),
+            'address': jsch.Object(
+                properties={
+                    'city': jsch.String(),
+                    'zip': jsch.String(pattern='^[0-9]{5}$')
+                },
+                required=['city']
+            )
+        },
+        required=['id', 'name']
+    )
+
+
+DOCUMENT = {
+    'id': 1,
+    'name': 'Ada',
+    'tags': ['math', 'engine'],
+    'address': {'city': 'London', 'zip': '12345'}
+}
+
+
+def run_threads(count, work):
+    # All threads share the one compiled schema, and start together so the
+    # measured time covers only the concurrent part.
+    barrier = threading.Barrier(count + 1)
+
+    def target():
+        barrier.wait()
+        work()
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--operations', type=int, default=20000)
+    args = parser.parse_args()
+
+    schema = make_schema()
+    validator = jsch.compile_schema(schema)
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    print('GIL enabled: {0}'.format(is_gil_enabled()))
+
+    def validate():
+        for _ in range(args.operations):
+            validator.is_valid(DOCUMENT)
+
+    def asjson():
+        for _ in range(args.operations):
+            schema.asjson()
+
+    for label, work in [('validate', validate), ('asjson', asjson)]:
+        baseline = None
+        for count in range(1, args.threads + 1):
+            elapsed = run_threads(count, work)
+            throughput = count * args.operations / elapsed
+            if baseline is None:
+                baseline = throughput
+            print('{0:<8} {1:>3} threads {2:>12.0f} ops/s  {3:5.2f}x'.format(
+                label, count, throughput, throughput / baseline
+            ))
+
+
+if __name__ == '__main__':
+    main()
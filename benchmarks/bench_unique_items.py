@@ -0,0 +1,54 @@
+import argparse
+import random
+import time
+
+import jsch
+from jsch.validator import are_items_unique_pairwise
+
+
+def make_arrays(count):
+    rng = random.Random(0)
+    return {
+        'integers': list(range(count)),
+        'numbers': [index + 0.5 for index in range(count)],
+        'strings': ['item-{0}'.format(index) for index in range(count)],
+        'mixed': [
+            rng.choice([index, str(index), float(index) + 0.25])
+            for index in range(count)
+        ],
+        'objects': [
+            {'id': index, 'tags': ['a', 'b'], 'active': index % 2 == 0}
+            for index in range(count)
+        ]
+    }
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--pairwise-count', type=int, default=2000)
+    args = parser.parse_args()
+
+    validator = jsch.compile_schema(jsch.Array(unique_items=True))
+    for name, array in make_arrays(args.count).items():
+        elapsed = timed(lambda: validator.is_valid(array))
+        print('{0:9} {1:8} items  {2:8.4f}s'.format(
+            name, len(array), elapsed
+        ))
+    # Pairwise comparison is quadratic, so it only runs on a small sample.
+    for name, array in make_arrays(args.pairwise_count).items():
+        hashed = timed(lambda: validator.is_valid(array))
+        pairwise = timed(lambda: are_items_unique_pairwise(array))
+        print('{0:9} {1:8} items  {2:8.4f}s  pairwise {3:8.4f}s'.format(
+            name, len(array), hashed, pairwise
+        ))
+
+
+if __name__ == '__main__':
+    main()
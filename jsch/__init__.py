@@ -7,5 +7,77 @@ from jsch.schema import (
     Null,
     Number,
     Object,
-    String
+    String,
+    walk
+)
+from jsch.snapshot import (
+    Snapshot,
+    SnapshotError,
+    dump_snapshot,
+    load_snapshot,
+    loads_snapshot
+)
+from jsch.formats import (
+    register_format
+)
+from jsch.validator import (
+    ValidationError,
+    Validator,
+    compile_schema
+)
+from jsch.profiling import (
+    ProfileStats,
+    ValidationProfiler
+)
+from jsch.stream import (
+    JsonStreamError,
+    StreamValidator,
+    validate_stream
+)
+from jsch.canonical import (
+    canonical_json,
+    fingerprint
+)
+from jsch.diff import (
+    SchemaChange,
+    diff
+)
+from jsch.strict import (
+    SchemaStrict,
+    validate_strict
+)
+from jsch.optimize import (
+    OptimizationReport,
+    optimize
+)
+from jsch.generator import (
+    DocumentGenerator
+)
+from jsch.columnar import (
+    ColumnValidator,
+    StructuredLoader,
+    column_mask,
+    invalid_indices,
+    load_ndjson,
+    structured_dtype
+)
+from jsch.defaults import (
+    DefaultsTemplate,
+    apply_defaults
+)
+from jsch.coerce import (
+    Coercer,
+    coerce
+)
+from jsch.memo import (
+    ValidationMemo,
+    compile_memoized
+)
+from jsch.keywords import (
+    register_keyword,
+    unregister_keyword
+)
+from jsch.bundle import (
+    DirectoryStore,
+    bundle
 )
@@ -0,0 +1,168 @@
+import collections
+import importlib
+import json
+import re
+
+
+# Fragments of compact output that the optional encoders are known to
+# format differently from the standard library: DEL and non-ASCII
+# characters, which the standard library escapes, float exponents (1e16 vs
+# 1e+16), and null, which orjson and msgspec also emit for NaN and Infinity.
+# Output containing them is re-encoded with the standard library so that
+# every backend produces identical text. The patterns are single byte
+# classes or start with a literal, so the scan stays cheap on large output,
+# and need nothing newer than Python 3.5.
+NON_PORTABLE_PATTERNS = [
+    re.compile(rb'[\x7f-\xff]'),
+    re.compile(rb'e[-+0-9]'),
+    re.compile(rb'E[-+0-9]'),
+    re.compile(rb'null[,}\]]')
+]
+
+
+def is_portable(output):
+    for pattern in NON_PORTABLE_PATTERNS:
+        if pattern.search(output) is not None:
+            return False
+    return True
+
+
+def encode_default(o):
+    if hasattr(o, 'asdict'):
+        return o.asdict()
+    raise TypeError(
+        "Object of type {0} is not JSON serializable".format(
+            type(o).__name__
+        )
+    )
+
+
+def stdlib_dumps(obj, pretty):
+    return json.dumps(
+        obj,
+        default=encode_default,
+        sort_keys=True,
+        indent=(4 if pretty else None),
+        separators=((',', ': ') if pretty else (',', ':'))
+    )
+
+
+class JsonBackend(object):
+    name = None
+    module_name = None
+
+    def __init__(self, module):
+        self.module = module
+
+    def encode(self, obj):
+        raise NotImplementedError
+
+    def dumps(self, obj, pretty=False):
+        if not pretty:
+            try:
+                output = self.encode(obj)
+            except Exception:
+                output = None
+            if output is not None and is_portable(output):
+                return output.decode('ascii')
+        return stdlib_dumps(obj, pretty)
+
+    def loads(self, text):
+        return self.module.loads(text)
+
+
+class StdlibJsonBackend(JsonBackend):
+    name = 'json'
+    module_name = 'json'
+
+    def dumps(self, obj, pretty=False):
+        return stdlib_dumps(obj, pretty)
+
+
+class OrjsonBackend(JsonBackend):
+    name = 'orjson'
+    module_name = 'orjson'
+
+    def encode(self, obj):
+        return self.module.dumps(
+            obj, default=encode_default, option=self.module.OPT_SORT_KEYS
+        )
+
+
+class MsgspecBackend(JsonBackend):
+    name = 'msgspec'
+    module_name = 'msgspec.json'
+
+    def __init__(self, module):
+        super().__init__(module)
+        self._encoder = module.Encoder(enc_hook=encode_default, order='sorted')
+        self._decoder = module.Decoder()
+
+    def encode(self, obj):
+        return self._encoder.encode(obj)
+
+    def loads(self, text):
+        return self._decoder.decode(text)
+
+
+class UjsonBackend(JsonBackend):
+    name = 'ujson'
+    module_name = 'ujson'
+
+    def encode(self, obj):
+        return self.module.dumps(
+            obj,
+            default=encode_default,
+            sort_keys=True,
+            ensure_ascii=True,
+            escape_forward_slashes=False
+        ).encode('ascii')
+
+
+JSON_BACKENDS = collections.OrderedDict([
+    (OrjsonBackend.name, OrjsonBackend),
+    (MsgspecBackend.name, MsgspecBackend),
+    (UjsonBackend.name, UjsonBackend),
+    (StdlibJsonBackend.name, StdlibJsonBackend)
+])
+
+
+def load_json_backend(name):
+    if name not in JSON_BACKENDS:
+        raise ValueError("'{0}' is not a recognised JSON backend".format(name))
+    backend_cls = JSON_BACKENDS[name]
+    try:
+        module = importlib.import_module(backend_cls.module_name)
+    except ImportError:
+        return None
+    return backend_cls(module)
+
+
+def available_json_backends():
+    return [
+        name for name in JSON_BACKENDS
+        if load_json_backend(name) is not None
+    ]
+
+
+_backend = None
+
+
+def get_json_backend():
+    global _backend
+    if _backend is None:
+        for name in JSON_BACKENDS:
+            backend = load_json_backend(name)
+            if backend is not None:
+                _backend = backend
+                break
+    return _backend
+
+
+def set_json_backend(name):
+    global _backend
+    backend = load_json_backend(name)
+    if backend is None:
+        raise ValueError("'{0}' JSON backend is not installed".format(name))
+    _backend = backend
+    return backend
@@ -0,0 +1,191 @@
+import collections.abc
+import os
+import posixpath
+
+from jsch.schema import (
+    KEYWORD_KEYS,
+    Schema,
+    SchemaValidationError,
+    escape_pointer_token,
+    map_subschemas,
+    unescape_pointer_token,
+    DEFINITIONS_KEY,
+    REF_KEY
+)
+from jsch.validator import resolve_pointer
+
+
+class DirectoryStore(collections.abc.Mapping):
+    # Schemas in the JSON files beneath a directory, named by their paths
+    # relative to it with '/' separators, and loaded when first used.
+    def __init__(self, path):
+        self.path = path
+        self._root = os.path.realpath(path)
+        self._schemas = {}
+
+    def __getitem__(self, name):
+        schema = self._schemas.get(name, None)
+        if schema is None:
+            path = os.path.realpath(
+                os.path.join(self._root, *name.split('/'))
+            )
+            # Names must not reach files outside the directory, whether
+            # through '..', absolute parts or symbolic links.
+            if os.path.commonpath([self._root, path]) != self._root:
+                raise KeyError(name)
+            try:
+                with open(path, encoding='utf-8') as fp:
+                    json_str = fp.read()
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                raise KeyError(name)
+            schema = self._schemas.setdefault(name, Schema.fromjson(json_str))
+        return schema
+
+    def __iter__(self):
+        for directory, _, file_names in os.walk(self.path):
+            relative = os.path.relpath(directory, self.path)
+            for file_name in sorted(file_names):
+                if file_name.endswith('.json'):
+                    yield posixpath.normpath(posixpath.join(
+                        *relative.split(os.sep), file_name
+                    ))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def split_ref(ref):
+    path, _, fragment = ref.partition('#')
+    return path, fragment
+
+
+def children(schema):
+    nodes = []
+    for keyword, value in schema._dict.items():
+        map_subschemas(KEYWORD_KEYS[keyword], value, nodes.append)
+    return nodes
+
+
+def rebuild(schema, rewrite_ref):
+    # Copies a schema with each $ref replaced by rewrite_ref($ref), building
+    # every sub-schema before its parents with an explicit stack, so that
+    # any depth can be copied, and copying shared sub-schemas once.
+    built = {}
+    stack = [(schema, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in built:
+            continue
+        if not expanded:
+            stack.append((node, True))
+            stack.extend(
+                (child, False) for child in reversed(children(node))
+                if id(child) not in built
+            )
+            continue
+        kwargs = {}
+        for keyword, value in node._dict.items():
+            key = KEYWORD_KEYS[keyword]
+            kwargs[key] = map_subschemas(
+                key, value, lambda child: built[id(child)]
+            )
+        if node.ref is not None:
+            kwargs[REF_KEY] = rewrite_ref(node.ref)
+        built[id(node)] = Schema(**kwargs)
+    return built[id(schema)]
+
+
+class Bundler(object):
+    def __init__(self, store, name=''):
+        self.store = store
+        self.name = name
+        self.definitions = {}
+        self._targets = {}
+        self._queue = collections.deque()
+        self._names = set()
+
+    def load(self, name):
+        try:
+            schema = self.store[name]
+        except KeyError:
+            raise SchemaValidationError(
+                REF_KEY, "'{0}' cannot be resolved".format(name)
+            )
+        return Schema.fromdict(schema) if isinstance(schema, dict) else schema
+
+    def target_schema(self, documents, target):
+        document, fragment = target
+        if document not in documents:
+            documents[document] = self.load(document)
+        try:
+            return resolve_pointer(documents[document], '#' + fragment)
+        except SchemaValidationError:
+            raise SchemaValidationError(
+                REF_KEY,
+                "'{0}#{1}' cannot be resolved".format(document, fragment)
+            )
+
+    def resolve(self, document, ref):
+        # The document and JSON pointer fragment that a $ref in a document
+        # refers to, with paths relative to the referring document.
+        path, fragment = split_ref(ref)
+        if path:
+            document = posixpath.normpath(
+                posixpath.join(posixpath.dirname(document), path)
+            )
+        return document, fragment
+
+    def define(self, target):
+        # Each target is copied into the definitions once, under a name
+        # made from its file name and the last token of its fragment.
+        name = self._targets.get(target, None)
+        if name is None:
+            document, fragment = target
+            base = posixpath.splitext(posixpath.basename(document))[0]
+            if fragment.strip('/'):
+                base = '{0}.{1}'.format(
+                    base, unescape_pointer_token(fragment.split('/')[-1])
+                )
+            name = base or 'schema'
+            suffix = 1
+            while name in self._names:
+                suffix += 1
+                name = '{0}-{1}'.format(base, suffix)
+            self._names.add(name)
+            self._targets[target] = name
+            self._queue.append(target)
+        return name
+
+    def rewriter(self, document):
+        def rewrite_ref(ref):
+            target = self.resolve(document, ref)
+            if target[0] == self.name:
+                # The root keeps its shape, so its pointers stay valid.
+                return '#' + target[1]
+            return '#/{0}/{1}'.format(
+                DEFINITIONS_KEY, escape_pointer_token(self.define(target))
+            )
+        return rewrite_ref
+
+    def bundle(self, schema):
+        definitions = schema.definitions or {}
+        self._names.update(definitions)
+        root = rebuild(schema, self.rewriter(self.name))
+        documents = {}
+        while self._queue:
+            target = self._queue.popleft()
+            self.definitions[self._targets[target]] = rebuild(
+                self.target_schema(documents, target),
+                self.rewriter(target[0])
+            )
+        if not self.definitions:
+            return root
+        kwargs = {KEYWORD_KEYS[k]: v for k, v in root._dict.items()}
+        kwargs[DEFINITIONS_KEY] = dict(
+            root.definitions or {}, **self.definitions
+        )
+        return Schema(**kwargs)
+
+
+def bundle(schema, store, name=''):
+    return Bundler(store, name).bundle(schema)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+
+from jsch.schema import (
+    KEYWORD_KEYS,
+    Schema,
+    map_subschemas,
+    publish_once,
+    walk,
+    DEPENDENCIES_KEY,
+    ENUM_KEY,
+    REQUIRED_KEY,
+    TYPE_KEY
+)
+
+
+def dumps_canonical(value):
+    return json.dumps(
+        value, sort_keys=True, separators=(',', ':'), ensure_ascii=True
+    )
+
+
+def canonical_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, list):
+        return [canonical_value(item) for item in value]
+    if isinstance(value, dict):
+        return {k: canonical_value(v) for k, v in value.items()}
+    return value
+
+
+def canonical_keyword_value(key, value, function):
+    if value is None:
+        return None
+    value = map_subschemas(key, canonical_value(value), function)
+    if key == TYPE_KEY and isinstance(value, list):
+        value = value[0] if len(value) == 1 else sorted(value)
+    elif key == REQUIRED_KEY:
+        value = sorted(value)
+    elif key == ENUM_KEY:
+        value = sorted(value, key=dumps_canonical)
+    elif key == DEPENDENCIES_KEY:
+        value = {
+            k: sorted(v) if isinstance(v, list) else v
+            for k, v in value.items()
+        }
+    return value
+
+
+def children_first(schema):
+    # Yields the schema and every sub-schema beneath it once, each after all
+    # of its own sub-schemas, using an explicit stack so that any depth can
+    # be handled.
+    done = set()
+    stack = [(schema, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in done:
+            continue
+        if expanded:
+            done.add(id(node))
+            yield node
+            continue
+        stack.append((node, True))
+        for keyword, value in node._dict.items():
+            map_subschemas(
+                KEYWORD_KEYS[keyword], value,
+                lambda child: stack.append((child, False))
+            )
+
+
+def canonical_dict(schema):
+    built = {}
+    for node in children_first(schema):
+        built[id(node)] = {
+            keyword: canonical_keyword_value(
+                KEYWORD_KEYS[keyword], value, lambda child: built[id(child)]
+            )
+            for keyword, value in node._dict.items()
+        }
+    return built[id(schema)]
+
+
+def dumps_keyword_value(value, texts):
+    # Sub-schemas are written as the text already made for them, so that
+    # the encoder never descends into them.
+    if isinstance(value, Schema):
+        return texts[id(value)]
+    if isinstance(value, list) and \
+            any(isinstance(item, Schema) for item in value):
+        return '[{0}]'.format(','.join(
+            texts[id(item)] if isinstance(item, Schema)
+            else dumps_canonical(item)
+            for item in value
+        ))
+    if isinstance(value, dict) and \
+            any(isinstance(item, Schema) for item in value.values()):
+        return '{{{0}}}'.format(','.join(
+            '{0}:{1}'.format(
+                dumps_canonical(name),
+                texts[id(item)] if isinstance(item, Schema)
+                else dumps_canonical(item)
+            )
+            for name, item in sorted(value.items())
+        ))
+    return dumps_canonical(value)
+
+
+def canonical_json(schema):
+    texts = {}
+    for node in children_first(schema):
+        texts[id(node)] = '{{{0}}}'.format(','.join(
+            '{0}:{1}'.format(dumps_canonical(keyword), dumps_keyword_value(
+                canonical_keyword_value(
+                    KEYWORD_KEYS[keyword], value, lambda child: child
+                ),
+                texts
+            ))
+            for keyword, value in sorted(node._dict.items())
+        ))
+    return texts[id(schema)]
+
+
+def compute_fingerprint(schema):
+    node = {
+        keyword: canonical_keyword_value(
+            KEYWORD_KEYS[keyword], value, fingerprint
+        )
+        for keyword, value in schema._dict.items()
+    }
+    return hashlib.sha256(dumps_canonical(node).encode('ascii')).hexdigest()
+
+
+def fingerprint(schema):
+    digest = schema.__dict__.get('_fingerprint', None)
+    if digest is None:
+        # Sub-schemas are fingerprinted deepest first, so that computing
+        # each node only looks up its children and never recurses.
+        nodes = {}
+        for _, node in walk(schema, prune=lambda pointer, node: (
+                id(node) in nodes or '_fingerprint' in node.__dict__)):
+            nodes[id(node)] = node
+        for node in reversed(list(nodes.values())):
+            digest = publish_once(
+                node, '_fingerprint', lambda: compute_fingerprint(node)
+            )
+    return digest
@@ -0,0 +1,371 @@
+import re
+
+from jsch.schema import (
+    KEYWORDS,
+    Schema,
+    ADDITIONAL_ITEMS_KEY,
+    ADDITIONAL_PROPERTIES_KEY,
+    ITEMS_KEY,
+    MAXIMUM_KEY,
+    MINIMUM_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    TYPE_KEY,
+    publish_once
+)
+from jsch.validator import (
+    INSTANCE_VALIDATION_FUNCTIONS,
+    Compiler,
+    ValidationError,
+    resolve_pointer
+)
+
+
+# Keywords whose sub-schemas are checked while their values are coerced, so
+# the node's own check for them would only repeat that work.
+COERCED_KEYS = frozenset([
+    ADDITIONAL_ITEMS_KEY, ADDITIONAL_PROPERTIES_KEY, ITEMS_KEY,
+    PATTERN_PROPERTIES_KEY, PROPERTIES_KEY
+])
+
+# The order in which a string is tried against a list of types. A string
+# that converts to none of them is kept, and left to the type check.
+TYPE_ORDER = ['null', 'boolean', 'integer', 'number']
+
+NULL_STRINGS = frozenset(['', 'null'])
+BOOLEAN_STRINGS = {'true': True, 'false': False}
+FAILED = object()
+
+
+def to_null(value):
+    return None if value in NULL_STRINGS else FAILED
+
+
+def to_boolean(value):
+    return BOOLEAN_STRINGS.get(value.lower(), FAILED)
+
+
+def to_integer(value):
+    if '_' not in value:
+        try:
+            return int(value)
+        except ValueError:
+            number = to_float(value)
+            if number is not FAILED and number.is_integer():
+                return int(number)
+    return FAILED
+
+
+def to_number(value):
+    # Strings without a fraction or exponent are tried as integers first,
+    # so that large integers keep their precision.
+    if '_' in value:
+        return FAILED
+    if '.' not in value and 'e' not in value and 'E' not in value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return to_float(value)
+
+
+def to_float(value):
+    try:
+        number = float(value)
+    except ValueError:
+        return FAILED
+    if number - number != 0:
+        return FAILED
+    return number
+
+
+STRING_CONVERSIONS = {
+    'boolean': to_boolean,
+    'integer': to_integer,
+    'null': to_null,
+    'number': to_number
+}
+
+NUMERIC_TYPES = frozenset(['integer', 'number'])
+
+
+def compile_number_minimum(schema):
+    minimum = schema.minimum
+    if schema.exclusive_minimum:
+        return lambda number: number > minimum
+    return lambda number: number >= minimum
+
+
+def compile_number_maximum(schema):
+    maximum = schema.maximum
+    if schema.exclusive_maximum:
+        return lambda number: number < maximum
+    return lambda number: number <= maximum
+
+
+# Bounds tests for values converted to numbers, which need not repeat the
+# validator's check that the value is a number.
+NUMBER_TESTS = {
+    MAXIMUM_KEY: compile_number_maximum,
+    MINIMUM_KEY: compile_number_minimum
+}
+
+
+def types_of(schema):
+    type_value = schema.type
+    if isinstance(type_value, str):
+        return [type_value]
+    return type_value or []
+
+
+def compile_conversion(schema):
+    types = types_of(schema)
+    conversions = [
+        STRING_CONVERSIONS[type_str] for type_str in TYPE_ORDER
+        if type_str in types
+    ]
+    if not conversions or 'string' in types:
+        return None
+    if len(conversions) == 1:
+        return conversions[0]
+
+    def convert(value):
+        for conversion in conversions:
+            converted = conversion(value)
+            if converted is not FAILED:
+                return converted
+        return FAILED
+    return convert
+
+
+def first_error(checks, value):
+    for test, explain in checks:
+        if not test(value):
+            return next(explain(value, None))
+
+
+def matched_checks(schema, keyed_checks, type_str):
+    # A value already known to have one of the schema's types, such as a
+    # coerced container, skips the type check.
+    return tuple(
+        check for key, check in keyed_checks
+        if key != TYPE_KEY or type_str not in types_of(schema)
+    )
+
+
+def raise_item_error(coercer, items):
+    # Coercing again is cheaper than tracking the index of every item, as
+    # only the failure path pays for it.
+    for index, item in enumerate(items):
+        try:
+            coercer(item)
+        except ValidationError as error:
+            error.path.appendleft(index)
+            raise
+
+
+class Coercer(object):
+    def __init__(self, schema):
+        self.schema = schema
+        self.compiler = Compiler(schema)
+        self._coercers = {}
+        self._coerce = self.compile(schema)
+
+    def compile(self, schema):
+        coercer = self._coercers.get(id(schema), None)
+        if coercer is None:
+            compiled = []
+            self._coercers[id(schema)] = lambda value: compiled[0](value)
+            compiled.append(self._compile(schema))
+            coercer = self._coercers[id(schema)] = compiled[0]
+        return coercer
+
+    def _compile(self, schema):
+        if schema.ref is not None:
+            return self.compile(resolve_pointer(self.schema, schema.ref))
+        coerce_object = self.compile_object(schema)
+        coerce_array = self.compile_array(schema)
+        keyed_checks = self.compile_checks(schema)
+        coerce_scalar = self.compile_scalar(schema, keyed_checks)
+        if coerce_object is None and coerce_array is None:
+            return coerce_scalar
+        object_checks = matched_checks(schema, keyed_checks, 'object')
+        object_tests = tuple(test for test, _ in object_checks)
+        array_checks = matched_checks(schema, keyed_checks, 'array')
+        array_tests = tuple(test for test, _ in array_checks)
+
+        def coerce(value):
+            if coerce_object is not None and isinstance(value, dict):
+                value = coerce_object(value)
+                for test in object_tests:
+                    if not test(value):
+                        raise first_error(object_checks, value)
+                return value
+            if coerce_array is not None and isinstance(value, list):
+                value = coerce_array(value)
+                for test in array_tests:
+                    if not test(value):
+                        raise first_error(array_checks, value)
+                return value
+            return coerce_scalar(value)
+        return coerce
+
+    def compile_scalar(self, schema, keyed_checks):
+        checks = tuple(check for _, check in keyed_checks)
+        tests = tuple(test for test, _ in checks)
+        conversion = compile_conversion(schema)
+        if conversion is None:
+            def coerce(value):
+                for test in tests:
+                    if not test(value):
+                        raise first_error(checks, value)
+                return value
+            return coerce
+        # A converted string already has one of the schema's types.
+        numeric = NUMERIC_TYPES.issuperset(types_of(schema))
+        converted_checks = tuple(
+            (NUMBER_TESTS[key](schema), explain)
+            if numeric and key in NUMBER_TESTS else (test, explain)
+            for key, (test, explain) in keyed_checks if key != TYPE_KEY
+        )
+        converted_tests = tuple(test for test, _ in converted_checks)
+
+        def coerce(value):
+            if isinstance(value, str):
+                converted = conversion(value)
+                if converted is not FAILED:
+                    for test in converted_tests:
+                        if not test(converted):
+                            raise first_error(converted_checks, converted)
+                    return converted
+            for test in tests:
+                if not test(value):
+                    raise first_error(checks, value)
+            return value
+        return coerce
+
+    def compile_checks(self, schema):
+        checks = []
+        for key in INSTANCE_VALIDATION_FUNCTIONS:
+            value = schema._dict.get(KEYWORDS[key], None)
+            if value is None:
+                continue
+            # A false additional_properties or additional_items only looks
+            # at names and lengths, so it is still checked on the node.
+            if key in COERCED_KEYS and value is not False:
+                continue
+            check = self.compiler.compile_keyword(key, schema)
+            if check is not None:
+                checks.append((key, check))
+        return checks
+
+    def compile_object(self, schema):
+        properties = {
+            name: self.compile(property_schema)
+            for name, property_schema in (schema.properties or {}).items()
+        }
+        patterns = [
+            (re.compile(pattern).search, self.compile(pattern_schema),
+             self.compiler.compile(pattern_schema))
+            for pattern, pattern_schema in (
+                schema.pattern_properties or {}
+            ).items()
+        ]
+        additional = schema.additional_properties
+        additional = self.compile(additional) \
+            if isinstance(additional, Schema) else None
+        if not properties and not patterns and additional is None:
+            return None
+        get_coercer = properties.get
+
+        # Errors are raised without a path and each container prepends its
+        # token on the way out, so valid documents never build paths.
+        if not patterns:
+            def coerce(value):
+                coerced = {}
+                for name, item in value.items():
+                    coercer = get_coercer(name, additional)
+                    if coercer is not None:
+                        try:
+                            item = coercer(item)
+                        except ValidationError as error:
+                            error.path.appendleft(name)
+                            raise
+                    coerced[name] = item
+                return coerced
+            return coerce
+
+        def coerce(value):
+            coerced = {}
+            for name, item in value.items():
+                coercer = get_coercer(name, None)
+                others = []
+                for search, pattern_coercer, validator in patterns:
+                    if search(name):
+                        if coercer is None:
+                            coercer = pattern_coercer
+                        else:
+                            others.append(validator)
+                if coercer is None:
+                    coercer = additional
+                try:
+                    if coercer is not None:
+                        item = coercer(item)
+                    for validator in others:
+                        if not validator.is_valid(item):
+                            raise validator.first_error(item)
+                except ValidationError as error:
+                    error.path.appendleft(name)
+                    raise
+                coerced[name] = item
+            return coerced
+        return coerce
+
+    def compile_array(self, schema):
+        items = schema.items
+        if isinstance(items, Schema):
+            coercer = self.compile(items)
+
+            def coerce(value):
+                try:
+                    return [coercer(item) for item in value]
+                except ValidationError:
+                    pass
+                raise_item_error(coercer, value)
+            return coerce
+        if not isinstance(items, list):
+            return None
+        coercers = [self.compile(item) for item in items]
+        additional = schema.additional_items
+        if isinstance(additional, Schema):
+            coercers.append(self.compile(additional))
+            rest = coercers[-1]
+        else:
+            coercers.append(lambda item: item)
+            rest = None
+        count = len(items)
+
+        def coerce(value):
+            coerced = []
+            for index, item in enumerate(value):
+                coercer = coercers[min(index, count)]
+                try:
+                    coerced.append(coercer(item))
+                except ValidationError as error:
+                    error.path.appendleft(index)
+                    raise
+            return coerced
+        if not count and rest is None:
+            return None
+        return coerce
+
+    def coerce(self, document):
+        return self._coerce(document)
+
+
+def schema_coercer(schema):
+    return publish_once(schema, '_coercer', lambda: Coercer(schema))
+
+
+def coerce(schema, document):
+    return schema_coercer(schema).coerce(document)
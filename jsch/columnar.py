@@ -0,0 +1,363 @@
+import decimal
+
+from jsch.backends import get_json_backend
+from jsch.keywords import CUSTOM_KEYS
+from jsch.schema import (
+    KEYWORD_KEYS,
+    ADDITIONAL_PROPERTIES_KEY,
+    ALL_OF_KEY,
+    ANY_OF_KEY,
+    DEFAULT_KEY,
+    DEFINITIONS_KEY,
+    DESCRIPTION_KEY,
+    ID_KEY,
+    NOT_KEY,
+    ONE_OF_KEY,
+    PROPERTIES_KEY,
+    REF_KEY,
+    REQUIRED_KEY,
+    SCHEMA_KEY,
+    TITLE_KEY,
+    TYPE_KEY
+)
+from jsch.validator import (
+    TYPE_CHECKS,
+    ValidationError,
+    compile_schema,
+    is_multiple_of
+)
+
+
+# Keywords that can reject a number but need the general validator. Every
+# other keyword either is handled here or never applies to numbers.
+UNSUPPORTED_COLUMN_KEYS = frozenset([
+    ALL_OF_KEY, ANY_OF_KEY, NOT_KEY, ONE_OF_KEY, REF_KEY
+])
+
+# Object keywords a structured layout can enforce record by record.
+STRUCTURED_OBJECT_KEYS = frozenset([
+    ADDITIONAL_PROPERTIES_KEY, DEFAULT_KEY, DEFINITIONS_KEY, DESCRIPTION_KEY,
+    ID_KEY, PROPERTIES_KEY, REQUIRED_KEY, SCHEMA_KEY, TITLE_KEY, TYPE_KEY
+])
+
+STRUCTURED_FIELD_TYPES = {
+    'boolean': ('?', False),
+    'integer': ('<i8', 0),
+    'number': ('<f8', 0.0),
+    'string': ('<U{0}', '')
+}
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+INITIAL_CAPACITY = 1024
+
+NEAR_INTEGER_TOLERANCE = 1e-9
+FLOAT_INTEGER_LIMIT = 2.0 ** 53
+MAX_DECIMAL_PLACES = 15
+
+# Imported on first use rather than with jsch, as importing numpy takes
+# longer than importing the rest of the package.
+numpy = None
+
+
+def import_numpy():
+    # Returns numpy, or None when it is not installed.
+    global numpy
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            pass
+    return numpy
+
+
+def require_numpy(name):
+    if import_numpy() is None:
+        raise ImportError("'{0}' requires numpy to be installed".format(name))
+
+
+def decimal_parts(multiple_of):
+    # Splits a decimal multiple_of into places and numerator, e.g. 0.25 into
+    # (2, 25), when both fit the exact range of a float.
+    value = decimal.Decimal(repr(multiple_of))
+    places = max(-value.as_tuple().exponent, 0)
+    numerator = int(value.scaleb(places))
+    if places > MAX_DECIMAL_PLACES or numerator >= FLOAT_INTEGER_LIMIT:
+        return None
+    return places, numerator
+
+
+class ColumnValidator(object):
+    def __init__(self, schema):
+        require_numpy('ColumnValidator')
+        for keyword in schema._dict:
+            key = KEYWORD_KEYS[keyword]
+            if key in UNSUPPORTED_COLUMN_KEYS or key in CUSTOM_KEYS:
+                raise ValueError(
+                    "'{0}' is not supported for column validation".format(key)
+                )
+        self.schema = schema
+        type_value = schema.type
+        types = [type_value] if isinstance(type_value, str) else type_value
+        self.accepts_numbers = types is None or 'number' in types
+        self.accepts_integers = self.accepts_numbers or 'integer' in types
+        self.accepts_booleans = types is None or 'boolean' in types
+        self.enum = None if schema.enum is None else [
+            value for value in schema.enum
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+        self.boolean_enum = None if schema.enum is None else [
+            value for value in schema.enum if isinstance(value, bool)
+        ]
+
+    def mask(self, values):
+        values = numpy.asarray(values)
+        kind = values.dtype.kind
+        if kind == 'b':
+            # Booleans are not JSON numbers, so only the type and enum can
+            # reject them.
+            mask = numpy.full(values.shape, self.accepts_booleans)
+            if self.boolean_enum is not None:
+                mask &= numpy.isin(values, self.boolean_enum)
+            return mask
+        if kind not in 'iuf':
+            raise ValueError("'values' must be a numeric array")
+        schema = self.schema
+        mask = numpy.ones(values.shape, dtype=bool)
+        if kind == 'f':
+            mask &= numpy.isfinite(values)
+            if not self.accepts_numbers:
+                mask &= values == numpy.floor(values)
+        if not self.accepts_integers:
+            mask[...] = False
+            return mask
+        if schema.minimum is not None:
+            if schema.exclusive_minimum:
+                mask &= values > schema.minimum
+            else:
+                mask &= values >= schema.minimum
+        if schema.maximum is not None:
+            if schema.exclusive_maximum:
+                mask &= values < schema.maximum
+            else:
+                mask &= values <= schema.maximum
+        if schema.multiple_of is not None:
+            mask &= self.multiple_of_mask(values, schema.multiple_of)
+        if self.enum is not None:
+            mask &= numpy.isin(values, self.enum)
+        return mask
+
+    def multiple_of_mask(self, values, multiple_of):
+        if values.dtype.kind in 'iu' and isinstance(multiple_of, int):
+            return values % multiple_of == 0
+        with numpy.errstate(all='ignore'):
+            quotients = values / multiple_of
+            nearest = numpy.rint(quotients)
+            mask = numpy.isfinite(quotients) & (quotients == nearest)
+            # A quotient that misses an integer by rounding error alone may
+            # still be an exact decimal multiple, so those few values are
+            # rechecked the same way as the general validator does it.
+            close = ~mask & numpy.isfinite(quotients) & (
+                numpy.abs(quotients - nearest) <=
+                NEAR_INTEGER_TOLERANCE * numpy.maximum(1, numpy.abs(nearest))
+            )
+        parts = decimal_parts(multiple_of)
+        if parts is not None:
+            places, numerator = parts
+            scale = 10.0 ** places
+            exact = close & (numpy.abs(values) < FLOAT_INTEGER_LIMIT / scale)
+            with numpy.errstate(all='ignore'):
+                scaled = numpy.rint(values * scale)
+                mask |= exact & (scaled / scale == values) & \
+                    (numpy.fmod(scaled, numerator) == 0)
+            close &= ~exact
+        for index in numpy.flatnonzero(close):
+            value = values.flat[index].item()
+            mask.flat[index] = is_multiple_of(value, multiple_of)
+        return mask
+
+    def invalid_indices(self, values):
+        return numpy.flatnonzero(~self.mask(values))
+
+    def is_valid(self, values):
+        return bool(self.mask(values).all())
+
+
+def column_mask(schema, values):
+    return ColumnValidator(schema).mask(values)
+
+
+def invalid_indices(schema, values):
+    return ColumnValidator(schema).invalid_indices(values)
+
+
+def field_type(name, schema):
+    type_value = schema.type
+    if not isinstance(type_value, str) or \
+            type_value not in STRUCTURED_FIELD_TYPES:
+        raise ValueError(
+            "property '{0}' must have 'type' 'boolean', 'integer', 'number' "
+            "or 'string'".format(name)
+        )
+    if type_value == 'string' and schema.max_length is None:
+        raise ValueError(
+            "property '{0}' must have a 'max_length'".format(name)
+        )
+    return type_value
+
+
+def structured_dtype(schema):
+    require_numpy('structured_dtype')
+    for keyword in schema._dict:
+        key = KEYWORD_KEYS[keyword]
+        if key not in STRUCTURED_OBJECT_KEYS:
+            raise ValueError(
+                "'{0}' is not supported for structured layouts".format(key)
+            )
+    if schema.type != 'object' or not schema.properties:
+        raise ValueError(
+            "'schema' must be an object schema with 'properties'"
+        )
+    fields = []
+    for name, property_schema in schema.properties.items():
+        type_value = field_type(name, property_schema)
+        dtype = STRUCTURED_FIELD_TYPES[type_value][0]
+        fields.append((name, dtype.format(property_schema.max_length)))
+    return numpy.dtype(fields)
+
+
+class StructuredField(object):
+    def __init__(self, name, schema, required):
+        self.name = name
+        self.schema = schema
+        self.required = required
+        self.type = field_type(name, schema)
+        self.check = TYPE_CHECKS[self.type]
+        self.validator = compile_schema(schema)
+        self.column_validator = None if self.type == 'string' \
+            else ColumnValidator(schema)
+        default = schema.default
+        self.default = default if default is not None and \
+            self.validator.is_valid(default) \
+            else STRUCTURED_FIELD_TYPES[self.type][1]
+
+
+class StructuredLoader(object):
+    def __init__(self, schema):
+        self.schema = schema
+        self.dtype = structured_dtype(schema)
+        required = frozenset(schema.required or ())
+        self.fields = [
+            StructuredField(name, property_schema, name in required)
+            for name, property_schema in schema.properties.items()
+        ]
+        self.names = frozenset(schema.properties)
+        self.extra_required = [
+            name for name in schema.required or () if name not in self.names
+        ]
+        self.additional_properties = schema.additional_properties
+
+    def load(self, source, count=None):
+        loads = get_json_backend().loads
+        array = numpy.empty(
+            INITIAL_CAPACITY if count is None else count, dtype=self.dtype
+        )
+        present = numpy.empty((len(self.fields), len(array)), dtype=bool)
+        index = 0
+        checked = 0
+        for line in source:
+            if not line.strip():
+                continue
+            if index == len(array):
+                self.check_columns(array, present, checked, index)
+                checked = index
+                array = grow(array)
+                present = grow(present, axis=1)
+            try:
+                array[index] = self.row(loads(line), index, present)
+            except ValidationError:
+                self.check_columns(array, present, checked, index)
+                raise
+            index += 1
+        self.check_columns(array, present, checked, index)
+        return array[:index]
+
+    def row(self, record, index, present):
+        if not isinstance(record, dict):
+            raise ValidationError(
+                "must be of type 'object'", path=[index]
+            )
+        for name in self.extra_required:
+            if name not in record:
+                raise ValidationError(
+                    "must have property '{0}'", path=[index], params=(name,)
+                )
+        if self.additional_properties is False:
+            for name in record:
+                if name not in self.names:
+                    raise ValidationError(
+                        "must not have additional property '{0}'",
+                        path=[index],
+                        params=(name,)
+                    )
+        values = []
+        for position, field in enumerate(self.fields):
+            value = record.get(field.name, None)
+            if value is None and field.name not in record:
+                if field.required:
+                    raise ValidationError(
+                        "must have property '{0}'",
+                        path=[index],
+                        params=(field.name,)
+                    )
+                present[position, index] = False
+                values.append(field.default)
+                continue
+            present[position, index] = True
+            if field.type == 'string':
+                if not field.validator.is_valid(value):
+                    self.raise_field_error(field, value, index)
+            elif not field.check(value):
+                self.raise_field_error(field, value, index)
+            elif field.type == 'integer' and \
+                    not INT64_MIN <= value <= INT64_MAX:
+                raise ValidationError(
+                    'must fit in a 64-bit integer',
+                    path=[index, field.name]
+                )
+            values.append(value)
+        return tuple(values)
+
+    def raise_field_error(self, field, value, index):
+        error = field.validator.first_error(value)
+        error.path.extendleft([field.name, index])
+        raise error
+
+    def check_columns(self, array, present, start, stop):
+        first = None
+        for position, field in enumerate(self.fields):
+            if field.column_validator is None:
+                continue
+            column = array[field.name][start:stop]
+            invalid = ~field.column_validator.mask(column)
+            invalid &= present[position, start:stop]
+            indices = numpy.flatnonzero(invalid)
+            if len(indices) and (first is None or indices[0] < first[0]):
+                first = (int(indices[0]), field)
+        if first is not None:
+            offset, field = first
+            index = start + offset
+            value = array[field.name][index].item()
+            self.raise_field_error(field, value, index)
+
+
+def grow(array, axis=0):
+    shape = list(array.shape)
+    shape[axis] = max(shape[axis] * 2, INITIAL_CAPACITY)
+    grown = numpy.empty(shape, dtype=array.dtype)
+    grown[tuple(slice(0, size) for size in array.shape)] = array
+    return grown
+
+
+def load_ndjson(schema, source, count=None):
+    return StructuredLoader(schema).load(source, count)
@@ -0,0 +1,159 @@
+from jsch.schema import KEYWORDS, Schema, publish_once, DEFAULT_KEY
+from jsch.validator import resolve_pointer
+
+
+DEFAULT = KEYWORDS[DEFAULT_KEY]
+
+
+def copy_json(value):
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+def is_mutable(value):
+    return isinstance(value, (dict, list))
+
+
+class DefaultsTemplate(object):
+    def __init__(self, schema):
+        self.root = schema
+        self._fillers = {}
+        self._with_defaults = self.find_defaults(schema)
+        self.fill = self.compile(schema)
+
+    def children(self, schema):
+        if schema.ref is not None:
+            return [resolve_pointer(self.root, schema.ref)]
+        children = list((schema.properties or {}).values())
+        items = schema.items
+        if isinstance(items, Schema):
+            children.append(items)
+        elif isinstance(items, list):
+            children.extend(items)
+        children.extend(schema.all_of or ())
+        return children
+
+    def find_defaults(self, schema):
+        # Collects every node reachable through properties, items, all_of and
+        # ref, then marks the nodes with a default somewhere beneath them by
+        # propagating from the property defaults up to a fixed point.
+        nodes = {}
+        parents = {}
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if id(node) in nodes:
+                continue
+            nodes[id(node)] = node
+            for child in self.children(node):
+                parents.setdefault(id(child), []).append(node)
+                stack.append(child)
+        marked = set()
+        stack = [
+            node for node in nodes.values()
+            if any(
+                DEFAULT in property_schema._dict
+                for property_schema in (node.properties or {}).values()
+            )
+        ]
+        while stack:
+            node = stack.pop()
+            if id(node) in marked:
+                continue
+            marked.add(id(node))
+            stack.extend(parents.get(id(node), ()))
+        return marked
+
+    def compile(self, schema):
+        if id(schema) not in self._with_defaults:
+            return None
+        filler = self._fillers.get(id(schema), None)
+        if filler is None:
+            compiled = []
+            self._fillers[id(schema)] = \
+                lambda instance: compiled[0](instance)
+            compiled.append(self._compile(schema))
+            filler = self._fillers[id(schema)] = compiled[0]
+        return filler
+
+    def _compile(self, schema):
+        if schema.ref is not None:
+            return self.compile(resolve_pointer(self.root, schema.ref))
+        fillers = []
+        properties = [
+            (
+                name,
+                DEFAULT in property_schema._dict,
+                property_schema.default,
+                is_mutable(property_schema.default),
+                self.compile(property_schema)
+            )
+            for name, property_schema in (schema.properties or {}).items()
+        ]
+        properties = [entry for entry in properties if entry[1] or entry[4]]
+        if properties:
+            fillers.append(self.compile_properties(properties))
+        items = schema.items
+        if isinstance(items, Schema) and self.compile(items) is not None:
+            fillers.append(self.compile_items(self.compile(items)))
+        elif isinstance(items, list):
+            item_fillers = [self.compile(item) for item in items]
+            if any(item_fillers):
+                fillers.append(self.compile_tuple_items(item_fillers))
+        fillers.extend(
+            filler for filler in map(self.compile, schema.all_of or ())
+            if filler is not None
+        )
+        if len(fillers) == 1:
+            return fillers[0]
+
+        def fill(instance):
+            for filler in fillers:
+                filler(instance)
+        return fill
+
+    def compile_properties(self, properties):
+        def fill(instance):
+            if isinstance(instance, dict):
+                for name, has_default, default, mutable, filler in properties:
+                    if name not in instance:
+                        if not has_default:
+                            continue
+                        instance[name] = copy_json(default) if mutable \
+                            else default
+                    if filler is not None:
+                        filler(instance[name])
+        return fill
+
+    def compile_items(self, filler):
+        def fill(instance):
+            if isinstance(instance, list):
+                for item in instance:
+                    filler(item)
+        return fill
+
+    def compile_tuple_items(self, fillers):
+        def fill(instance):
+            if isinstance(instance, list):
+                for filler, item in zip(fillers, instance):
+                    if filler is not None:
+                        filler(item)
+        return fill
+
+    def apply(self, document):
+        if self.fill is not None:
+            self.fill(document)
+        return document
+
+
+def defaults_template(schema):
+    return publish_once(
+        schema, '_defaults_template', lambda: DefaultsTemplate(schema)
+    )
+
+
+def apply_defaults(schema, document):
+    return defaults_template(schema).apply(document)
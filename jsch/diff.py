@@ -0,0 +1,386 @@
+from jsch.canonical import (
+    canonical_keyword_value,
+    dumps_canonical,
+    fingerprint
+)
+from jsch.optimize import VACUOUS_VALUES
+from jsch.schema import (
+    KEYWORD_KEYS,
+    Schema,
+    ADDITIONAL_ITEMS_KEY,
+    ADDITIONAL_PROPERTIES_KEY,
+    ALL_OF_KEY,
+    ANY_OF_KEY,
+    DEFAULT_KEY,
+    DEFINITIONS_KEY,
+    DEPENDENCIES_KEY,
+    DESCRIPTION_KEY,
+    ENUM_KEY,
+    EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY,
+    FORMAT_KEY,
+    ID_KEY,
+    ITEMS_KEY,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAX_PROPERTIES_KEY,
+    MAXIMUM_KEY,
+    MIN_ITEMS_KEY,
+    MIN_LENGTH_KEY,
+    MIN_PROPERTIES_KEY,
+    MINIMUM_KEY,
+    MULTIPLE_OF_KEY,
+    NOT_KEY,
+    ONE_OF_KEY,
+    PATTERN_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    REF_KEY,
+    REQUIRED_KEY,
+    SCHEMA_KEY,
+    TITLE_KEY,
+    TYPE_KEY,
+    UNIQUE_ITEMS_KEY
+)
+from jsch.validator import format_pointer, is_multiple_of
+
+
+# Compatibility of a change: LOOSER changes accept every document the old
+# schema accepted (backward compatible), TIGHTER changes only accept
+# documents the old schema accepted (forward compatible).
+ANNOTATION = (True, True)
+LOOSER = (True, False)
+TIGHTER = (False, True)
+INCOMPATIBLE = (False, False)
+
+NORMAL = 0
+INVERTED = 1
+OPAQUE = 2
+
+VACUOUS_DEFAULTS = dict(VACUOUS_VALUES)
+
+
+class SchemaChange(object):
+    def __init__(self, path, key, old, new, backward_compatible,
+                 forward_compatible):
+        self.path = path
+        self.key = key
+        self.old = old
+        self.new = new
+        self.backward_compatible = backward_compatible
+        self.forward_compatible = forward_compatible
+
+    @property
+    def pointer(self):
+        return format_pointer(self.path)
+
+    def __repr__(self):
+        return (
+            "SchemaChange(pointer='{0}', key='{1}', "
+            "backward_compatible={2}, forward_compatible={3})".format(
+                self.pointer, self.key, self.backward_compatible,
+                self.forward_compatible
+            )
+        )
+
+
+class Differ(object):
+    def __init__(self):
+        self.changes = []
+
+    def record(self, path, key, old, new, compatibility, mode):
+        if mode == INVERTED:
+            compatibility = (compatibility[1], compatibility[0])
+        elif mode == OPAQUE and not compatibility == ANNOTATION:
+            compatibility = INCOMPATIBLE
+        self.changes.append(SchemaChange(path, key, old, new, *compatibility))
+
+    def diff(self, old, new, path, mode):
+        if old is new or fingerprint(old) == fingerprint(new):
+            return
+        keywords = sorted(set(old._dict) | set(new._dict))
+        for keyword in keywords:
+            key = KEYWORD_KEYS[keyword]
+            old_value = effective_value(key, old._dict.get(keyword, None))
+            new_value = effective_value(key, new._dict.get(keyword, None))
+            if canonical_keyword_value(key, old_value, fingerprint) == \
+                    canonical_keyword_value(key, new_value, fingerprint):
+                continue
+            # Nothing is known of how custom keywords constrain documents.
+            diff_function = DIFF_FUNCTIONS.get(key, diff_incompatible)
+            diff_function(
+                self, key, old_value, new_value, path + [keyword], mode
+            )
+
+    def diff_optional(self, key, old, new, path, mode, added, removed):
+        if old is None:
+            self.record(path, key, old, new, added, mode)
+        elif new is None:
+            self.record(path, key, old, new, removed, mode)
+        else:
+            self.diff(old, new, path, mode)
+
+    def diff_bool_or_schema(self, key, old, new, path, mode):
+        old = True if old is None else old
+        new = True if new is None else new
+        if isinstance(old, Schema) and isinstance(new, Schema):
+            self.diff(old, new, path, mode)
+        elif old is True or new is False:
+            self.record(path, key, old, new, TIGHTER, mode)
+        else:
+            self.record(path, key, old, new, LOOSER, mode)
+
+    def diff_schema_list(self, key, old, new, path, mode, added, removed):
+        old = old or []
+        new = new or []
+        for index in range(max(len(old), len(new))):
+            item_path = path + [index]
+            if index >= len(old):
+                self.record(item_path, key, None, new[index], added, mode)
+            elif index >= len(new):
+                self.record(item_path, key, old[index], None, removed, mode)
+            else:
+                self.diff(old[index], new[index], item_path, mode)
+
+    def diff_schema_dict(self, key, old, new, path, mode, added, removed):
+        old = old or {}
+        new = new or {}
+        for name in sorted(set(old) | set(new)):
+            self.diff_optional(
+                key, old.get(name, None), new.get(name, None),
+                path + [name], mode, added, removed
+            )
+
+
+def effective_value(key, value):
+    # Values that constrain nothing, such as exclusive_maximum=False, are
+    # compared as if the keyword were left out.
+    vacuous = VACUOUS_DEFAULTS.get(key, None)
+    if vacuous is not None and type(value) is type(vacuous) and \
+            value == vacuous:
+        return None
+    return value
+
+
+def diff_annotation(differ, key, old, new, path, mode):
+    differ.record(path, key, old, new, ANNOTATION, mode)
+
+
+def diff_incompatible(differ, key, old, new, path, mode):
+    differ.record(path, key, old, new, INCOMPATIBLE, mode)
+
+
+def diff_upper_bound(differ, key, old, new, path, mode):
+    if new is None or old is not None and new > old:
+        differ.record(path, key, old, new, LOOSER, mode)
+    else:
+        differ.record(path, key, old, new, TIGHTER, mode)
+
+
+def diff_lower_bound(differ, key, old, new, path, mode):
+    if new is None or old is not None and new < old:
+        differ.record(path, key, old, new, LOOSER, mode)
+    else:
+        differ.record(path, key, old, new, TIGHTER, mode)
+
+
+def diff_flag(differ, key, old, new, path, mode):
+    if new:
+        differ.record(path, key, old, new, TIGHTER, mode)
+    else:
+        differ.record(path, key, old, new, LOOSER, mode)
+
+
+def diff_pattern(differ, key, old, new, path, mode):
+    if old is None:
+        differ.record(path, key, old, new, TIGHTER, mode)
+    elif new is None:
+        differ.record(path, key, old, new, LOOSER, mode)
+    else:
+        differ.record(path, key, old, new, INCOMPATIBLE, mode)
+
+
+def diff_multiple_of(differ, key, old, new, path, mode):
+    if old is None or new is not None and is_multiple_of(new, old):
+        differ.record(path, key, old, new, TIGHTER, mode)
+    elif new is None or is_multiple_of(old, new):
+        differ.record(path, key, old, new, LOOSER, mode)
+    else:
+        differ.record(path, key, old, new, INCOMPATIBLE, mode)
+
+
+def compare_sets(old, new, subset, superset):
+    if new <= old:
+        return subset
+    if new >= old:
+        return superset
+    return INCOMPATIBLE
+
+
+def diff_required(differ, key, old, new, path, mode):
+    compatibility = compare_sets(
+        set(old or ()), set(new or ()), LOOSER, TIGHTER
+    )
+    differ.record(path, key, old, new, compatibility, mode)
+
+
+def diff_enum(differ, key, old, new, path, mode):
+    if old is None:
+        compatibility = TIGHTER
+    elif new is None:
+        compatibility = LOOSER
+    else:
+        compatibility = compare_sets(
+            set(canonical_enum_values(old)), set(canonical_enum_values(new)),
+            TIGHTER, LOOSER
+        )
+    differ.record(path, key, old, new, compatibility, mode)
+
+
+def diff_type(differ, key, old, new, path, mode):
+    if old is None:
+        compatibility = TIGHTER
+    elif new is None:
+        compatibility = LOOSER
+    else:
+        compatibility = compare_sets(
+            expand_types(old), expand_types(new), TIGHTER, LOOSER
+        )
+    differ.record(path, key, old, new, compatibility, mode)
+
+
+def diff_additional(differ, key, old, new, path, mode):
+    differ.diff_bool_or_schema(key, old, new, path, mode)
+
+
+def diff_items(differ, key, old, new, path, mode):
+    if isinstance(old, list) and isinstance(new, list):
+        differ.diff_schema_list(key, old, new, path, mode, TIGHTER, LOOSER)
+    elif old is None or new is None or \
+            isinstance(old, Schema) and isinstance(new, Schema):
+        differ.diff_optional(key, old, new, path, mode, TIGHTER, LOOSER)
+    else:
+        differ.record(path, key, old, new, INCOMPATIBLE, mode)
+
+
+def invert(mode):
+    return INVERTED if mode == NORMAL else NORMAL if mode == INVERTED else mode
+
+
+def diff_not(differ, key, old, new, path, mode):
+    if old is None or new is None:
+        differ.record(
+            path, key, old, new, TIGHTER if old is None else LOOSER, mode
+        )
+    else:
+        differ.diff(old, new, path, invert(mode))
+
+
+def diff_all_of(differ, key, old, new, path, mode):
+    differ.diff_schema_list(key, old, new, path, mode, TIGHTER, LOOSER)
+
+
+def diff_any_of(differ, key, old, new, path, mode):
+    if old is None or new is None:
+        differ.record(
+            path, key, old, new, TIGHTER if old is None else LOOSER, mode
+        )
+    else:
+        differ.diff_schema_list(key, old, new, path, mode, LOOSER, TIGHTER)
+
+
+def diff_one_of(differ, key, old, new, path, mode):
+    differ.diff_schema_list(
+        key, old, new, path, OPAQUE, INCOMPATIBLE, INCOMPATIBLE
+    )
+
+
+def diff_schema_dict(differ, key, old, new, path, mode):
+    differ.diff_schema_dict(key, old, new, path, mode, TIGHTER, LOOSER)
+
+
+def diff_definitions(differ, key, old, new, path, mode):
+    differ.diff_schema_dict(key, old, new, path, mode, ANNOTATION, ANNOTATION)
+
+
+def diff_dependencies(differ, key, old, new, path, mode):
+    old = old or {}
+    new = new or {}
+    for name in sorted(set(old) | set(new)):
+        old_value = old.get(name, None)
+        new_value = new.get(name, None)
+        item_path = path + [name]
+        if isinstance(old_value, Schema) and isinstance(new_value, Schema):
+            differ.diff(old_value, new_value, item_path, mode)
+        elif old_value is None:
+            differ.record(item_path, key, old_value, new_value, TIGHTER, mode)
+        elif new_value is None:
+            differ.record(item_path, key, old_value, new_value, LOOSER, mode)
+        elif isinstance(old_value, list) and isinstance(new_value, list):
+            if not set(old_value) == set(new_value):
+                compatibility = compare_sets(
+                    set(old_value), set(new_value), LOOSER, TIGHTER
+                )
+                differ.record(
+                    item_path, key, old_value, new_value, compatibility, mode
+                )
+        else:
+            differ.record(
+                item_path, key, old_value, new_value, INCOMPATIBLE, mode
+            )
+
+
+def canonical_enum_values(enum):
+    return [dumps_canonical(value) for value in
+            canonical_keyword_value(ENUM_KEY, enum, None)]
+
+
+def expand_types(type_value):
+    types = set([type_value] if isinstance(type_value, str) else type_value)
+    if 'number' in types:
+        types.add('integer')
+    return types
+
+
+DIFF_FUNCTIONS = {
+    ADDITIONAL_ITEMS_KEY: diff_additional,
+    ADDITIONAL_PROPERTIES_KEY: diff_additional,
+    ALL_OF_KEY: diff_all_of,
+    ANY_OF_KEY: diff_any_of,
+    DEFAULT_KEY: diff_annotation,
+    DEFINITIONS_KEY: diff_definitions,
+    DEPENDENCIES_KEY: diff_dependencies,
+    DESCRIPTION_KEY: diff_annotation,
+    ENUM_KEY: diff_enum,
+    EXCLUSIVE_MAXIMUM_KEY: diff_flag,
+    EXCLUSIVE_MINIMUM_KEY: diff_flag,
+    FORMAT_KEY: diff_pattern,
+    ID_KEY: diff_annotation,
+    ITEMS_KEY: diff_items,
+    MAX_ITEMS_KEY: diff_upper_bound,
+    MAX_LENGTH_KEY: diff_upper_bound,
+    MAX_PROPERTIES_KEY: diff_upper_bound,
+    MAXIMUM_KEY: diff_upper_bound,
+    MIN_ITEMS_KEY: diff_lower_bound,
+    MIN_LENGTH_KEY: diff_lower_bound,
+    MIN_PROPERTIES_KEY: diff_lower_bound,
+    MINIMUM_KEY: diff_lower_bound,
+    MULTIPLE_OF_KEY: diff_multiple_of,
+    NOT_KEY: diff_not,
+    ONE_OF_KEY: diff_one_of,
+    PATTERN_KEY: diff_pattern,
+    PATTERN_PROPERTIES_KEY: diff_schema_dict,
+    PROPERTIES_KEY: diff_schema_dict,
+    REF_KEY: diff_incompatible,
+    REQUIRED_KEY: diff_required,
+    SCHEMA_KEY: diff_annotation,
+    TITLE_KEY: diff_annotation,
+    TYPE_KEY: diff_type,
+    UNIQUE_ITEMS_KEY: diff_flag
+}
+
+
+def diff(old, new):
+    differ = Differ()
+    differ.diff(old, new, [], NORMAL)
+    return differ.changes
@@ -0,0 +1,134 @@
+import re
+
+
+# Checkers take a str and return whether it is in the format. Values of
+# other types are never passed to them, as formats only apply to strings.
+# Each is looked up once, when a schema using it is compiled, so formats
+# must be registered before compiling the schemas that use them.
+FORMAT_CHECKERS = {}
+
+# Field ranges are checked by the expressions themselves, so that only
+# the days past the 28th need checking against their month.
+DATE_PATTERN = r'[0-9]{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12][0-9]|3[01])'
+# A second of 60 allows for leap seconds.
+TIME_PATTERN = (
+    r'(?:[01][0-9]|2[0-3]):[0-5][0-9]:(?:[0-5][0-9]|60)(?:\.[0-9]+)?'
+    r'(?:[Zz]|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])'
+)
+DATE = re.compile(DATE_PATTERN, re.ASCII)
+TIME = re.compile(TIME_PATTERN, re.ASCII)
+DATE_TIME = re.compile(
+    '{0}[Tt ]{1}'.format(DATE_PATTERN, TIME_PATTERN), re.ASCII
+)
+EMAIL = re.compile(r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~.-]+@(.+)", re.ASCII)
+HOSTNAME_LABEL = r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+HOSTNAME = re.compile(
+    r'{0}(?:\.{0})*\.?'.format(HOSTNAME_LABEL), re.ASCII
+)
+IPV4 = re.compile(
+    r'(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}'
+    r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])',
+    re.ASCII
+)
+IPV6_GROUP = re.compile(r'[0-9A-Fa-f]{1,4}', re.ASCII)
+URI = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:[^\s<>"{}|\\^`]*', re.ASCII)
+UUID = re.compile(
+    r'[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-'
+    r'[0-9A-Fa-f]{12}',
+    re.ASCII
+)
+
+DAYS_IN_MONTH = {
+    '01': '31', '02': '29', '03': '31', '04': '30', '05': '31', '06': '30',
+    '07': '31', '08': '31', '09': '30', '10': '31', '11': '30', '12': '31'
+}
+
+
+def is_day_in_month(date):
+    # Takes a date already matched by DATE_PATTERN.
+    day = date[8:10]
+    if day <= '28':
+        return True
+    if day > DAYS_IN_MONTH[date[5:7]]:
+        return False
+    if day == '29' and date[5:7] == '02':
+        year = int(date[:4])
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return True
+
+
+def is_date(value):
+    return DATE.fullmatch(value) is not None and is_day_in_month(value)
+
+
+def is_time(value):
+    return TIME.fullmatch(value) is not None
+
+
+def is_date_time(value):
+    return DATE_TIME.fullmatch(value) is not None and is_day_in_month(value)
+
+
+def is_hostname(value):
+    return len(value) <= 253 and HOSTNAME.fullmatch(value) is not None
+
+
+def is_email(value):
+    match = EMAIL.fullmatch(value)
+    return match is not None and is_hostname(match.group(1))
+
+
+def is_ipv4(value):
+    return IPV4.fullmatch(value) is not None
+
+
+def is_ipv6(value):
+    # Split by hand rather than through ipaddress, which reports invalid
+    # addresses by raising.
+    head, separator, tail = value.partition('::')
+    if '::' in tail:
+        return False
+    groups = head.split(':') if head else []
+    if tail:
+        groups.extend(tail.split(':'))
+    count = len(groups)
+    if groups and '.' in groups[-1] and (tail or not separator):
+        # An IPv4 address in the last two groups.
+        if not is_ipv4(groups.pop()):
+            return False
+        count += 1
+    for group in groups:
+        if IPV6_GROUP.fullmatch(group) is None:
+            return False
+    return count < 8 if separator else count == 8
+
+
+def is_uri(value):
+    return URI.fullmatch(value) is not None
+
+
+def is_uuid(value):
+    return len(value) == 36 and UUID.fullmatch(value) is not None
+
+
+def register_format(name, checker):
+    if not isinstance(name, str):
+        raise TypeError("'name' must be a str")
+    if not callable(checker):
+        raise TypeError("'checker' must be callable")
+    FORMAT_CHECKERS[name] = checker
+
+
+def format_checker(name):
+    return FORMAT_CHECKERS.get(name, None)
+
+
+register_format('date', is_date)
+register_format('date-time', is_date_time)
+register_format('email', is_email)
+register_format('hostname', is_hostname)
+register_format('ipv4', is_ipv4)
+register_format('ipv6', is_ipv6)
+register_format('time', is_time)
+register_format('uri', is_uri)
+register_format('uuid', is_uuid)
@@ -0,0 +1,407 @@
+import copy
+import decimal
+import fractions
+import math
+import random
+
+from jsch.backends import get_json_backend
+from jsch.columnar import import_numpy
+from jsch.schema import (
+    Schema,
+    SchemaValidationError,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAXIMUM_KEY,
+    MULTIPLE_OF_KEY
+)
+from jsch.validator import resolve_pointer
+
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+# Ranges used when a schema leaves a bound open, and the depth beyond which
+# recursive schemas only produce their required properties and minimum items.
+DEFAULT_NUMBER_SPAN = 1000
+DEFAULT_LENGTH_SPAN = 16
+DEFAULT_ITEMS_SPAN = 4
+MAX_DEPTH = 8
+
+OPTIONAL_PROPERTY_PROBABILITY = 0.5
+DEFAULT_BATCH_SIZE = 1000
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class RandomSource(object):
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def integers(self, low, high, count):
+        randrange = self.random.randrange
+        high += 1
+        return [randrange(low, high) for _ in range(count)]
+
+    def uniforms(self, low, high, count):
+        uniform = self.random.uniform
+        return [uniform(low, high) for _ in range(count)]
+
+    def flags(self, probability, count):
+        rand = self.random.random
+        return [rand() < probability for _ in range(count)]
+
+    def strings(self, lengths):
+        # random.choices is newer than Python 3.5.
+        choice = self.random.choice
+        return [
+            ''.join(choice(ALPHABET) for _ in range(length))
+            for length in lengths
+        ]
+
+
+class NumpyRandomSource(RandomSource):
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.numpy = import_numpy()
+        self.generator = self.numpy.random.default_rng(seed)
+
+    def integers(self, low, high, count):
+        if low < INT64_MIN or high > INT64_MAX:
+            return super().integers(low, high, count)
+        return self.generator.integers(
+            low, high, size=count, endpoint=True
+        ).tolist()
+
+    def uniforms(self, low, high, count):
+        return self.generator.uniform(low, high, size=count).tolist()
+
+    def flags(self, probability, count):
+        return (self.generator.random(count) < probability).tolist()
+
+    def strings(self, lengths):
+        codes = self.generator.integers(
+            ord(ALPHABET[0]), ord(ALPHABET[-1]), size=sum(lengths),
+            endpoint=True, dtype=self.numpy.uint8
+        )
+        text = codes.tobytes().decode('ascii')
+        strings = []
+        offset = 0
+        for length in lengths:
+            strings.append(text[offset:offset + length])
+            offset += length
+        return strings
+
+
+def infer_type(schema):
+    if schema.properties is not None or schema.required is not None or \
+            schema.additional_properties is not None or \
+            schema.min_properties is not None or \
+            schema.max_properties is not None:
+        return 'object'
+    if schema.items is not None or schema.min_items is not None or \
+            schema.max_items is not None:
+        return 'array'
+    if schema.minimum is not None or schema.maximum is not None or \
+            schema.multiple_of is not None:
+        return 'number'
+    return 'string'
+
+
+def length_range(min_value, max_value, span):
+    low = 0 if min_value is None else min_value
+    high = low + span if max_value is None else max_value
+    return low, high
+
+
+def split(values, lengths):
+    chunks = []
+    offset = 0
+    for length in lengths:
+        chunks.append(values[offset:offset + length])
+        offset += length
+    return chunks
+
+
+def no_values(key):
+    return SchemaValidationError(key, 'must allow at least one value')
+
+
+class DocumentGenerator(object):
+    def __init__(self, schema, seed=None, use_numpy=False):
+        if use_numpy and import_numpy() is None:
+            raise ValueError("'use_numpy' requires numpy to be installed")
+        self.schema = schema
+        self.source = NumpyRandomSource(seed) if use_numpy \
+            else RandomSource(seed)
+        self._samplers = {}
+        self._sample = self.compile(schema)
+
+    def compile(self, schema):
+        sampler = self._samplers.get(id(schema), None)
+        if sampler is None:
+            compiled = []
+            self._samplers[id(schema)] = \
+                lambda count, depth: compiled[0](count, depth)
+            compiled.append(self._compile(schema))
+            sampler = self._samplers[id(schema)] = compiled[0]
+        return sampler
+
+    def _compile(self, schema):
+        if schema.ref is not None:
+            return self.compile(resolve_pointer(self.schema, schema.ref))
+        if schema.enum is not None:
+            return self.compile_enum(schema.enum)
+        type_value = schema.type
+        if type_value is None:
+            type_value = infer_type(schema)
+        if isinstance(type_value, str):
+            return TYPE_SAMPLERS[type_value](self, schema)
+        return self.compile_type_list(schema, type_value)
+
+    def compile_enum(self, enum):
+        enum = list(enum)
+        last = len(enum) - 1
+        integers = self.source.integers
+
+        def sample(count, depth):
+            return [
+                copy.deepcopy(enum[index])
+                if isinstance(enum[index], (list, dict)) else enum[index]
+                for index in integers(0, last, count)
+            ]
+        return sample
+
+    def compile_type_list(self, schema, types):
+        samplers = [
+            TYPE_SAMPLERS[type_str](self, schema) for type_str in types
+        ]
+        last = len(samplers) - 1
+        integers = self.source.integers
+
+        def sample(count, depth):
+            choices = integers(0, last, count)
+            values = [None] * count
+            for choice, sampler in enumerate(samplers):
+                rows = [row for row, c in enumerate(choices) if c == choice]
+                for row, value in zip(rows, sampler(len(rows), depth)):
+                    values[row] = value
+            return values
+        return sample
+
+    def compile_integer(self, schema):
+        low, high = self.numeric_range(schema, integer=True)
+        multiple_of = schema.multiple_of
+        integers = self.source.integers
+        if multiple_of is None:
+            return lambda count, depth: integers(low, high, count)
+        if isinstance(multiple_of, float):
+            # The integer multiples of p/q are the multiples of p.
+            multiple_of = fractions.Fraction(repr(multiple_of)).numerator
+        k_low = -(-low // multiple_of)
+        k_high = high // multiple_of
+        if k_low > k_high:
+            raise no_values(MULTIPLE_OF_KEY)
+        return lambda count, depth: [
+            k * multiple_of for k in integers(k_low, k_high, count)
+        ]
+
+    def compile_number(self, schema):
+        low, high = self.numeric_range(schema, integer=False)
+        multiple_of = schema.multiple_of
+        if multiple_of is not None:
+            # Multiples are built as k * numerator / 10 ** places, so that each
+            # is the float nearest an exact decimal multiple of multiple_of,
+            # which is what the validator checks against.
+            step = decimal.Decimal(repr(multiple_of))
+            places = max(-step.as_tuple().exponent, 0)
+            numerator = int(step.scaleb(places))
+            scale = 10 ** places
+
+            def multiple(k):
+                return k * numerator / scale
+
+            k_low = math.ceil(low / multiple_of)
+            k_high = math.floor(high / multiple_of)
+            while multiple(k_low) < low or \
+                    schema.exclusive_minimum and multiple(k_low) == low:
+                k_low += 1
+            while multiple(k_high) > high or \
+                    schema.exclusive_maximum and multiple(k_high) == high:
+                k_high -= 1
+            if k_low > k_high:
+                raise no_values(MULTIPLE_OF_KEY)
+            integers = self.source.integers
+            return lambda count, depth: [
+                k * numerator / scale for k in integers(k_low, k_high, count)
+            ]
+        uniforms = self.source.uniforms
+        exclusive = schema.exclusive_minimum or schema.exclusive_maximum
+        if exclusive and low == high:
+            raise no_values(MAXIMUM_KEY)
+        if not exclusive:
+            return lambda count, depth: uniforms(low, high, count)
+        middle = (low + high) / 2
+
+        def sample(count, depth):
+            return [
+                middle if value == low or value == high else value
+                for value in uniforms(low, high, count)
+            ]
+        return sample
+
+    def numeric_range(self, schema, integer):
+        low = schema.minimum
+        high = schema.maximum
+        if integer:
+            if low is not None:
+                ceiled = math.ceil(low)
+                low = ceiled + 1 \
+                    if schema.exclusive_minimum and ceiled == low else ceiled
+            if high is not None:
+                floored = math.floor(high)
+                high = floored - 1 \
+                    if schema.exclusive_maximum and floored == high \
+                    else floored
+        if low is None and high is None:
+            low, high = -DEFAULT_NUMBER_SPAN, DEFAULT_NUMBER_SPAN
+        elif low is None:
+            low = high - DEFAULT_NUMBER_SPAN
+        elif high is None:
+            high = low + DEFAULT_NUMBER_SPAN
+        if low > high:
+            raise no_values(MAXIMUM_KEY)
+        return low, high
+
+    def compile_string(self, schema):
+        low, high = length_range(
+            schema.min_length, schema.max_length, DEFAULT_LENGTH_SPAN
+        )
+        if low > high:
+            raise no_values(MAX_LENGTH_KEY)
+        integers = self.source.integers
+        strings = self.source.strings
+        return lambda count, depth: strings(integers(low, high, count))
+
+    def compile_boolean(self, schema):
+        flags = self.source.flags
+        return lambda count, depth: flags(0.5, count)
+
+    def compile_null(self, schema):
+        return lambda count, depth: [None] * count
+
+    def compile_array(self, schema):
+        items = schema.items
+        additional_items = schema.additional_items
+        low, high = length_range(
+            schema.min_items, schema.max_items, DEFAULT_ITEMS_SPAN
+        )
+        if isinstance(items, list) and additional_items is False:
+            high = min(high, len(items))
+        if low > high:
+            raise no_values(MAX_ITEMS_KEY)
+        integers = self.source.integers
+        if not isinstance(items, list):
+            item_sampler = self.compile(
+                Schema() if items is None else items
+            )
+
+            def sample(count, depth):
+                lengths = integers(
+                    low, high if depth < MAX_DEPTH else low, count
+                )
+                values = item_sampler(sum(lengths), depth + 1)
+                return split(values, lengths)
+            return sample
+
+        tuple_samplers = [self.compile(item) for item in items]
+        additional_sampler = self.compile(
+            additional_items if isinstance(additional_items, Schema)
+            else Schema()
+        )
+
+        def sample(count, depth):
+            lengths = integers(low, high if depth < MAX_DEPTH else low, count)
+            arrays = [[] for _ in range(count)]
+            for position, sampler in enumerate(tuple_samplers):
+                rows = [
+                    row for row, length in enumerate(lengths)
+                    if length > position
+                ]
+                for row, value in zip(rows, sampler(len(rows), depth + 1)):
+                    arrays[row].append(value)
+            extra = [
+                max(length - len(tuple_samplers), 0) for length in lengths
+            ]
+            values = additional_sampler(sum(extra), depth + 1)
+            for array, chunk in zip(arrays, split(values, extra)):
+                array.extend(chunk)
+            return arrays
+        return sample
+
+    def compile_object(self, schema):
+        properties = schema.properties or {}
+        required = schema.required or []
+        additional_properties = schema.additional_properties
+        fallback = additional_properties \
+            if isinstance(additional_properties, Schema) else Schema()
+        fields = [
+            (name, self.compile(property_schema), name in required)
+            for name, property_schema in properties.items()
+        ]
+        fields.extend(
+            (name, self.compile(fallback), True)
+            for name in required if name not in properties
+        )
+        flags = self.source.flags
+
+        def sample(count, depth):
+            objects = [{} for _ in range(count)]
+            for name, sampler, is_required in fields:
+                if is_required:
+                    rows = range(count)
+                elif depth >= MAX_DEPTH:
+                    continue
+                else:
+                    rows = [
+                        row for row, flag in enumerate(
+                            flags(OPTIONAL_PROPERTY_PROBABILITY, count)
+                        ) if flag
+                    ]
+                for row, value in zip(rows, sampler(len(rows), depth + 1)):
+                    objects[row][name] = value
+            return objects
+        return sample
+
+    def generate(self):
+        return self._sample(1, 0)[0]
+
+    def batch(self, count):
+        return self._sample(count, 0)
+
+    def iter_batches(self, count, batch_size=DEFAULT_BATCH_SIZE):
+        while count > 0:
+            size = min(count, batch_size)
+            yield self._sample(size, 0)
+            count -= size
+
+    def iter_ndjson(self, count, batch_size=DEFAULT_BATCH_SIZE):
+        dumps = get_json_backend().dumps
+        for documents in self.iter_batches(count, batch_size):
+            yield ''.join(
+                dumps(document) + '\n' for document in documents
+            )
+
+    def dump_ndjson(self, fp, count, batch_size=DEFAULT_BATCH_SIZE):
+        for chunk in self.iter_ndjson(count, batch_size):
+            fp.write(chunk)
+
+
+TYPE_SAMPLERS = {
+    'array': DocumentGenerator.compile_array,
+    'boolean': DocumentGenerator.compile_boolean,
+    'integer': DocumentGenerator.compile_integer,
+    'null': DocumentGenerator.compile_null,
+    'number': DocumentGenerator.compile_number,
+    'object': DocumentGenerator.compile_object,
+    'string': DocumentGenerator.compile_string
+}
@@ -0,0 +1,52 @@
+from jsch.schema import (
+    KEYWORD_KEYS,
+    KEYWORDS,
+    SCHEMA_VALIDATION_FUNCTIONS,
+    Schema,
+    validate_is_primitive
+)
+from jsch.validator import INSTANCE_VALIDATION_FUNCTIONS
+
+
+# Keys of the keywords added with register_keyword.
+CUSTOM_KEYS = set()
+
+
+def register_keyword(key, keyword, validate=None, compile=None):
+    # Adds a keyword to the tables that built-in keywords are dispatched
+    # through, so it is only ever looked at in schemas that use it.
+    # validate(kwargs) checks its value when a schema is created, and by
+    # default only allows primitive types, while compile(schema, compiler)
+    # returns a (test, explain) pair for the validator, or None to skip it.
+    # Keywords should be registered before any schema is compiled, and
+    # their values must not be schemas.
+    if not isinstance(key, str):
+        raise TypeError("'key' must be a str")
+    if not key.isidentifier():
+        raise ValueError("'key' must be an identifier")
+    if not isinstance(keyword, str):
+        raise TypeError("'keyword' must be a str")
+    if key in KEYWORDS or hasattr(Schema, key):
+        raise ValueError("'key' must not already be in use")
+    if keyword in KEYWORD_KEYS:
+        raise ValueError("'keyword' must not already be in use")
+    if validate is None:
+        validate = lambda kwargs: validate_is_primitive(key, kwargs)
+    KEYWORDS[key] = keyword
+    KEYWORD_KEYS[keyword] = key
+    SCHEMA_VALIDATION_FUNCTIONS[key] = validate
+    if compile is not None:
+        INSTANCE_VALIDATION_FUNCTIONS[key] = compile
+    CUSTOM_KEYS.add(key)
+
+
+def unregister_keyword(key):
+    # Undoes register_keyword. Validators already compiled from schemas
+    # that use the keyword keep checking it.
+    if key not in CUSTOM_KEYS:
+        raise ValueError("'key' must be a registered keyword")
+    keyword = KEYWORDS.pop(key)
+    del KEYWORD_KEYS[keyword]
+    del SCHEMA_VALIDATION_FUNCTIONS[key]
+    INSTANCE_VALIDATION_FUNCTIONS.pop(key, None)
+    CUSTOM_KEYS.discard(key)
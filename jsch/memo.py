@@ -0,0 +1,155 @@
+import collections
+
+from jsch.schema import KEYWORDS, REF_KEY
+from jsch.validator import Compiler
+
+
+POLICIES = ['lru', 'fifo']
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_SIZE = 256
+
+# Each schema is memoized on trial: once it has been looked up this many
+# times, it stops being memoized unless at least this share were hits,
+# since a miss costs a key on top of the validation it fails to save.
+TRIAL_LOOKUPS = 256
+MIN_HIT_RATE = 0.25
+
+
+def fits_repr(instance, size):
+    # Whether the repr of a document could be at most size characters long,
+    # counting a character per value, so that the walk stops after about
+    # size values however large the document is. Only arrays and objects
+    # are visited, as a long string or number is rejected quickly enough
+    # once its repr is found to be too long.
+    stack = [instance]
+    while stack:
+        value = stack.pop()
+        size -= len(value) + 2
+        if size < 0:
+            return False
+        for item in value.values() if isinstance(value, dict) else value:
+            if isinstance(item, (dict, list)):
+                stack.append(item)
+    return True
+
+
+class ValidationMemo(object):
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_size=DEFAULT_MAX_SIZE, policy='lru'):
+        if policy not in POLICIES:
+            raise ValueError(
+                "'policy' must be one of {0}".format(
+                    ', '.join("'{0}'".format(name) for name in POLICIES)
+                )
+            )
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1")
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.policy = policy
+        self._results = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, schema, instance):
+        # Documents are keyed on their repr, which for the plain values that
+        # JSON decodes to tells apart every pair of documents the validator
+        # could tell apart, and is much cheaper than a canonical encoding.
+        # Anything longer than max_size characters is validated as usual.
+        if not fits_repr(instance, self.max_size):
+            return None
+        text = repr(instance)
+        if len(text) > self.max_size:
+            return None
+        return id(schema), text
+
+    def get(self, key, schema):
+        # Entries keep their schema, so that a schema collected while the
+        # memo lives on can never match a new schema reusing its id.
+        entry = self._results.get(key, None)
+        if entry is None or entry[0] is not schema:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == 'lru':
+            try:
+                self._results.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since it was read.
+                pass
+        return entry[1]
+
+    def put(self, key, schema, result):
+        self._results[key] = (schema, result)
+        if len(self._results) > self.max_entries:
+            try:
+                self._results.popitem(last=False)
+            except KeyError:
+                return
+            self.evictions += 1
+
+    def clear(self):
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class MemoCompiler(Compiler):
+    def __init__(self, root, memo):
+        super().__init__(root)
+        self.memo = memo
+
+    def compile(self, schema):
+        if id(schema) in self._validators:
+            return self._validators[id(schema)]
+        validator = super().compile(schema)
+        if validator._tests and KEYWORDS[REF_KEY] not in schema._dict:
+            validator._tests = (self.memoize(schema, validator._tests),)
+        return validator
+
+    def memoize(self, schema, tests):
+        memo = self.memo
+        # Lookups and hits while on trial, or None once no longer memoized.
+        trial = [0, 0]
+
+        def test(instance):
+            key = None
+            if trial[0] is not None and isinstance(instance, (dict, list)):
+                key = memo.key(schema, instance)
+            if key is not None:
+                result = memo.get(key, schema)
+                if trial[0] < TRIAL_LOOKUPS:
+                    trial[0] += 1
+                    trial[1] += result is not None
+                elif trial[1] < MIN_HIT_RATE * TRIAL_LOOKUPS:
+                    trial[0] = None
+                if result is not None:
+                    return result
+            result = True
+            for check in tests:
+                if not check(instance):
+                    result = False
+                    break
+            if key is not None:
+                memo.put(key, schema, result)
+            return result
+        return test
+
+
+def compile_memoized(schema, memo=None):
+    if memo is None:
+        memo = ValidationMemo()
+    validator = MemoCompiler(schema, memo).compile(schema)
+    validator.memo = memo
+    return validator
@@ -0,0 +1,303 @@
+from jsch.canonical import fingerprint
+from jsch.schema import (
+    KEYWORD_KEYS,
+    KEYWORDS,
+    Schema,
+    map_subschemas,
+    unescape_pointer_token,
+    ADDITIONAL_ITEMS_KEY,
+    ADDITIONAL_PROPERTIES_KEY,
+    ALL_OF_KEY,
+    ANY_OF_KEY,
+    DEFINITIONS_KEY,
+    DEPENDENCIES_KEY,
+    ENUM_KEY,
+    EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY,
+    FORMAT_KEY,
+    ITEMS_KEY,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAX_PROPERTIES_KEY,
+    MAXIMUM_KEY,
+    MIN_ITEMS_KEY,
+    MIN_LENGTH_KEY,
+    MIN_PROPERTIES_KEY,
+    MINIMUM_KEY,
+    MULTIPLE_OF_KEY,
+    NOT_KEY,
+    ONE_OF_KEY,
+    PATTERN_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    REF_KEY,
+    REQUIRED_KEY,
+    TYPE_KEY,
+    UNIQUE_ITEMS_KEY
+)
+
+
+UPPER_BOUND_KEYS = [MAX_ITEMS_KEY, MAX_LENGTH_KEY, MAX_PROPERTIES_KEY]
+LOWER_BOUND_KEYS = [MIN_ITEMS_KEY, MIN_LENGTH_KEY, MIN_PROPERTIES_KEY]
+
+# Keywords whose constraint does not depend on any other keyword in the same
+# schema, so an 'all_of' member holding them can be folded into its parent.
+MERGEABLE_KEYS = frozenset(
+    UPPER_BOUND_KEYS + LOWER_BOUND_KEYS + [
+        ANY_OF_KEY, DEPENDENCIES_KEY, ENUM_KEY, EXCLUSIVE_MAXIMUM_KEY,
+        EXCLUSIVE_MINIMUM_KEY, FORMAT_KEY, MAXIMUM_KEY, MINIMUM_KEY,
+        MULTIPLE_OF_KEY, NOT_KEY, ONE_OF_KEY, PATTERN_KEY, REQUIRED_KEY,
+        TYPE_KEY, UNIQUE_ITEMS_KEY
+    ]
+)
+
+VACUOUS_VALUES = [
+    (ADDITIONAL_ITEMS_KEY, True),
+    (ADDITIONAL_PROPERTIES_KEY, True),
+    (EXCLUSIVE_MAXIMUM_KEY, False),
+    (EXCLUSIVE_MINIMUM_KEY, False),
+    (MIN_ITEMS_KEY, 0),
+    (MIN_LENGTH_KEY, 0),
+    (MIN_PROPERTIES_KEY, 0),
+    (UNIQUE_ITEMS_KEY, False)
+]
+
+
+class OptimizationReport(object):
+    def __init__(self, nodes_before, keywords_before, nodes_after,
+                 keywords_after):
+        self.nodes_before = nodes_before
+        self.keywords_before = keywords_before
+        self.nodes_after = nodes_after
+        self.keywords_after = keywords_after
+
+    @property
+    def nodes_eliminated(self):
+        return self.nodes_before - self.nodes_after
+
+    @property
+    def keywords_eliminated(self):
+        return self.keywords_before - self.keywords_after
+
+
+def count_tree(schema):
+    nodes = 0
+    keywords = 0
+    seen = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes += 1
+        keywords += len(node._dict)
+        for keyword, value in node._dict.items():
+            map_subschemas(KEYWORD_KEYS[keyword], value, stack.append)
+    return nodes, keywords
+
+
+def pin_path(root, pointer, pinned):
+    node = root
+    for token in pointer[2:].split('/'):
+        token = unescape_pointer_token(token)
+        if isinstance(node, Schema):
+            if token != KEYWORDS[DEFINITIONS_KEY]:
+                pinned.add(id(node))
+            node = node._dict.get(token, None)
+        elif isinstance(node, list):
+            try:
+                node = node[int(token)]
+            except (IndexError, ValueError):
+                return
+        elif isinstance(node, dict):
+            node = node.get(token, None)
+        else:
+            return
+
+
+def pinned_nodes(schema):
+    # Ids of the nodes that local $ref pointers pass through by any keyword
+    # other than 'definitions', which is never changed. These nodes keep
+    # their keywords, so the pointers still resolve after optimizing.
+    pinned = set()
+    seen = set()
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node.ref, str) and node.ref.startswith('#/'):
+            pin_path(schema, node.ref, pinned)
+        for keyword, value in node._dict.items():
+            map_subschemas(KEYWORD_KEYS[keyword], value, stack.append)
+    return pinned
+
+
+def is_empty(schema):
+    return isinstance(schema, Schema) and not schema._dict
+
+
+def schema_kwargs(schema):
+    return {
+        KEYWORD_KEYS[keyword]: value
+        for keyword, value in schema._dict.items()
+    }
+
+
+def dedupe(schemas):
+    seen = set()
+    unique = []
+    for schema in schemas:
+        digest = fingerprint(schema)
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(schema)
+    return unique
+
+
+def merge_bound(kwargs, key, exclusive_key, value, exclusive, is_tighter):
+    current = kwargs.get(key, None)
+    current_exclusive = bool(kwargs.get(exclusive_key, False))
+    if current is None or is_tighter(value, current):
+        kwargs[key] = value
+        kwargs[exclusive_key] = exclusive
+    elif value == current:
+        kwargs[exclusive_key] = exclusive or current_exclusive
+
+
+def can_merge(kwargs, member):
+    for key, value in member.items():
+        if key not in MERGEABLE_KEYS:
+            return False
+        if key in (ANY_OF_KEY, DEPENDENCIES_KEY, ENUM_KEY, FORMAT_KEY,
+                   MULTIPLE_OF_KEY, NOT_KEY, ONE_OF_KEY, PATTERN_KEY,
+                   TYPE_KEY):
+            if key in kwargs and not kwargs[key] == value:
+                return False
+    return True
+
+
+def merge(kwargs, member):
+    for key, value in member.items():
+        if key == MAXIMUM_KEY:
+            merge_bound(
+                kwargs, MAXIMUM_KEY, EXCLUSIVE_MAXIMUM_KEY, value,
+                bool(member.get(EXCLUSIVE_MAXIMUM_KEY, False)),
+                lambda a, b: a < b
+            )
+        elif key == MINIMUM_KEY:
+            merge_bound(
+                kwargs, MINIMUM_KEY, EXCLUSIVE_MINIMUM_KEY, value,
+                bool(member.get(EXCLUSIVE_MINIMUM_KEY, False)),
+                lambda a, b: a > b
+            )
+        elif key in UPPER_BOUND_KEYS:
+            kwargs[key] = min(value, kwargs.get(key, value))
+        elif key in LOWER_BOUND_KEYS:
+            kwargs[key] = max(value, kwargs.get(key, value))
+        elif key == REQUIRED_KEY:
+            required = list(kwargs.get(key, []))
+            required.extend(name for name in value if name not in required)
+            kwargs[key] = required
+        elif key == UNIQUE_ITEMS_KEY:
+            kwargs[key] = value or kwargs.get(key, False)
+        elif key not in (EXCLUSIVE_MAXIMUM_KEY, EXCLUSIVE_MINIMUM_KEY):
+            kwargs[key] = value
+
+
+def simplify_combinators(kwargs):
+    all_of = list(kwargs.pop(ALL_OF_KEY, []))
+    any_of = kwargs.pop(ANY_OF_KEY, None)
+    if any_of is not None:
+        any_of = dedupe(any_of)
+        if len(any_of) == 1:
+            all_of.extend(any_of)
+        elif not any(is_empty(member) for member in any_of):
+            kwargs[ANY_OF_KEY] = any_of
+    one_of = kwargs.pop(ONE_OF_KEY, None)
+    if one_of is not None:
+        if len(one_of) == 1:
+            all_of.extend(one_of)
+        else:
+            kwargs[ONE_OF_KEY] = one_of
+    flattened = []
+    while all_of:
+        member = all_of.pop(0)
+        if list(member._dict) == [KEYWORDS[ALL_OF_KEY]]:
+            all_of[0:0] = member.all_of
+        elif not is_empty(member):
+            flattened.append(member)
+    remaining = []
+    for member in dedupe(flattened):
+        member_kwargs = schema_kwargs(member)
+        if REF_KEY not in kwargs and can_merge(kwargs, member_kwargs):
+            merge(kwargs, member_kwargs)
+        else:
+            remaining.append(member)
+    if remaining:
+        kwargs[ALL_OF_KEY] = remaining
+
+
+def drop_vacuous(kwargs):
+    for key, value in VACUOUS_VALUES:
+        current = kwargs.get(key, None)
+        if type(current) is type(value) and current == value:
+            del kwargs[key]
+    if not isinstance(kwargs.get(ITEMS_KEY, None), list):
+        kwargs.pop(ADDITIONAL_ITEMS_KEY, None)
+    if is_empty(kwargs.get(ITEMS_KEY, None)):
+        del kwargs[ITEMS_KEY]
+    if kwargs.get(ADDITIONAL_PROPERTIES_KEY, True) is True:
+        for key in (PROPERTIES_KEY, PATTERN_PROPERTIES_KEY):
+            if key in kwargs:
+                kwargs[key] = {
+                    name: value for name, value in kwargs[key].items()
+                    if not is_empty(value)
+                }
+                if not kwargs[key]:
+                    del kwargs[key]
+    if DEPENDENCIES_KEY in kwargs:
+        kwargs[DEPENDENCIES_KEY] = {
+            name: value for name, value in kwargs[DEPENDENCIES_KEY].items()
+            if not is_empty(value)
+        }
+        if not kwargs[DEPENDENCIES_KEY]:
+            del kwargs[DEPENDENCIES_KEY]
+
+
+class Optimizer(object):
+    def __init__(self, pinned=frozenset()):
+        self._pinned = pinned
+        self._optimized = {}
+
+    def optimize(self, schema):
+        optimized = self._optimized.get(id(schema), None)
+        if optimized is None:
+            optimized = self._optimize(schema)
+            self._optimized[id(schema)] = optimized
+        return optimized
+
+    def _optimize(self, schema):
+        kwargs = {
+            key: map_subschemas(key, value, self.optimize)
+            for key, value in schema_kwargs(schema).items()
+        }
+        if REF_KEY in kwargs or id(schema) in self._pinned:
+            return Schema(**kwargs)
+        simplify_combinators(kwargs)
+        drop_vacuous(kwargs)
+        if list(kwargs) == [ALL_OF_KEY] and len(kwargs[ALL_OF_KEY]) == 1:
+            return kwargs[ALL_OF_KEY][0]
+        return Schema(**kwargs)
+
+
+def optimize(schema):
+    nodes_before, keywords_before = count_tree(schema)
+    optimized = Optimizer(pinned_nodes(schema)).optimize(schema)
+    nodes_after, keywords_after = count_tree(optimized)
+    report = OptimizationReport(
+        nodes_before, keywords_before, nodes_after, keywords_after
+    )
+    return optimized, report
@@ -0,0 +1,143 @@
+import collections
+import time
+
+from jsch.schema import walk
+from jsch.validator import Compiler
+
+
+SORT_KEYS = ['calls', 'time', 'self_time']
+
+
+class ProfileStats(object):
+    __slots__ = ('calls', 'time', 'self_time')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.self_time = 0.0
+
+    def __repr__(self):
+        return 'ProfileStats(calls={0}, time={1:.6f}, self_time={2:.6f})' \
+            .format(self.calls, self.time, self.self_time)
+
+
+def schema_pointers(schema):
+    # Breadth first, so a schema used in several places is reported by its
+    # shortest pointer, and the first in keyword order among equals.
+    pointers = {}
+    for pointer, node in walk(
+            schema, prune=lambda pointer, node: id(node) in pointers,
+            breadth_first=True):
+        pointers[id(node)] = pointer
+    return pointers
+
+
+class ProfilingCompiler(Compiler):
+    def __init__(self, root, profiler):
+        super().__init__(root)
+        self.profiler = profiler
+        self._pointers = schema_pointers(root)
+        self._instrumented = set()
+
+    def compile_homogeneous(self, schema):
+        # Item schemas are always run item by item, so that their keywords
+        # are timed.
+        return None
+
+    def compile_keyword(self, key, schema):
+        check = super().compile_keyword(key, schema)
+        if check is None:
+            return None
+        test, explain = check
+        pointer = self._pointers.get(id(schema), None)
+        first = id(schema) not in self._instrumented
+        self._instrumented.add(id(schema))
+        test = self.profiler._instrument(test, key, pointer, first)
+        return test, explain
+
+
+class ValidationProfiler(object):
+    def __init__(self, schema):
+        self.schema = schema
+        self.keywords = collections.defaultdict(ProfileStats)
+        self.nodes = collections.defaultdict(ProfileStats)
+        self._child_times = []
+        self.validator = ProfilingCompiler(schema, self).compile(schema)
+
+    def _instrument(self, test, key, pointer, first):
+        keyword_stats = self.keywords[key]
+        node_stats = self.nodes[pointer]
+        child_times = self._child_times
+        clock = time.perf_counter
+
+        def profiled_test(instance):
+            child_times.append(0.0)
+            start = clock()
+            try:
+                return test(instance)
+            finally:
+                elapsed = clock() - start
+                self_time = elapsed - child_times.pop()
+                if child_times:
+                    child_times[-1] += elapsed
+                keyword_stats.calls += 1
+                keyword_stats.time += elapsed
+                keyword_stats.self_time += self_time
+                if first:
+                    node_stats.calls += 1
+                node_stats.time += elapsed
+                node_stats.self_time += self_time
+        return profiled_test
+
+    def is_valid(self, instance):
+        return self.validator.is_valid(instance)
+
+    def validate(self, instance):
+        return self.validator.validate(instance)
+
+    def errors(self, instance):
+        return self.validator.errors(instance)
+
+    def reset(self):
+        for stats in self.keywords.values():
+            stats.__init__()
+        for stats in self.nodes.values():
+            stats.__init__()
+
+    def hottest(self, count=10, sort_key='self_time'):
+        if sort_key not in SORT_KEYS:
+            raise ValueError(
+                "'sort_key' must be one of {0}".format(
+                    ', '.join("'{0}'".format(key) for key in SORT_KEYS)
+                )
+            )
+        nodes = [
+            (pointer, stats) for pointer, stats in self.nodes.items()
+            if stats.calls
+        ]
+        nodes.sort(key=lambda node: getattr(node[1], sort_key), reverse=True)
+        return nodes[:count]
+
+    def report(self, count=10, sort_key='self_time'):
+        lines = ['{0:>10} {1:>12} {2:>12}  {3}'.format(
+            'calls', 'time', 'self time', 'schema'
+        )]
+        for pointer, stats in self.hottest(count, sort_key):
+            lines.append('{0:>10} {1:>12.6f} {2:>12.6f}  {3}'.format(
+                stats.calls, stats.time, stats.self_time, pointer
+            ))
+        lines.append('')
+        keywords = sorted(
+            self.keywords.items(),
+            key=lambda item: getattr(item[1], sort_key),
+            reverse=True
+        )
+        lines.append('{0:>10} {1:>12} {2:>12}  {3}'.format(
+            'calls', 'time', 'self time', 'keyword'
+        ))
+        for key, stats in keywords:
+            if stats.calls:
+                lines.append('{0:>10} {1:>12.6f} {2:>12.6f}  {3}'.format(
+                    stats.calls, stats.time, stats.self_time, key
+                ))
+        return '\n'.join(lines)
@@ -1,6 +1,12 @@
+import collections
 import json
 import uuid
 
+from jsch.backends import encode_default, get_json_backend
+
+
+DUMP_CHUNK_SIZE = 65536
+
 
 ADDITIONAL_ITEMS_KEY = 'additional_items'
 ADDITIONAL_PROPERTIES_KEY = 'additional_properties'
@@ -13,6 +19,7 @@ DESCRIPTION_KEY = 'description'
 ENUM_KEY = 'enum'
 EXCLUSIVE_MAXIMUM_KEY = 'exclusive_maximum'
 EXCLUSIVE_MINIMUM_KEY = 'exclusive_minimum'
+FORMAT_KEY = 'format'
 ID_KEY = 'id'
 ITEMS_KEY = 'items'
 MAX_ITEMS_KEY = 'max_items'
@@ -49,6 +56,7 @@ KEYWORDS = {
     ENUM_KEY: 'enum',
     EXCLUSIVE_MAXIMUM_KEY: 'exclusiveMaximum',
     EXCLUSIVE_MINIMUM_KEY: 'exclusiveMinimum',
+    FORMAT_KEY: 'format',
     ID_KEY: 'id',
     ITEMS_KEY: 'items',
     MAX_ITEMS_KEY: 'maxItems',
@@ -74,6 +82,23 @@ KEYWORDS = {
 }
 
 
+KEYWORD_KEYS = {keyword: key for key, keyword in KEYWORDS.items()}
+
+
+SCHEMA_KEYS = [ADDITIONAL_ITEMS_KEY, ADDITIONAL_PROPERTIES_KEY, NOT_KEY]
+SCHEMA_LIST_KEYS = [ALL_OF_KEY, ANY_OF_KEY, ITEMS_KEY, ONE_OF_KEY]
+SCHEMA_DICT_KEYS = [
+    DEFINITIONS_KEY, DEPENDENCIES_KEY, PATTERN_PROPERTIES_KEY, PROPERTIES_KEY
+]
+
+# Keywords whose value is a schema or a list of schemas, and keywords whose
+# value is a dict of them.
+SUBSCHEMA_KEYWORDS = frozenset(
+    KEYWORDS[key] for key in SCHEMA_KEYS + SCHEMA_LIST_KEYS
+)
+SUBSCHEMA_DICT_KEYWORDS = frozenset(KEYWORDS[key] for key in SCHEMA_DICT_KEYS)
+
+
 SCHEMA_VALIDATION_FUNCTIONS = {
     ADDITIONAL_ITEMS_KEY:
         lambda kwargs:
@@ -91,6 +116,7 @@ SCHEMA_VALIDATION_FUNCTIONS = {
     ENUM_KEY: lambda kwargs: validate_enum(kwargs),
     EXCLUSIVE_MAXIMUM_KEY: lambda kwargs: validate_maximum(kwargs),
     EXCLUSIVE_MINIMUM_KEY: lambda kwargs: validate_minimum(kwargs),
+    FORMAT_KEY: lambda kwargs: validate_is_str(FORMAT_KEY, kwargs),
     ID_KEY: lambda kwargs: validate_is_str(ID_KEY, kwargs),
     ITEMS_KEY: lambda kwargs: validate_items(kwargs),
     MAX_ITEMS_KEY:
@@ -137,17 +163,137 @@ def is_primitive_type_str(type_str):
 
 def is_primitive_type(type):
     types = (list, bool, int, float, dict, str)
-    if type is not None and not isinstance(type, types):
+    stack = [type]
+    while stack:
+        value = stack.pop()
+        if value is not None and not isinstance(value, types):
+            return False
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+    return True
+
+
+def map_subschemas(key, value, function, schema_type=None):
+    schema_type = Schema if schema_type is None else schema_type
+    if key in SCHEMA_KEYS or key == ITEMS_KEY:
+        if isinstance(value, schema_type):
+            return function(value)
+    if key in SCHEMA_LIST_KEYS and isinstance(value, list):
+        return [
+            function(item) if isinstance(item, schema_type) else item
+            for item in value
+        ]
+    if key in SCHEMA_DICT_KEYS and isinstance(value, dict):
+        return {
+            k: function(v) if isinstance(v, schema_type) else v
+            for k, v in value.items()
+        }
+    return value
+
+
+def unescape_pointer_token(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def escape_pointer_token(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def format_pointer(path):
+    return '#' + ''.join('/' + escape_pointer_token(token) for token in path)
+
+
+def walk(schema, prune=None, breadth_first=False):
+    # Yields (pointer, schema) for the schema and every sub-schema beneath
+    # it, depth first (or breadth first) and in keyword order, using an
+    # explicit queue so that any depth can be walked. A node for which
+    # prune(pointer, schema) is true is skipped, along with everything
+    # beneath it. References are not followed.
+    stack = collections.deque([('#', schema)])
+    pop = stack.popleft if breadth_first else stack.pop
+    while stack:
+        pointer, node = pop()
+        if prune is not None and prune(pointer, node):
+            continue
+        yield pointer, node
+        children = []
+        for keyword, value in node._dict.items():
+            if keyword in SUBSCHEMA_KEYWORDS:
+                if isinstance(value, Schema):
+                    children.append((pointer + '/' + keyword, value))
+                elif isinstance(value, list):
+                    children.extend(
+                        ('{0}/{1}/{2}'.format(pointer, keyword, index), item)
+                        for index, item in enumerate(value)
+                        if isinstance(item, Schema)
+                    )
+            elif keyword in SUBSCHEMA_DICT_KEYWORDS and \
+                    isinstance(value, dict):
+                children.extend(
+                    ('{0}/{1}/{2}'.format(
+                        pointer, keyword, escape_pointer_token(name)
+                    ), item)
+                    for name, item in value.items()
+                    if isinstance(item, Schema)
+                )
+        if not breadth_first:
+            children.reverse()
+        stack.extend(children)
+
+
+class SchemaIndex(object):
+    def __init__(self, schema):
+        self.schemas = {}
+        self.pointers = {}
+        for pointer, node in walk(schema):
+            self.schemas[pointer] = node
+            self.pointers.setdefault(id(node), []).append(pointer)
+
+
+def schema_index(schema):
+    return publish_once(schema, '_index', lambda: SchemaIndex(schema))
+
+
+def push_pair(stack, value, other):
+    if isinstance(value, Schema) and isinstance(other, Schema):
+        stack.append((value, other))
+        return True
+    if isinstance(value, Schema) or isinstance(other, Schema):
         return False
-    if isinstance(type, list):
-        for item in type:
-            if not is_primitive_type(item):
-                return False
-    if isinstance(type, dict):
-        for key, value in type.items():
-            if not is_primitive_type(key):
-                return False
-            if not is_primitive_type(value):
+    return value == other
+
+
+def push_pairs(stack, value, other):
+    if isinstance(value, list) and isinstance(other, list):
+        return len(value) == len(other) and all(
+            push_pair(stack, item, other_item)
+            for item, other_item in zip(value, other)
+        )
+    if isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and all(
+            push_pair(stack, item, other[name])
+            for name, item in value.items()
+        )
+    return push_pair(stack, value, other)
+
+
+def schemas_equal(schema, other):
+    stack = [(schema, other)]
+    while stack:
+        schema, other = stack.pop()
+        schema_dict = schema._dict
+        other_dict = other._dict
+        if schema_dict.keys() != other_dict.keys():
+            return False
+        for keyword, value in schema_dict.items():
+            if keyword in SUBSCHEMA_KEYWORDS or \
+                    keyword in SUBSCHEMA_DICT_KEYWORDS:
+                if not push_pairs(stack, value, other_dict[keyword]):
+                    return False
+            elif not value == other_dict[keyword]:
                 return False
     return True
 
@@ -160,6 +306,16 @@ def are_items_unique(items):
     return True
 
 
+def publish_once(obj, name, factory):
+    # Caches on shared objects are published with a single atomic
+    # dict.setdefault, so threads racing to fill one may each build a value,
+    # but all of them return the same, fully built, published value.
+    value = obj.__dict__.get(name, None)
+    if value is None:
+        value = obj.__dict__.setdefault(name, factory())
+    return value
+
+
 class SchemaValidationError(Exception):
     def __init__(self, key, message):
         super().__init__("'{0}' {1}".format(key, message))
@@ -210,6 +366,12 @@ def validate_default(kwargs):
         raise SchemaValidationError(key, "must be a primitive type")
 
 
+def validate_is_primitive(key, kwargs):
+    value = kwargs.get(key, None)
+    if not is_primitive_type(value):
+        raise SchemaValidationError(key, "must be a primitive type")
+
+
 def validate_dependencies(kwargs):
     key = DEPENDENCIES_KEY
     value = kwargs.get(key, None)
@@ -389,12 +551,14 @@ def validate_unique_items(kwargs):
 
 class Schema(object):
     def __init__(self, **kwargs):
+        # Only the keywords given are validated, in the sorted order of
+        # KEYWORDS, so that keywords a schema does not use cost nothing.
         self._dict = {}
-        for key, keyword in KEYWORDS.items():
-            validate_keyword = SCHEMA_VALIDATION_FUNCTIONS[key]
-            validate_keyword(kwargs)
-            if key in kwargs:
-                self._dict[keyword] = kwargs[key]
+        for key in sorted(kwargs):
+            validate_keyword = SCHEMA_VALIDATION_FUNCTIONS.get(key, None)
+            if validate_keyword is not None:
+                validate_keyword(kwargs)
+                self._dict[KEYWORDS[key]] = kwargs[key]
 
     def __getattribute__(self, name):
         return (
@@ -408,7 +572,24 @@ class Schema(object):
         super().__setattr__(name, value)
 
     def __eq__(self, other):
-        return self._dict == other._dict
+        if not isinstance(other, Schema):
+            return NotImplemented
+        return schemas_equal(self, other)
+
+    def at(self, pointer):
+        index = self.__dict__.get('_index', None)
+        if index is None:
+            index = schema_index(self)
+        schemas = index.schemas
+        schema = schemas.get(pointer, None)
+        if schema is None:
+            schema = schemas.get('#' + pointer, None)
+            if schema is None:
+                raise KeyError(pointer)
+        return schema
+
+    def pointers_of(self, schema):
+        return list(schema_index(self).pointers.get(id(schema), ()))
 
     def asdict(self, root=False, schema=None):
         dict = self._dict.copy()
@@ -420,14 +601,46 @@ class Schema(object):
             )
         return dict
 
+    @classmethod
+    def fromdict(cls, schema_dict):
+        kwargs = {}
+        for keyword, value in schema_dict.items():
+            key = KEYWORD_KEYS.get(keyword, None)
+            if key is not None:
+                kwargs[key] = map_subschemas(
+                    key, value, Schema.fromdict, schema_type=dict
+                )
+        return cls(**kwargs)
+
+    @classmethod
+    def fromjson(cls, json_str):
+        return cls.fromdict(get_json_backend().loads(json_str))
+
     def asjson(self, pretty=False, root=False, schema=None):
-        return json.dumps(
-            self.asdict(root, schema),
-            cls=SchemaJsonEncoder,
+        return get_json_backend().dumps(self.asdict(root, schema), pretty)
+
+    def iterencode(self, pretty=False, root=False, schema=None):
+        encoder = json.JSONEncoder(
+            default=encode_default,
             sort_keys=True,
             indent=(4 if pretty else None),
             separators=((',', ': ') if pretty else (',', ':'))
         )
+        return encoder.iterencode(self.asdict(root, schema))
+
+    def dump(self, fp, pretty=False, root=False, schema=None,
+             chunk_size=DUMP_CHUNK_SIZE):
+        chunks = []
+        size = 0
+        for chunk in self.iterencode(pretty, root, schema):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                fp.write(''.join(chunks))
+                chunks = []
+                size = 0
+        if chunks:
+            fp.write(''.join(chunks))
 
 
 def uname():
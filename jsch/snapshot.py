@@ -0,0 +1,120 @@
+import collections.abc
+import marshal
+import mmap
+import struct
+
+from jsch.schema import KEYWORD_KEYS, Schema, map_subschemas, publish_once
+
+
+SNAPSHOT_MAGIC = b'JSCHSNAP'
+SNAPSHOT_VERSION = 1
+MARSHAL_VERSION = 4
+
+HEADER = struct.Struct('<8sIQ')
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def encode_schema(schema):
+    schema_dict = {}
+    for keyword, value in schema._dict.items():
+        key = KEYWORD_KEYS[keyword]
+        schema_dict[keyword] = map_subschemas(key, value, encode_schema)
+    return schema_dict
+
+
+class SnapshotSchema(Schema):
+    _materialized = None
+
+    def __init__(self, schema_dict):
+        self._raw = schema_dict
+
+    @property
+    def _dict(self):
+        # Every thread must see the same sub-schema objects, as compiled
+        # validators are keyed on their identity.
+        return publish_once(self, '_materialized', self.materialize)
+
+    def materialize(self):
+        materialized = {}
+        for keyword, value in self._raw.items():
+            key = KEYWORD_KEYS.get(keyword, None)
+            if key is not None:
+                materialized[keyword] = map_subschemas(
+                    key, value, SnapshotSchema, schema_type=dict
+                )
+        return materialized
+
+
+def dump_snapshot(schemas, fp):
+    blobs = []
+    index = {}
+    offset = 0
+    for name, schema in schemas.items():
+        if not isinstance(name, str):
+            raise SnapshotError("schema name must be a str")
+        blob = marshal.dumps(encode_schema(schema), MARSHAL_VERSION)
+        index[name] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    index_blob = marshal.dumps(index, MARSHAL_VERSION)
+    fp.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(index_blob)))
+    fp.write(index_blob)
+    for blob in blobs:
+        fp.write(blob)
+
+
+class Snapshot(collections.abc.Mapping):
+    def __init__(self, buffer):
+        if len(buffer) < HEADER.size:
+            raise SnapshotError("snapshot is truncated")
+        magic, version, index_length = HEADER.unpack_from(buffer, 0)
+        if not magic == SNAPSHOT_MAGIC:
+            raise SnapshotError("snapshot has an unrecognised format")
+        if not version == SNAPSHOT_VERSION:
+            raise SnapshotError(
+                "snapshot version {0} is not supported".format(version)
+            )
+        index_start = HEADER.size
+        self._buffer = buffer
+        self._data_start = index_start + index_length
+        self._index = marshal.loads(buffer[index_start:self._data_start])
+        self._schemas = {}
+
+    def __getitem__(self, name):
+        schema = self._schemas.get(name, None)
+        if schema is None:
+            offset, length = self._index[name]
+            start = self._data_start + offset
+            schema = self._schemas.setdefault(name, SnapshotSchema(
+                marshal.loads(self._buffer[start:start + length])
+            ))
+        return schema
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_snapshot(path):
+    with open(path, 'rb') as fp:
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    return Snapshot(buffer)
+
+
+def loads_snapshot(data):
+    return Snapshot(data)
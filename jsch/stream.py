@@ -0,0 +1,598 @@
+import codecs
+import json
+import re
+
+from jsch.schema import (
+    KEYWORD_KEYS,
+    Schema,
+    ADDITIONAL_ITEMS_KEY,
+    ADDITIONAL_PROPERTIES_KEY,
+    ALL_OF_KEY,
+    DEFAULT_KEY,
+    DEFINITIONS_KEY,
+    DESCRIPTION_KEY,
+    EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY,
+    FORMAT_KEY,
+    ID_KEY,
+    ITEMS_KEY,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAX_PROPERTIES_KEY,
+    MAXIMUM_KEY,
+    MIN_ITEMS_KEY,
+    MIN_LENGTH_KEY,
+    MIN_PROPERTIES_KEY,
+    MINIMUM_KEY,
+    MULTIPLE_OF_KEY,
+    PATTERN_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    REF_KEY,
+    REQUIRED_KEY,
+    SCHEMA_KEY,
+    TITLE_KEY,
+    TYPE_KEY
+)
+from jsch.validator import (
+    ValidationError,
+    compile_schema,
+    compile_type,
+    resolve_pointer
+)
+
+
+START_OBJECT = 'start_object'
+END_OBJECT = 'end_object'
+START_ARRAY = 'start_array'
+END_ARRAY = 'end_array'
+KEY = 'key'
+VALUE = 'value'
+
+EXPECT_VALUE = 0
+EXPECT_VALUE_OR_END = 1
+EXPECT_KEY = 2
+EXPECT_KEY_OR_END = 3
+EXPECT_COLON = 4
+EXPECT_COMMA_OR_END = 5
+EXPECT_NOTHING = 6
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?$')
+NUMBER_CHARS = re.compile(r'[-+0-9.eE]*')
+STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# A run of plain characters, or a single escape, inside a string.
+STRING_PIECE = re.compile(r'[^"\\]+|\\u[0-9A-Fa-f]{4}|\\[^u]', re.DOTALL)
+HIGH_SURROGATE = re.compile(r'\\u[Dd][89ABab]')
+LITERALS = {'t': ('true', True), 'f': ('false', False), 'n': ('null', None)}
+
+# Keywords that can be checked on an array or object as its tokens arrive.
+# Any other keyword on a container schema causes that container to be
+# materialised and validated in full once its closing token is read.
+STREAMING_KEYS = frozenset([
+    ADDITIONAL_ITEMS_KEY, ADDITIONAL_PROPERTIES_KEY, ALL_OF_KEY, ITEMS_KEY,
+    MAX_ITEMS_KEY, MAX_PROPERTIES_KEY, MIN_ITEMS_KEY, MIN_PROPERTIES_KEY,
+    PATTERN_PROPERTIES_KEY, PROPERTIES_KEY, REF_KEY, REQUIRED_KEY, TYPE_KEY,
+    DEFAULT_KEY, DEFINITIONS_KEY, DESCRIPTION_KEY, EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY, FORMAT_KEY, ID_KEY, MAX_LENGTH_KEY, MAXIMUM_KEY,
+    MIN_LENGTH_KEY, MINIMUM_KEY, MULTIPLE_OF_KEY, PATTERN_KEY, SCHEMA_KEY,
+    TITLE_KEY
+])
+
+
+class JsonStreamError(ValueError):
+    def __init__(self, message, offset):
+        self.offset = offset
+        super().__init__("{0} at offset {1}".format(message, offset))
+
+
+class JsonEventParser(object):
+    def __init__(self):
+        self._buffer = ''
+        self._offset = 0
+        self._stack = []
+        self._state = EXPECT_VALUE
+        # The text of a string still open at the end of a feed, kept in
+        # parts so that each is only scanned once, with any escape split
+        # at the end of the last part and the characters counted so far.
+        self._parts = None
+        self._tail = ''
+        self._length = 0
+
+    @property
+    def done(self):
+        return self._state == EXPECT_NOTHING
+
+    @property
+    def open_string_length(self):
+        # At most the length of a string value still open after the last
+        # feed, or None, so that string keywords can fail before it ends.
+        if self._parts is None or \
+                self._state in (EXPECT_KEY, EXPECT_KEY_OR_END):
+            return None
+        return self._length
+
+    def feed(self, text):
+        if self._parts is None:
+            return self._parse(self._buffer + text, final=False)
+        self._parts.append(text)
+        if not self._scan_open_string(text):
+            return []
+        buffer = ''.join(self._parts)
+        self._parts = None
+        return self._parse(buffer, final=False)
+
+    def close(self):
+        if self._parts is not None:
+            self._buffer = ''.join(self._parts)
+            self._parts = None
+        events = self._parse(self._buffer, final=True)
+        if not self._state == EXPECT_NOTHING:
+            raise JsonStreamError("unexpected end of input", self._offset)
+        return events
+
+    def _error(self, message, pos):
+        raise JsonStreamError(message, self._offset + pos)
+
+    def _parse(self, buffer, final):
+        events = []
+        stack = self._stack
+        state = self._state
+        length = len(buffer)
+        pos = 0
+        while True:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos == length:
+                break
+            char = buffer[pos]
+            if state == EXPECT_COMMA_OR_END:
+                if char == ',':
+                    state = EXPECT_KEY if stack[-1] == START_OBJECT \
+                        else EXPECT_VALUE
+                elif char == '}' and stack[-1] == START_OBJECT:
+                    stack.pop()
+                    events.append((END_OBJECT, None))
+                    state = EXPECT_COMMA_OR_END if stack else EXPECT_NOTHING
+                elif char == ']' and stack[-1] == START_ARRAY:
+                    stack.pop()
+                    events.append((END_ARRAY, None))
+                    state = EXPECT_COMMA_OR_END if stack else EXPECT_NOTHING
+                else:
+                    self._error("expected ',' or closing bracket", pos)
+                pos += 1
+                continue
+            if state == EXPECT_COLON:
+                if not char == ':':
+                    self._error("expected ':'", pos)
+                state = EXPECT_VALUE
+                pos += 1
+                continue
+            if state == EXPECT_NOTHING:
+                self._error("unexpected data after JSON value", pos)
+            if state == EXPECT_KEY_OR_END and char == '}':
+                stack.pop()
+                events.append((END_OBJECT, None))
+                state = EXPECT_COMMA_OR_END if stack else EXPECT_NOTHING
+                pos += 1
+                continue
+            if state == EXPECT_VALUE_OR_END and char == ']':
+                stack.pop()
+                events.append((END_ARRAY, None))
+                state = EXPECT_COMMA_OR_END if stack else EXPECT_NOTHING
+                pos += 1
+                continue
+            if state in (EXPECT_KEY, EXPECT_KEY_OR_END):
+                if not char == '"':
+                    self._error("expected property name", pos)
+                string, end = self._scan_string(buffer, pos, final)
+                if end is None:
+                    break
+                events.append((KEY, string))
+                state = EXPECT_COLON
+                pos = end
+                continue
+            if char == '{':
+                stack.append(START_OBJECT)
+                events.append((START_OBJECT, None))
+                state = EXPECT_KEY_OR_END
+                pos += 1
+                continue
+            if char == '[':
+                stack.append(START_ARRAY)
+                events.append((START_ARRAY, None))
+                state = EXPECT_VALUE_OR_END
+                pos += 1
+                continue
+            if char == '"':
+                value, end = self._scan_string(buffer, pos, final)
+            elif char == '-' or '0' <= char <= '9':
+                value, end = self._scan_number(buffer, pos, final)
+            elif char in LITERALS:
+                value, end = self._scan_literal(buffer, pos, final)
+            else:
+                self._error("expected value", pos)
+            if end is None:
+                break
+            events.append((VALUE, value))
+            state = EXPECT_COMMA_OR_END if stack else EXPECT_NOTHING
+            pos = end
+        self._state = state
+        self._buffer = buffer[pos:]
+        self._offset += pos
+        return events
+
+    def _scan_open_string(self, text):
+        # Counts the characters in the new text of an open string,
+        # returning whether it closes the string. An escape split across
+        # feeds is carried into the next one, and high surrogates are not
+        # counted, so the count never exceeds the decoded length.
+        text = self._tail + text
+        length = self._length
+        pos = 0
+        end = len(text)
+        while pos < end:
+            match = STRING_PIECE.match(text, pos)
+            if match is None:
+                if text[pos] == '"':
+                    return True
+                if end - pos < 6:
+                    break
+                # An invalid escape, reported once the string is parsed.
+                pos += 2
+                continue
+            piece = match.group()
+            if not piece[0] == '\\':
+                length += len(piece)
+            elif HIGH_SURROGATE.match(piece) is None:
+                length += 1
+            pos = match.end()
+        self._tail = text[pos:]
+        self._length = length
+        return False
+
+    def _scan_string(self, buffer, pos, final):
+        if STRING_END.match(buffer, pos + 1) is None:
+            if final:
+                self._error("unterminated string", pos)
+            # Later feeds only scan their own text for the end of the string.
+            self._parts = [buffer[pos:]]
+            self._tail = ''
+            self._length = 0
+            self._scan_open_string(buffer[pos + 1:])
+            return None, None
+        try:
+            return json.decoder.scanstring(buffer, pos + 1, True)
+        except json.JSONDecodeError as error:
+            self._error(error.msg.lower(), error.pos)
+
+    def _scan_number(self, buffer, pos, final):
+        end = NUMBER_CHARS.match(buffer, pos).end()
+        if end == len(buffer) and not final:
+            return None, None
+        text = buffer[pos:end]
+        if NUMBER.match(text) is None:
+            self._error("invalid number", pos)
+        if '.' in text or 'e' in text or 'E' in text:
+            return float(text), end
+        return int(text), end
+
+    def _scan_literal(self, buffer, pos, final):
+        literal, value = LITERALS[buffer[pos]]
+        if buffer.startswith(literal, pos):
+            return value, pos + len(literal)
+        if not final and literal.startswith(buffer[pos:]):
+            return None, None
+        self._error("invalid literal", pos)
+
+
+class StreamPlan(object):
+    def __init__(self, validator):
+        schema = validator.schema
+        compiler = validator.compiler
+        self.validator = validator
+        self.streaming = all(
+            KEYWORD_KEYS.get(keyword, None) in STREAMING_KEYS
+            for keyword in schema._dict
+        )
+        self.type = None if schema.type is None \
+            else compile_type(schema, compiler)
+        self.properties = {
+            name: compiler.compile(property_schema)
+            for name, property_schema in (schema.properties or {}).items()
+        }
+        self.pattern_properties = [
+            (re.compile(pattern).search, compiler.compile(property_schema))
+            for pattern, property_schema
+            in (schema.pattern_properties or {}).items()
+        ]
+        self.additional_properties = schema.additional_properties
+        if isinstance(self.additional_properties, Schema):
+            self.additional_properties = compiler.compile(
+                self.additional_properties
+            )
+        self.required = tuple(schema.required or ())
+        self.max_properties = schema.max_properties
+        self.min_properties = schema.min_properties
+        items = schema.items
+        if isinstance(items, Schema):
+            self.items = compiler.compile(items)
+        elif isinstance(items, list):
+            self.items = [compiler.compile(item) for item in items]
+        else:
+            self.items = None
+        self.additional_items = schema.additional_items
+        if isinstance(self.additional_items, Schema):
+            self.additional_items = compiler.compile(self.additional_items)
+        self.max_items = schema.max_items
+        self.min_items = schema.min_items
+
+    def property_validators(self, name, validators):
+        matched = False
+        validator = self.properties.get(name, None)
+        if validator is not None:
+            validators.append(validator)
+            matched = True
+        for search, validator in self.pattern_properties:
+            if search(name):
+                validators.append(validator)
+                matched = True
+        if matched or self.additional_properties in (None, True):
+            return True
+        if self.additional_properties is False:
+            return False
+        validators.append(self.additional_properties)
+        return True
+
+    def item_validators(self, index, validators):
+        items = self.items
+        if items is None:
+            return True
+        if not isinstance(items, list):
+            validators.append(items)
+            return True
+        if index < len(items):
+            validators.append(items[index])
+            return True
+        if self.additional_items in (None, True):
+            return True
+        if self.additional_items is False:
+            return False
+        validators.append(self.additional_items)
+        return True
+
+
+class Frame(object):
+    __slots__ = (
+        'is_object', 'token', 'plans', 'deferred', 'value', 'count', 'key',
+        'keys', 'children'
+    )
+
+    def __init__(self, is_object, token, plans, deferred, value):
+        self.is_object = is_object
+        self.token = token
+        self.plans = plans
+        self.deferred = deferred
+        self.value = value
+        self.count = 0
+        self.key = None
+        self.keys = set() if any(plan.required for plan in plans) else None
+        self.children = []
+
+
+class StreamValidator(object):
+    def __init__(self, schema, encoding='utf-8'):
+        self._validator = compile_schema(schema)
+        self._parser = JsonEventParser()
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._plans = {}
+        self._stack = []
+        # The smallest max_length that applies to an open string, found on
+        # its first part.
+        self._max_length = None
+
+    def feed(self, chunk):
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        for event, value in self._parser.feed(chunk):
+            self._handle(event, value)
+        length = self._parser.open_string_length
+        if length is not None:
+            self._check_length(length)
+
+    def close(self):
+        self._parser.feed(self._decoder.decode(b'', final=True))
+        for event, value in self._parser.close():
+            self._handle(event, value)
+
+    def _plan(self, validator):
+        plan = self._plans.get(id(validator), None)
+        if plan is None:
+            plan = StreamPlan(validator)
+            self._plans[id(validator)] = plan
+        return plan
+
+    def _expand(self, validators, plans, seen):
+        for validator in validators:
+            if id(validator) in seen:
+                continue
+            seen.add(id(validator))
+            schema = validator.schema
+            if schema.ref is not None:
+                target = validator.compiler.compile(
+                    resolve_pointer(validator.compiler.root, schema.ref)
+                )
+                self._expand([target], plans, seen)
+                continue
+            plans.append(self._plan(validator))
+            if schema.all_of is not None:
+                self._expand(
+                    [validator.compiler.compile(member)
+                     for member in schema.all_of],
+                    plans,
+                    seen
+                )
+        return plans
+
+    def _path(self, *tokens):
+        path = [frame.token for frame in self._stack[1:]]
+        path.extend(tokens)
+        return path
+
+    def _raise(self, error, *tokens):
+        error.path.extendleft(reversed(self._path(*tokens)))
+        raise error
+
+    def _handle(self, event, value):
+        stack = self._stack
+        if event == KEY:
+            self._start_property(stack[-1], value)
+            return
+        if event == END_OBJECT or event == END_ARRAY:
+            self._end()
+            return
+        if not stack:
+            token = None
+            validators = [self._validator]
+            parent = None
+        else:
+            parent = stack[-1]
+            if parent.is_object:
+                token = parent.key
+                validators = parent.children
+            else:
+                token = parent.count
+                validators = self._start_item(parent)
+        if event == VALUE:
+            self._max_length = None
+            for validator in validators:
+                error = validator.first_error(value)
+                if error is not None:
+                    self._raise(error, *([] if parent is None else [token]))
+            if parent is not None and parent.value is not None:
+                self._add(parent, value)
+            return
+        self._start(event == START_OBJECT, token, validators, parent)
+
+    def _check_length(self, length):
+        frame = self._stack[-1] if self._stack else None
+        if self._max_length is None:
+            if frame is None:
+                validators = [self._validator]
+            elif frame.is_object:
+                validators = frame.children
+            else:
+                validators = []
+                for plan in frame.plans:
+                    plan.item_validators(frame.count, validators)
+            self._max_length = min(
+                (plan.validator.schema.max_length
+                 for plan in self._expand(validators, [], set())
+                 if plan.validator.schema.max_length is not None),
+                default=float('inf')
+            )
+        if length > self._max_length:
+            self._raise(ValidationError(
+                "must be at most {0} characters long",
+                params=(self._max_length,)
+            ), *([] if frame is None else [
+                frame.key if frame.is_object else frame.count
+            ]))
+
+    def _start(self, is_object, token, validators, parent):
+        empty = {} if is_object else []
+        plans = []
+        deferred = []
+        for plan in self._expand(validators, [], set()):
+            if plan.type is not None:
+                test, explain = plan.type
+                if not test(empty):
+                    self._raise(
+                        next(explain(empty, None)),
+                        *([] if parent is None else [token])
+                    )
+            if plan.streaming:
+                plans.append(plan)
+            else:
+                deferred.append(plan.validator)
+        building = deferred or \
+            parent is not None and parent.value is not None
+        value = ({} if is_object else []) if building else None
+        self._stack.append(Frame(is_object, token, plans, deferred, value))
+
+    def _start_property(self, frame, name):
+        frame.key = name
+        frame.count += 1
+        if frame.keys is not None:
+            frame.keys.add(name)
+        children = []
+        for plan in frame.plans:
+            if plan.max_properties is not None and \
+                    frame.count > plan.max_properties:
+                self._raise(ValidationError(
+                    "must have at most {0} properties",
+                    params=(plan.max_properties,)
+                ))
+            if not plan.property_validators(name, children):
+                self._raise(ValidationError(
+                    "must not have additional property '{0}'", params=(name,)
+                ))
+        frame.children = children
+
+    def _start_item(self, frame):
+        index = frame.count
+        frame.count += 1
+        children = []
+        for plan in frame.plans:
+            if plan.max_items is not None and frame.count > plan.max_items:
+                self._raise(ValidationError(
+                    "must have at most {0} items", params=(plan.max_items,)
+                ))
+            if not plan.item_validators(index, children):
+                self._raise(ValidationError("must not have additional items"))
+        return children
+
+    def _end(self):
+        frame = self._stack[-1]
+        for plan in frame.plans:
+            if frame.is_object:
+                if plan.min_properties is not None and \
+                        frame.count < plan.min_properties:
+                    self._raise(ValidationError(
+                        "must have at least {0} properties",
+                        params=(plan.min_properties,)
+                    ))
+                for name in plan.required:
+                    if name not in frame.keys:
+                        self._raise(ValidationError(
+                            "must have property '{0}'", params=(name,)
+                        ))
+            elif plan.min_items is not None and frame.count < plan.min_items:
+                self._raise(ValidationError(
+                    "must have at least {0} items", params=(plan.min_items,)
+                ))
+        for validator in frame.deferred:
+            error = validator.first_error(frame.value)
+            if error is not None:
+                self._raise(error)
+        self._stack.pop()
+        if self._stack and self._stack[-1].value is not None:
+            self._add(self._stack[-1], frame.value)
+
+    def _add(self, parent, value):
+        if parent.is_object:
+            parent.value[parent.key] = value
+        else:
+            parent.value.append(value)
+
+
+def validate_stream(schema, source, chunk_size=65536):
+    validator = StreamValidator(schema)
+    if hasattr(source, 'read'):
+        chunk = source.read(chunk_size)
+        while chunk:
+            validator.feed(chunk)
+            chunk = source.read(chunk_size)
+    else:
+        for chunk in source:
+            validator.feed(chunk)
+    validator.close()
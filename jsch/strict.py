@@ -0,0 +1,188 @@
+import re
+
+from jsch.schema import (
+    KEYWORDS,
+    Schema,
+    SchemaValidationError,
+    walk,
+    ADDITIONAL_PROPERTIES_KEY,
+    DEFAULT_KEY,
+    ENUM_KEY,
+    EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAX_PROPERTIES_KEY,
+    MAXIMUM_KEY,
+    MIN_ITEMS_KEY,
+    MIN_LENGTH_KEY,
+    MIN_PROPERTIES_KEY,
+    MINIMUM_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    REQUIRED_KEY,
+    TYPE_KEY
+)
+from jsch.validator import TYPE_CHECKS, Compiler, Validator
+
+
+RANGE_KEYWORDS = [
+    (MIN_LENGTH_KEY, KEYWORDS[MIN_LENGTH_KEY],
+     MAX_LENGTH_KEY, KEYWORDS[MAX_LENGTH_KEY]),
+    (MIN_ITEMS_KEY, KEYWORDS[MIN_ITEMS_KEY],
+     MAX_ITEMS_KEY, KEYWORDS[MAX_ITEMS_KEY]),
+    (MIN_PROPERTIES_KEY, KEYWORDS[MIN_PROPERTIES_KEY],
+     MAX_PROPERTIES_KEY, KEYWORDS[MAX_PROPERTIES_KEY])
+]
+
+MINIMUM = KEYWORDS[MINIMUM_KEY]
+MAXIMUM = KEYWORDS[MAXIMUM_KEY]
+EXCLUSIVE_MINIMUM = KEYWORDS[EXCLUSIVE_MINIMUM_KEY]
+EXCLUSIVE_MAXIMUM = KEYWORDS[EXCLUSIVE_MAXIMUM_KEY]
+REQUIRED = KEYWORDS[REQUIRED_KEY]
+PROPERTIES = KEYWORDS[PROPERTIES_KEY]
+PATTERN_PROPERTIES = KEYWORDS[PATTERN_PROPERTIES_KEY]
+ADDITIONAL_PROPERTIES = KEYWORDS[ADDITIONAL_PROPERTIES_KEY]
+ENUM = KEYWORDS[ENUM_KEY]
+TYPE = KEYWORDS[TYPE_KEY]
+DEFAULT = KEYWORDS[DEFAULT_KEY]
+
+
+def validate_numeric_range(schema_dict):
+    minimum = schema_dict.get(MINIMUM, None)
+    maximum = schema_dict.get(MAXIMUM, None)
+    if minimum is None or maximum is None:
+        return
+    if minimum > maximum:
+        raise SchemaValidationError(
+            MINIMUM_KEY,
+            "must be less than or equal to '{0}'".format(MAXIMUM_KEY)
+        )
+    exclusive = schema_dict.get(EXCLUSIVE_MINIMUM, None) or \
+        schema_dict.get(EXCLUSIVE_MAXIMUM, None)
+    if minimum == maximum and exclusive:
+        raise SchemaValidationError(
+            MINIMUM_KEY, "must be less than '{0}'".format(MAXIMUM_KEY)
+        )
+
+
+def validate_ranges(schema_dict):
+    for min_key, min_keyword, max_key, max_keyword in RANGE_KEYWORDS:
+        minimum = schema_dict.get(min_keyword, None)
+        maximum = schema_dict.get(max_keyword, None)
+        if minimum is not None and maximum is not None and minimum > maximum:
+            raise SchemaValidationError(
+                min_key,
+                "must be less than or equal to '{0}'".format(max_key)
+            )
+
+
+def validate_required_defined(schema_dict):
+    required = schema_dict.get(REQUIRED, None)
+    if required is None:
+        return
+    properties = schema_dict.get(PROPERTIES, None)
+    pattern_properties = schema_dict.get(PATTERN_PROPERTIES, None)
+    additional_properties = schema_dict.get(ADDITIONAL_PROPERTIES, None)
+    if properties is None and pattern_properties is None and \
+            additional_properties is not False:
+        return
+    properties = properties or {}
+    searches = [re.compile(p).search for p in pattern_properties or ()]
+    for name in required:
+        if name not in properties and \
+                not any(search(name) for search in searches):
+            raise SchemaValidationError(
+                REQUIRED_KEY,
+                "list item '{0}' must be defined in '{1}'".format(
+                    name, PROPERTIES_KEY
+                )
+            )
+
+
+def validate_enum_type(schema_dict):
+    enum = schema_dict.get(ENUM, None)
+    type_value = schema_dict.get(TYPE, None)
+    if enum is None or type_value is None:
+        return
+    types = [type_value] if isinstance(type_value, str) else type_value
+    checks = [TYPE_CHECKS[type_str] for type_str in types]
+    for item in enum:
+        if not any(check(item) for check in checks):
+            raise SchemaValidationError(
+                ENUM_KEY, "list item must match '{0}'".format(TYPE_KEY)
+            )
+
+
+class LazyValidator(Validator):
+    # Compiles its keywords the first time it is used, so that checking a
+    # default only compiles the sub-schemas its value reaches. A compile
+    # that fails leaves the validator uncompiled, to fail again if used.
+    def __init__(self, schema, compiler):
+        super().__init__(schema, compiler)
+        self._checks = None
+
+    def compile(self):
+        if self._checks is None:
+            checks = self.compiler.compile_checks(self.schema)
+            self._tests = tuple(test for test, _ in checks)
+            self._checks = checks
+
+    def is_valid(self, instance):
+        self.compile()
+        return super().is_valid(instance)
+
+    def iter_errors(self, instance, link=None):
+        self.compile()
+        return super().iter_errors(instance, link)
+
+
+class LazyCompiler(Compiler):
+    def compile(self, schema):
+        validator = self._validators.get(id(schema), None)
+        if validator is None:
+            validator = LazyValidator(schema, self)
+            self._validators[id(schema)] = validator
+        return validator
+
+
+def validate_default_valid(schema, schema_dict, compiler):
+    if DEFAULT not in schema_dict:
+        return
+    try:
+        valid = compiler.compile(schema).is_valid(schema_dict[DEFAULT])
+    except SchemaValidationError:
+        # A ref that cannot be resolved from the schema being checked.
+        return
+    if not valid:
+        raise SchemaValidationError(
+            DEFAULT_KEY, "must be valid against the schema"
+        )
+
+
+STRICT_VALIDATION_FUNCTIONS = [
+    validate_numeric_range,
+    validate_ranges,
+    validate_required_defined,
+    validate_enum_type
+]
+
+
+def validate_strict(schema):
+    compiler = LazyCompiler(schema)
+    checked = {}
+    for _, node in walk(schema, prune=lambda pointer, node: (
+            id(node) in checked or node.__dict__.get('_strict', False))):
+        checked[id(node)] = node
+        schema_dict = node._dict
+        for validate in STRICT_VALIDATION_FUNCTIONS:
+            validate(schema_dict)
+        validate_default_valid(node, schema_dict, compiler)
+    for node in checked.values():
+        node._strict = True
+
+
+class SchemaStrict(Schema):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        validate_strict(self)
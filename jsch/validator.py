@@ -0,0 +1,965 @@
+import collections
+import decimal
+import itertools
+import operator
+import re
+
+from jsch.formats import format_checker
+from jsch.schema import (
+    KEYWORDS,
+    Schema,
+    SchemaValidationError,
+    format_pointer,
+    unescape_pointer_token,
+    ADDITIONAL_ITEMS_KEY,
+    ADDITIONAL_PROPERTIES_KEY,
+    ALL_OF_KEY,
+    ANY_OF_KEY,
+    DEFAULT_KEY,
+    DEPENDENCIES_KEY,
+    DESCRIPTION_KEY,
+    ENUM_KEY,
+    EXCLUSIVE_MAXIMUM_KEY,
+    EXCLUSIVE_MINIMUM_KEY,
+    FORMAT_KEY,
+    ITEMS_KEY,
+    MAX_ITEMS_KEY,
+    MAX_LENGTH_KEY,
+    MAX_PROPERTIES_KEY,
+    MAXIMUM_KEY,
+    MIN_ITEMS_KEY,
+    MIN_LENGTH_KEY,
+    MIN_PROPERTIES_KEY,
+    MINIMUM_KEY,
+    MULTIPLE_OF_KEY,
+    NOT_KEY,
+    ONE_OF_KEY,
+    PATTERN_KEY,
+    PATTERN_PROPERTIES_KEY,
+    PROPERTIES_KEY,
+    REF_KEY,
+    REQUIRED_KEY,
+    TITLE_KEY,
+    TYPE_KEY,
+    UNIQUE_ITEMS_KEY
+)
+
+
+TYPE_CHECKS = {
+    'array': lambda instance: isinstance(instance, list),
+    'boolean': lambda instance: isinstance(instance, bool),
+    'integer': lambda instance: (
+        isinstance(instance, int) and not isinstance(instance, bool) or
+        isinstance(instance, float) and instance.is_integer()
+    ),
+    'null': lambda instance: instance is None,
+    'number': lambda instance: (
+        isinstance(instance, (int, float)) and not isinstance(instance, bool)
+    ),
+    'object': lambda instance: isinstance(instance, dict),
+    'string': lambda instance: isinstance(instance, str)
+}
+
+
+def is_number(instance):
+    return (
+        isinstance(instance, (int, float)) and not isinstance(instance, bool)
+    )
+
+
+def json_equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if is_number(a) and is_number(b):
+        return a == b
+    if isinstance(a, list):
+        return (
+            isinstance(b, list) and len(a) == len(b) and
+            all(json_equal(x, y) for x, y in zip(a, b))
+        )
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict) and a.keys() == b.keys() and
+            all(json_equal(value, b[key]) for key, value in a.items())
+        )
+    return type(a) is type(b) and a == b
+
+
+def is_multiple_of(instance, multiple_of):
+    if isinstance(instance, int) and isinstance(multiple_of, int):
+        return instance % multiple_of == 0
+    try:
+        if (instance / multiple_of).is_integer():
+            return True
+        remainder = (
+            decimal.Decimal(repr(instance)) %
+            decimal.Decimal(repr(multiple_of))
+        )
+    except (OverflowError, decimal.InvalidOperation):
+        return False
+    return remainder == 0
+
+
+def resolve_pointer(root, pointer):
+    if not pointer.startswith('#'):
+        raise SchemaValidationError(
+            REF_KEY, "'{0}' must be a local reference".format(pointer)
+        )
+    if not (pointer == '#' or pointer.startswith('#/')):
+        raise SchemaValidationError(
+            REF_KEY, "'{0}' cannot be resolved".format(pointer)
+        )
+    node = root
+    tokens = pointer[2:].split('/') if len(pointer) > 1 else []
+    for token in tokens:
+        token = unescape_pointer_token(token)
+        try:
+            if isinstance(node, Schema):
+                node = node._dict[token]
+            elif isinstance(node, list):
+                node = node[int(token)]
+            else:
+                node = node[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            node = None
+            break
+    if not isinstance(node, Schema):
+        raise SchemaValidationError(
+            REF_KEY, "'{0}' cannot be resolved".format(pointer)
+        )
+    return node
+
+
+class ValidationError(Exception):
+    def __init__(self, message, path=None, params=(), link=None):
+        super().__init__(message)
+        self._message = message
+        self._params = params
+        self._path = None if path is None else collections.deque(path)
+        self._link = link
+
+    @property
+    def message(self):
+        if self._params:
+            return self._message.format(*self._params)
+        return self._message
+
+    @property
+    def path(self):
+        if self._path is None:
+            path = collections.deque()
+            link = self._link
+            while link is not None:
+                link, token = link
+                path.appendleft(token)
+            self._path = path
+        return self._path
+
+    @property
+    def pointer(self):
+        return format_pointer(self.path)
+
+    def __str__(self):
+        return "'{0}' {1}".format(self.pointer, self.message)
+
+
+def fail(message):
+    def explain(instance, link):
+        yield ValidationError(message, link=link)
+    return explain
+
+
+def describe_type(type_value):
+    types = [type_value] if isinstance(type_value, str) else type_value
+    return ' or '.join("'{0}'".format(type_str) for type_str in types)
+
+
+def compile_type(schema, compiler):
+    type_value = schema.type
+    types = [type_value] if isinstance(type_value, str) else type_value
+    checks = tuple(TYPE_CHECKS[type_str] for type_str in types)
+    if len(checks) == 1:
+        test = checks[0]
+    else:
+        def test(instance):
+            for check in checks:
+                if check(instance):
+                    return True
+            return False
+    return test, fail("must be of type {0}".format(describe_type(type_value)))
+
+
+def compile_enum(schema, compiler):
+    enum = schema.enum
+
+    def test(instance):
+        for value in enum:
+            if json_equal(instance, value):
+                return True
+        return False
+    return test, fail("must be one of the enum values")
+
+
+def compile_maximum(schema, compiler):
+    maximum = schema.maximum
+    if schema.exclusive_maximum:
+        test = lambda instance: not is_number(instance) or instance < maximum
+        message = "must be less than {0}".format(maximum)
+    else:
+        test = lambda instance: not is_number(instance) or instance <= maximum
+        message = "must be less than or equal to {0}".format(maximum)
+    return test, fail(message)
+
+
+def compile_minimum(schema, compiler):
+    minimum = schema.minimum
+    if schema.exclusive_minimum:
+        test = lambda instance: not is_number(instance) or instance > minimum
+        message = "must be greater than {0}".format(minimum)
+    else:
+        test = lambda instance: not is_number(instance) or instance >= minimum
+        message = "must be greater than or equal to {0}".format(minimum)
+    return test, fail(message)
+
+
+def compile_multiple_of(schema, compiler):
+    multiple_of = schema.multiple_of
+    test = lambda instance: (
+        not is_number(instance) or is_multiple_of(instance, multiple_of)
+    )
+    return test, fail("must be a multiple of {0}".format(multiple_of))
+
+
+def compile_max_length(schema, compiler):
+    max_length = schema.max_length
+    test = lambda instance: (
+        not isinstance(instance, str) or len(instance) <= max_length
+    )
+    return test, fail(
+        "must be at most {0} characters long".format(max_length)
+    )
+
+
+def compile_min_length(schema, compiler):
+    min_length = schema.min_length
+    test = lambda instance: (
+        not isinstance(instance, str) or len(instance) >= min_length
+    )
+    return test, fail(
+        "must be at least {0} characters long".format(min_length)
+    )
+
+
+def compile_pattern(schema, compiler):
+    search = re.compile(schema.pattern).search
+    test = lambda instance: (
+        not isinstance(instance, str) or search(instance) is not None
+    )
+    return test, fail("must match pattern '{0}'".format(schema.pattern))
+
+
+def compile_format(schema, compiler):
+    # Formats with no registered checker are not validated.
+    checker = format_checker(schema.format)
+    if checker is None:
+        return None
+    test = lambda instance: not isinstance(instance, str) or checker(instance)
+    return test, fail("must be of format '{0}'".format(schema.format))
+
+
+def compile_max_items(schema, compiler):
+    max_items = schema.max_items
+    test = lambda instance: (
+        not isinstance(instance, list) or len(instance) <= max_items
+    )
+    return test, fail("must have at most {0} items".format(max_items))
+
+
+def compile_min_items(schema, compiler):
+    min_items = schema.min_items
+    test = lambda instance: (
+        not isinstance(instance, list) or len(instance) >= min_items
+    )
+    return test, fail("must have at least {0} items".format(min_items))
+
+
+# Tags that keep the keys of booleans, arrays and objects apart from each
+# other and from numbers, strings and null.
+BOOLEAN_TAG = object()
+ARRAY_TAG = object()
+OBJECT_TAG = object()
+
+
+# Exact types whose values are their own JSON keys, so that the common
+# case is a single lookup rather than a chain of isinstance calls.
+SCALAR_TYPES = frozenset([str, int, float, type(None)])
+
+
+def json_key(value):
+    # A hashable key that is equal for two values exactly when json_equal
+    # is true of them, or None for values that are not JSON.
+    if type(value) in SCALAR_TYPES:
+        return value
+    if isinstance(value, bool):
+        return BOOLEAN_TAG, value
+    if isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, list):
+        keys = []
+        for item in value:
+            key = json_key(item)
+            if key is None and item is not None:
+                return None
+            keys.append(key)
+        return ARRAY_TAG, tuple(keys)
+    if isinstance(value, dict):
+        keys = []
+        for name, item in value.items():
+            if type(item) in SCALAR_TYPES:
+                keys.append((name, item))
+                continue
+            key = json_key(item)
+            if key is None:
+                return None
+            keys.append((name, key))
+        return OBJECT_TAG, frozenset(keys)
+    return None
+
+
+def are_instance_items_unique(items):
+    # Values that are unique under Python equality are unique JSON values,
+    # as JSON equality only tells apart more values, such as true and 1.
+    # So the set is enough when it finds no duplicates, and otherwise, or
+    # for arrays and objects, items are compared by their JSON keys.
+    try:
+        if len(set(items)) == len(items):
+            return True
+    except TypeError:
+        pass
+    seen = set()
+    for item in items:
+        key = json_key(item)
+        if key is None and item is not None:
+            return are_items_unique_pairwise(items)
+        if key in seen:
+            return False
+        seen.add(key)
+    return True
+
+
+def are_items_unique_pairwise(items):
+    for index, item in enumerate(items):
+        for other_item in items[index + 1:]:
+            if json_equal(item, other_item):
+                return False
+    return True
+
+
+def compile_unique_items(schema, compiler):
+    if not schema.unique_items:
+        return None
+    test = lambda instance: (
+        not isinstance(instance, list) or are_instance_items_unique(instance)
+    )
+    return test, fail("must have unique items")
+
+
+# Item schemas made of only these keywords, with a single type, can be
+# checked against a whole list at once rather than item by item.
+HOMOGENEOUS_KEYWORDS = frozenset(KEYWORDS[key] for key in [
+    DEFAULT_KEY, DESCRIPTION_KEY, EXCLUSIVE_MAXIMUM_KEY, EXCLUSIVE_MINIMUM_KEY,
+    FORMAT_KEY, MAX_LENGTH_KEY, MAXIMUM_KEY, MIN_LENGTH_KEY, MINIMUM_KEY,
+    PATTERN_KEY, TITLE_KEY, TYPE_KEY
+])
+
+# The exact item types each type accepts without looking at the items.
+# Other items, such as integral floats for 'integer', are left to the
+# item schema's own validator.
+HOMOGENEOUS_TYPES = {
+    'boolean': frozenset([bool]),
+    'integer': frozenset([int]),
+    'null': frozenset([type(None)]),
+    'number': frozenset([int, float]),
+    'string': frozenset([str])
+}
+
+
+def compile_bound_check(compare, bound):
+    # Comparing through operator keeps NaN out of range, which min and max
+    # would not.
+    bounds = itertools.repeat(bound)
+    return lambda items: all(map(compare, bounds, items))
+
+
+def compile_homogeneous_checks(schema):
+    checks = []
+    if schema.type in ('integer', 'number'):
+        if schema.maximum is not None:
+            checks.append(compile_bound_check(
+                operator.gt if schema.exclusive_maximum else operator.ge,
+                schema.maximum
+            ))
+        if schema.minimum is not None:
+            checks.append(compile_bound_check(
+                operator.lt if schema.exclusive_minimum else operator.le,
+                schema.minimum
+            ))
+    elif schema.type == 'string':
+        max_length = schema.max_length
+        if max_length is not None:
+            checks.append(lambda items: (
+                max(map(len, items), default=0) <= max_length
+            ))
+        min_length = schema.min_length
+        if min_length is not None:
+            checks.append(lambda items: (
+                min(map(len, items), default=min_length) >= min_length
+            ))
+        if schema.pattern is not None:
+            search = re.compile(schema.pattern).search
+            checks.append(lambda items: all(map(search, items)))
+        checker = format_checker(schema.format)
+        if checker is not None:
+            checks.append(lambda items: all(map(checker, items)))
+    return checks
+
+
+def compile_homogeneous_test(schema):
+    if not HOMOGENEOUS_KEYWORDS.issuperset(schema._dict):
+        return None
+    type_value = schema.type
+    if not isinstance(type_value, str):
+        return None
+    item_types = HOMOGENEOUS_TYPES.get(type_value, None)
+    if item_types is None:
+        return None
+    checks = compile_homogeneous_checks(schema)
+
+    # True when every item is valid, and False when some item may not be.
+    def test(items):
+        if not item_types.issuperset(map(type, items)):
+            return False
+        for check in checks:
+            if not check(items):
+                return False
+        return True
+    return test
+
+
+def compile_items_test(validator, homogeneous):
+    is_valid = validator.is_valid
+    if homogeneous is None:
+        def test(items):
+            for item in items:
+                if not is_valid(item):
+                    return False
+            return True
+        return test
+    # Lists the whole-list test cannot pass are settled item by item, so
+    # only lists with invalid or unusual items pay for both.
+    return lambda items: homogeneous(items) or all(map(is_valid, items))
+
+
+def compile_items(schema, compiler):
+    items = schema.items
+    if isinstance(items, Schema):
+        validator = compiler.compile(items)
+        items_test = compile_items_test(
+            validator, compiler.compile_homogeneous(items)
+        )
+        test = lambda instance: (
+            not isinstance(instance, list) or items_test(instance)
+        )
+
+        def explain(instance, link):
+            for index, item in enumerate(instance):
+                yield from validator.iter_errors(item, (link, index))
+        return test, explain
+
+    # Tuple items check their additional items in the same pass, unless
+    # additional items are simply forbidden.
+    validators = [compiler.compile(item) for item in items]
+    count = len(validators)
+    tests = tuple(validator.is_valid for validator in validators)
+    additional_items = schema.additional_items
+    if isinstance(additional_items, Schema):
+        additional = compiler.compile(additional_items)
+        rest_test = compile_items_test(
+            additional, compiler.compile_homogeneous(additional_items)
+        )
+    else:
+        additional = None
+        rest_test = None
+
+    def test(instance):
+        if isinstance(instance, list):
+            for is_valid, item in zip(tests, instance):
+                if not is_valid(item):
+                    return False
+            if rest_test is not None and len(instance) > count:
+                return rest_test(instance[count:])
+        return True
+
+    def explain(instance, link):
+        for index, (validator, item) in enumerate(zip(validators, instance)):
+            yield from validator.iter_errors(item, (link, index))
+        if additional is not None:
+            for index in range(count, len(instance)):
+                yield from additional.iter_errors(
+                    instance[index], (link, index)
+                )
+    return test, explain
+
+
+def compile_additional_items(schema, compiler):
+    additional_items = schema.additional_items
+    if additional_items is not False or not isinstance(schema.items, list):
+        return None
+    count = len(schema.items)
+    test = lambda instance: (
+        not isinstance(instance, list) or len(instance) <= count
+    )
+    return test, fail("must not have additional items")
+
+
+def compile_max_properties(schema, compiler):
+    max_properties = schema.max_properties
+    test = lambda instance: (
+        not isinstance(instance, dict) or len(instance) <= max_properties
+    )
+    return test, fail(
+        "must have at most {0} properties".format(max_properties)
+    )
+
+
+def compile_min_properties(schema, compiler):
+    min_properties = schema.min_properties
+    test = lambda instance: (
+        not isinstance(instance, dict) or len(instance) >= min_properties
+    )
+    return test, fail(
+        "must have at least {0} properties".format(min_properties)
+    )
+
+
+def compile_required(schema, compiler):
+    required = tuple(schema.required)
+
+    def test(instance):
+        if isinstance(instance, dict):
+            for name in required:
+                if name not in instance:
+                    return False
+        return True
+
+    def explain(instance, link):
+        for name in required:
+            if name not in instance:
+                yield ValidationError(
+                    "must have property '{0}'", params=(name,), link=link
+                )
+    return test, explain
+
+
+def compile_properties(schema, compiler):
+    properties = {
+        name: compiler.compile(property_schema)
+        for name, property_schema in schema.properties.items()
+    }
+
+    def test(instance):
+        if isinstance(instance, dict):
+            for name, value in instance.items():
+                validator = properties.get(name, None)
+                if validator is not None and not validator.is_valid(value):
+                    return False
+        return True
+
+    def explain(instance, link):
+        for name, value in instance.items():
+            validator = properties.get(name, None)
+            if validator is not None:
+                yield from validator.iter_errors(value, (link, name))
+    return test, explain
+
+
+def compile_pattern_properties(schema, compiler):
+    match = compiler.property_matcher(schema).match
+
+    def test(instance):
+        if isinstance(instance, dict):
+            for name, value in instance.items():
+                for validator in match(name):
+                    if not validator.is_valid(value):
+                        return False
+        return True
+
+    def explain(instance, link):
+        for name, value in instance.items():
+            for validator in match(name):
+                yield from validator.iter_errors(value, (link, name))
+    return test, explain
+
+
+def compile_additional_properties(schema, compiler):
+    additional_properties = schema.additional_properties
+    if additional_properties is True:
+        return None
+    is_additional = compiler.property_matcher(schema).is_additional
+
+    if additional_properties is False:
+        def test(instance):
+            if isinstance(instance, dict):
+                for name in instance:
+                    if is_additional(name):
+                        return False
+            return True
+
+        def explain(instance, link):
+            for name in instance:
+                if is_additional(name):
+                    yield ValidationError(
+                        "must not have additional property '{0}'",
+                        params=(name,),
+                        link=link
+                    )
+        return test, explain
+
+    validator = compiler.compile(additional_properties)
+
+    def test(instance):
+        if isinstance(instance, dict):
+            for name, value in instance.items():
+                if is_additional(name) and not validator.is_valid(value):
+                    return False
+        return True
+
+    def explain(instance, link):
+        for name, value in instance.items():
+            if is_additional(name):
+                yield from validator.iter_errors(value, (link, name))
+    return test, explain
+
+
+def compile_dependencies(schema, compiler):
+    dependencies = [
+        (name, compiler.compile(dependency)
+         if isinstance(dependency, Schema) else tuple(dependency))
+        for name, dependency in schema.dependencies.items()
+    ]
+
+    def test(instance):
+        if isinstance(instance, dict):
+            for name, dependency in dependencies:
+                if name in instance:
+                    if isinstance(dependency, tuple):
+                        for other_name in dependency:
+                            if other_name not in instance:
+                                return False
+                    elif not dependency.is_valid(instance):
+                        return False
+        return True
+
+    def explain(instance, link):
+        for name, dependency in dependencies:
+            if name in instance:
+                if isinstance(dependency, tuple):
+                    for other_name in dependency:
+                        if other_name not in instance:
+                            yield ValidationError(
+                                "must have property '{0}' when property "
+                                "'{1}' is present",
+                                params=(other_name, name),
+                                link=link
+                            )
+                else:
+                    yield from dependency.iter_errors(instance, link)
+    return test, explain
+
+
+def compile_all_of(schema, compiler):
+    validators = [compiler.compile(member) for member in schema.all_of]
+
+    def test(instance):
+        for validator in validators:
+            if not validator.is_valid(instance):
+                return False
+        return True
+
+    def explain(instance, link):
+        for validator in validators:
+            yield from validator.iter_errors(instance, link)
+    return test, explain
+
+
+def compile_any_of(schema, compiler):
+    validators = [compiler.compile(member) for member in schema.any_of]
+
+    def test(instance):
+        for validator in validators:
+            if validator.is_valid(instance):
+                return True
+        return False
+    return test, fail(
+        "must be valid against at least one '{0}' schema".format(ANY_OF_KEY)
+    )
+
+
+def compile_one_of(schema, compiler):
+    validators = [compiler.compile(member) for member in schema.one_of]
+
+    def test(instance):
+        matched = False
+        for validator in validators:
+            if validator.is_valid(instance):
+                if matched:
+                    return False
+                matched = True
+        return matched
+    return test, fail(
+        "must be valid against exactly one '{0}' schema".format(ONE_OF_KEY)
+    )
+
+
+def compile_not(schema, compiler):
+    validator = compiler.compile(schema.not_)
+    test = lambda instance: not validator.is_valid(instance)
+    return test, fail(
+        "must not be valid against the '{0}' schema".format(NOT_KEY)
+    )
+
+
+def compile_ref(schema, compiler):
+    validator = compiler.compile(resolve_pointer(compiler.root, schema.ref))
+    return validator.is_valid, validator.iter_errors
+
+
+INSTANCE_VALIDATION_FUNCTIONS = collections.OrderedDict([
+    (TYPE_KEY, compile_type),
+    (ENUM_KEY, compile_enum),
+    (MAXIMUM_KEY, compile_maximum),
+    (MINIMUM_KEY, compile_minimum),
+    (MULTIPLE_OF_KEY, compile_multiple_of),
+    (MAX_LENGTH_KEY, compile_max_length),
+    (MIN_LENGTH_KEY, compile_min_length),
+    (PATTERN_KEY, compile_pattern),
+    (FORMAT_KEY, compile_format),
+    (MAX_ITEMS_KEY, compile_max_items),
+    (MIN_ITEMS_KEY, compile_min_items),
+    (UNIQUE_ITEMS_KEY, compile_unique_items),
+    (ITEMS_KEY, compile_items),
+    (ADDITIONAL_ITEMS_KEY, compile_additional_items),
+    (MAX_PROPERTIES_KEY, compile_max_properties),
+    (MIN_PROPERTIES_KEY, compile_min_properties),
+    (REQUIRED_KEY, compile_required),
+    (PROPERTIES_KEY, compile_properties),
+    (PATTERN_PROPERTIES_KEY, compile_pattern_properties),
+    (ADDITIONAL_PROPERTIES_KEY, compile_additional_properties),
+    (DEPENDENCIES_KEY, compile_dependencies),
+    (ALL_OF_KEY, compile_all_of),
+    (ANY_OF_KEY, compile_any_of),
+    (ONE_OF_KEY, compile_one_of),
+    (NOT_KEY, compile_not)
+])
+
+
+# Property names matched by a PropertyMatcher are remembered up to this
+# many, so that objects with arbitrary names cannot grow it without bound.
+MAX_MATCHED_NAMES = 4096
+
+
+def is_anchored(pattern):
+    # Whether every match of a pattern starts at the start of the string,
+    # which holds when it starts with ^ and has no alternatives outside of
+    # a group.
+    if not pattern.startswith('^'):
+        return False
+    depth = 0
+    escaped = in_class = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return False
+    return True
+
+
+def lookahead(pattern):
+    if is_anchored(pattern):
+        return '(?={0})'.format(pattern)
+    return r'(?=[\s\S]*?(?:{0}))'.format(pattern)
+
+
+def compile_pattern_search(patterns):
+    # Returns a function finding the indices of every pattern that matches
+    # a name, and one telling whether any does. Each pattern is tried in a
+    # lookahead from the start of the name, followed by an empty group
+    # that records whether it matched, so that one call tries them all.
+    # Patterns this cannot combine, such as those with groups of their own
+    # or inline flags, are searched one by one.
+    compiled = [re.compile(pattern) for pattern in patterns]
+    if not compiled:
+        return lambda name: (), lambda name: False
+    if not any(regex.groups for regex in compiled):
+        try:
+            any_search = re.compile(
+                '|'.join('(?:{0})'.format(pattern) for pattern in patterns)
+            ).search
+            match_all = re.compile(''.join(
+                '(?:{0}())?'.format(lookahead(pattern))
+                for pattern in patterns
+            )).match
+        except re.error:
+            pass
+        else:
+            def search(name):
+                if any_search(name) is None:
+                    return ()
+                return tuple(
+                    index for index, group
+                    in enumerate(match_all(name).groups())
+                    if group is not None
+                )
+            return search, lambda name: any_search(name) is not None
+    searches = [regex.search for regex in compiled]
+
+    def search(name):
+        return tuple(
+            index for index, search in enumerate(searches) if search(name)
+        )
+
+    def matches_any(name):
+        for search in searches:
+            if search(name):
+                return True
+        return False
+    return search, matches_any
+
+
+class PropertyMatcher(object):
+    def __init__(self, schema, compiler):
+        pattern_properties = schema.pattern_properties or {}
+        self.properties = frozenset(schema.properties or ())
+        self.validators = [
+            compiler.compile(property_schema)
+            for property_schema in pattern_properties.values()
+        ]
+        self._search, self._matches_any = compile_pattern_search(
+            list(pattern_properties)
+        )
+        # Filled while validating, so shared between threads. Only single
+        # dict operations are used, and racing threads store equal values.
+        self._names = {}
+
+    def match(self, name):
+        # The validators of the patterns that match a name, and whether the
+        # name is an additional property, decided together and remembered.
+        matched = self._names.get(name, None)
+        if matched is None:
+            validators = tuple(
+                self.validators[index] for index in self._search(name)
+            )
+            matched = (
+                validators, not validators and name not in self.properties
+            )
+            if len(self._names) < MAX_MATCHED_NAMES:
+                self._names[name] = matched
+        return matched[0]
+
+    def is_additional(self, name):
+        matched = self._names.get(name, None)
+        if matched is None:
+            # Past the limit, finding whether any pattern matches is enough.
+            return name not in self.properties and not self._matches_any(name)
+        return matched[1]
+
+
+class Validator(object):
+    def __init__(self, schema, compiler):
+        self.schema = schema
+        self.compiler = compiler
+        self._tests = ()
+        self._checks = ()
+
+    def is_valid(self, instance):
+        for test in self._tests:
+            if not test(instance):
+                return False
+        return True
+
+    def iter_errors(self, instance, link=None):
+        for test, explain in self._checks:
+            if not test(instance):
+                yield from explain(instance, link)
+
+    def errors(self, instance):
+        return list(self.iter_errors(instance))
+
+    def first_error(self, instance):
+        return next(self.iter_errors(instance), None)
+
+    def validate(self, instance):
+        error = self.first_error(instance)
+        if error is not None:
+            raise error
+
+
+class Compiler(object):
+    def __init__(self, root):
+        self.root = root
+        self._validators = {}
+        self._matchers = {}
+
+    def compile(self, schema):
+        validator = self._validators.get(id(schema), None)
+        if validator is None:
+            validator = Validator(schema, self)
+            self._validators[id(schema)] = validator
+            checks = self.compile_checks(schema)
+            validator._checks = checks
+            validator._tests = tuple(test for test, _ in checks)
+        return validator
+
+    def compile_checks(self, schema):
+        checks = []
+        schema_dict = schema._dict
+        if KEYWORDS[REF_KEY] in schema_dict:
+            checks.append(self.compile_keyword(REF_KEY, schema))
+        else:
+            for key in INSTANCE_VALIDATION_FUNCTIONS:
+                if KEYWORDS[key] in schema_dict:
+                    check = self.compile_keyword(key, schema)
+                    if check is not None:
+                        checks.append(check)
+        return tuple(checks)
+
+    def property_matcher(self, schema):
+        # Shared by the pattern_properties and additional_properties checks
+        # of a schema, so that each name is matched once for both.
+        matcher = self._matchers.get(id(schema), None)
+        if matcher is None:
+            matcher = PropertyMatcher(schema, self)
+            self._matchers[id(schema)] = matcher
+        return matcher
+
+    def compile_homogeneous(self, schema):
+        return compile_homogeneous_test(schema)
+
+    def compile_keyword(self, key, schema):
+        if key == REF_KEY:
+            return compile_ref(schema, self)
+        return INSTANCE_VALIDATION_FUNCTIONS[key](schema, self)
+
+
+def compile_schema(schema):
+    return Compiler(schema).compile(schema)
@@ -0,0 +1,95 @@
+import unittest
+
+import jsch
+from jsch.backends import (
+    available_json_backends,
+    get_json_backend,
+    is_portable,
+    load_json_backend,
+    set_json_backend
+)
+
+
+def make_schema():
+    return jsch.Object(
+        title='Order',
+        properties={
+            'id': jsch.Integer(minimum=1, maximum=1e16),
+            'note': jsch.String(pattern='^[a-z/]+$', default=None),
+            'price': jsch.Number(multiple_of=0.01, minimum=1e-7),
+            'tags': jsch.Array(items=jsch.String(), unique_items=True)
+        },
+        enum=[{'id': 1}],
+        required=['id']
+    )
+
+
+class TestJsonBackends(unittest.TestCase):
+    def setUp(self):
+        self.default_backend = get_json_backend()
+
+    def tearDown(self):
+        set_json_backend(self.default_backend.name)
+
+    def test_stdlib_always_available(self):
+        self.assertIn('json', available_json_backends())
+
+    def test_compact_output_identical_across_backends(self):
+        schema = make_schema()
+        reference = load_json_backend('json').dumps(schema.asdict())
+        for name in available_json_backends():
+            with self.subTest(backend=name):
+                set_json_backend(name)
+                self.assertEqual(reference, schema.asjson())
+
+    def test_non_ascii_output_identical_across_backends(self):
+        schema = jsch.String(title='Café', default='naïve')
+        reference = load_json_backend('json').dumps(schema.asdict())
+        for name in available_json_backends():
+            with self.subTest(backend=name):
+                set_json_backend(name)
+                self.assertEqual(reference, schema.asjson())
+
+    def test_del_output_identical_across_backends(self):
+        schema = jsch.String(title='a\x7fb')
+        reference = load_json_backend('json').dumps(schema.asdict())
+        for name in available_json_backends():
+            with self.subTest(backend=name):
+                set_json_backend(name)
+                self.assertEqual(reference, schema.asjson())
+
+    def test_del_and_non_ascii_output_not_portable(self):
+        self.assertTrue(is_portable(b'{"title":"a~b"}'))
+        self.assertFalse(is_portable(b'{"title":"a\x7fb"}'))
+        self.assertFalse(is_portable('{"title":"Caf\u00e9"}'.encode()))
+
+    def test_pretty_output_identical_across_backends(self):
+        schema = make_schema()
+        reference = load_json_backend('json').dumps(schema.asdict(), True)
+        for name in available_json_backends():
+            with self.subTest(backend=name):
+                set_json_backend(name)
+                self.assertEqual(reference, schema.asjson(pretty=True))
+
+    def test_fromjson_round_trips_across_backends(self):
+        schema = make_schema()
+        for name in available_json_backends():
+            with self.subTest(backend=name):
+                set_json_backend(name)
+                self.assertEqual(schema, jsch.Schema.fromjson(schema.asjson()))
+
+    def test_set_fails_when_backend_unrecognised(self):
+        message = "^'yaml' is not a recognised JSON backend$"
+        with self.assertRaisesRegex(ValueError, message):
+            set_json_backend('yaml')
+
+    def test_set_fails_when_backend_not_installed(self):
+        missing = [
+            name for name in ['orjson', 'msgspec', 'ujson']
+            if name not in available_json_backends()
+        ]
+        if not missing:
+            self.skipTest('all JSON backends are installed')
+        message = "^'{0}' JSON backend is not installed$".format(missing[0])
+        with self.assertRaisesRegex(ValueError, message):
+            set_json_backend(missing[0])
@@ -0,0 +1,255 @@
+import json
+import os
+import tempfile
+import unittest
+
+import jsch
+
+
+class TestBundle(unittest.TestCase):
+    def test_schema_without_refs_is_unchanged(self):
+        schema = jsch.Object(properties={'a': jsch.String()})
+        bundled = jsch.bundle(schema, {})
+        self.assertEqual(schema.asjson(), bundled.asjson())
+
+    def test_local_refs_are_kept(self):
+        schema = jsch.Schema(
+            definitions={'id': jsch.Integer()},
+            properties={'id': jsch.Schema(ref='#/definitions/id')}
+        )
+        bundled = jsch.bundle(schema, {})
+        self.assertEqual(schema.asjson(), bundled.asjson())
+
+    def test_inlines_external_document(self):
+        schema = jsch.Object(properties={
+            'id': jsch.Schema(ref='common.json')
+        })
+        bundled = jsch.bundle(schema, {'common.json': jsch.Integer()})
+        self.assertEqual({
+            'type': 'object',
+            'properties': {'id': {'$ref': '#/definitions/common'}},
+            'definitions': {'common': {'type': 'integer'}}
+        }, json.loads(bundled.asjson()))
+
+    def test_inlines_fragment_of_external_document(self):
+        schema = jsch.Schema(ref='common.json#/definitions/id')
+        store = {'common.json': jsch.Schema(definitions={
+            'id': jsch.Integer(), 'name': jsch.String()
+        })}
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual({
+            '$ref': '#/definitions/common.id',
+            'definitions': {'common.id': {'type': 'integer'}}
+        }, json.loads(bundled.asjson()))
+
+    def test_accepts_dicts_in_store(self):
+        schema = jsch.Schema(ref='common.json')
+        bundled = jsch.bundle(schema, {'common.json': {'type': 'integer'}})
+        self.assertEqual('integer', bundled.definitions['common'].type)
+
+    def test_repeated_targets_are_defined_once(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Schema(ref='common.json#/definitions/id'),
+            'b': jsch.Schema(ref='./common.json#/definitions/id'),
+            'c': jsch.Schema(ref='other.json')
+        })
+        store = {
+            'common.json': jsch.Schema(definitions={'id': jsch.Integer()}),
+            'other.json': jsch.Schema(ref='common.json#/definitions/id')
+        }
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual(['common.id', 'other'], sorted(bundled.definitions))
+        self.assertEqual(
+            '#/definitions/common.id', bundled.properties['b'].ref
+        )
+        self.assertEqual(
+            '#/definitions/common.id', bundled.definitions['other'].ref
+        )
+
+    def test_resolves_paths_relative_to_referring_document(self):
+        schema = jsch.Schema(ref='types/a.json')
+        store = {
+            'types/a.json': jsch.Array(items=jsch.Schema(ref='b.json')),
+            'types/b.json': jsch.Schema(ref='../c.json'),
+            'c.json': jsch.String()
+        }
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual(['a', 'b', 'c'], sorted(bundled.definitions))
+        self.assertEqual(
+            '#/definitions/b', bundled.definitions['a'].items.ref
+        )
+        self.assertEqual('#/definitions/c', bundled.definitions['b'].ref)
+
+    def test_rewrites_local_refs_in_external_documents(self):
+        schema = jsch.Schema(ref='common.json#/definitions/pair')
+        store = {'common.json': jsch.Schema(definitions={
+            'id': jsch.Integer(),
+            'pair': jsch.Array(items=jsch.Schema(ref='#/definitions/id'))
+        })}
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual(
+            '#/definitions/common.id',
+            bundled.definitions['common.pair'].items.ref
+        )
+        self.assertEqual('integer', bundled.definitions['common.id'].type)
+
+    def test_refs_back_to_root_document_stay_local(self):
+        schema = jsch.Schema(
+            definitions={'node': jsch.Schema(ref='tree.json')}
+        )
+        store = {'tree.json': jsch.Object(properties={
+            'children': jsch.Array(items=jsch.Schema(
+                ref='root.json#/definitions/node'
+            ))
+        })}
+        bundled = jsch.bundle(schema, store, name='root.json')
+        self.assertEqual(
+            '#/definitions/node',
+            bundled.definitions['tree'].properties['children'].items.ref
+        )
+
+    def test_cyclic_documents(self):
+        schema = jsch.Schema(ref='a.json')
+        store = {
+            'a.json': jsch.Object(properties={'b': jsch.Schema(ref='b.json')}),
+            'b.json': jsch.Object(properties={'a': jsch.Schema(ref='a.json')})
+        }
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual(
+            '#/definitions/b', bundled.definitions['a'].properties['b'].ref
+        )
+        self.assertEqual(
+            '#/definitions/a', bundled.definitions['b'].properties['a'].ref
+        )
+
+    def test_names_do_not_clash(self):
+        schema = jsch.Schema(
+            definitions={'common': jsch.String()},
+            all_of=[
+                jsch.Schema(ref='common.json'),
+                jsch.Schema(ref='v2/common.json')
+            ]
+        )
+        store = {
+            'common.json': jsch.Integer(),
+            'v2/common.json': jsch.Number()
+        }
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual(
+            ['#/definitions/common-2', '#/definitions/common-3'],
+            [item.ref for item in bundled.all_of]
+        )
+        self.assertEqual('string', bundled.definitions['common'].type)
+
+    def test_escapes_names_in_refs(self):
+        schema = jsch.Schema(ref='common.json#/definitions/a~1b')
+        store = {'common.json': jsch.Schema(definitions={
+            'a/b': jsch.Integer()
+        })}
+        bundled = jsch.bundle(schema, store)
+        self.assertEqual('#/definitions/common.a~1b', bundled.ref)
+        self.assertIn('common.a/b', bundled.definitions)
+
+    def test_missing_document(self):
+        schema = jsch.Schema(ref='missing.json')
+        message = "^'ref' 'missing.json' cannot be resolved$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.bundle(schema, {})
+
+    def test_missing_fragment(self):
+        schema = jsch.Schema(ref='common.json#/definitions/missing')
+        message = (
+            "^'ref' 'common.json#/definitions/missing' cannot be resolved$"
+        )
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.bundle(schema, {'common.json': jsch.Schema()})
+
+    def test_bundled_schema_validates_same_instances(self):
+        schema = jsch.Object(
+            properties={
+                'id': jsch.Schema(ref='common.json#/definitions/id'),
+                'tags': jsch.Schema(ref='tags.json')
+            },
+            required=['id']
+        )
+        store = {
+            'common.json': jsch.Schema(definitions={
+                'id': jsch.Integer(minimum=1)
+            }),
+            'tags.json': jsch.Array(items=jsch.String(), unique_items=True)
+        }
+        validator = jsch.compile_schema(jsch.bundle(schema, store))
+        self.assertTrue(validator.is_valid({'id': 1, 'tags': ['a', 'b']}))
+        self.assertFalse(validator.is_valid({'id': 0}))
+        self.assertFalse(validator.is_valid({'id': 1, 'tags': ['a', 'a']}))
+        self.assertFalse(validator.is_valid({'tags': []}))
+
+
+class TestDirectoryStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.write('root.json', {
+            'properties': {'user': {'$ref': 'types/user.json'}}
+        })
+        self.write('types/user.json', {
+            'type': 'object',
+            'properties': {'id': {'$ref': '../common.json#/definitions/id'}}
+        })
+        self.write('common.json', {'definitions': {'id': {'type': 'integer'}}})
+        self.write('notes.txt', 'not a schema')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, value):
+        path = os.path.join(self.directory.name, *name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as fp:
+            json.dump(value, fp)
+
+    def test_loads_schemas_by_relative_path(self):
+        store = jsch.DirectoryStore(self.directory.name)
+        schema = store['types/user.json']
+        self.assertEqual('object', schema.type)
+        self.assertIs(schema, store['types/user.json'])
+
+    def test_iterates_json_files(self):
+        store = jsch.DirectoryStore(self.directory.name)
+        self.assertEqual(
+            ['common.json', 'root.json', 'types/user.json'], sorted(store)
+        )
+        self.assertEqual(3, len(store))
+        self.assertIn('root.json', store)
+        self.assertNotIn('missing.json', store)
+
+    def test_names_outside_directory_are_missing(self):
+        self.write('store/inside.json', {'type': 'string'})
+        store = jsch.DirectoryStore(
+            os.path.join(self.directory.name, 'store')
+        )
+        self.assertIn('inside.json', store)
+        self.assertNotIn('../common.json', store)
+        self.assertNotIn('sub/../../common.json', store)
+        self.assertNotIn(
+            os.path.join(self.directory.name, 'common.json'), store
+        )
+        schema = jsch.Schema(ref='../common.json#/definitions/id')
+        message = "^'ref' '../common.json' cannot be resolved$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.bundle(schema, store)
+
+    def test_bundle(self):
+        store = jsch.DirectoryStore(self.directory.name)
+        bundled = jsch.bundle(store['root.json'], store, name='root.json')
+        self.assertEqual({
+            'properties': {'user': {'$ref': '#/definitions/user'}},
+            'definitions': {
+                'user': {
+                    'type': 'object',
+                    'properties': {
+                        'id': {'$ref': '#/definitions/common.id'}
+                    }
+                },
+                'common.id': {'type': 'integer'}
+            }
+        }, json.loads(bundled.asjson()))
@@ -0,0 +1,99 @@
+import json
+import unittest
+
+import jsch
+from jsch.canonical import canonical_dict
+
+
+class TestCanonicalJson(unittest.TestCase):
+    def test_sorts_keys(self):
+        schema = jsch.Schema(title='a', description='b')
+        self.assertEqual(
+            '{"description":"b","title":"a"}', jsch.canonical_json(schema)
+        )
+
+    def test_normalizes_integral_floats(self):
+        schema = jsch.Number(minimum=1.0, maximum=2.5, default=[3.0])
+        self.assertEqual(
+            '{"default":[3],"maximum":2.5,"minimum":1,"type":"number"}',
+            jsch.canonical_json(schema)
+        )
+
+    def test_sorts_required_and_type(self):
+        schema = jsch.Schema(type=['string', 'null'], required=['b', 'a'])
+        self.assertEqual(
+            '{"required":["a","b"],"type":["null","string"]}',
+            jsch.canonical_json(schema)
+        )
+
+    def test_collapses_single_type_list(self):
+        schema = jsch.Schema(type=['string'])
+        self.assertEqual('{"type":"string"}', jsch.canonical_json(schema))
+
+    def test_sorts_enum_and_dependencies(self):
+        schema = jsch.Schema(
+            enum=['b', 1, 'a'], dependencies={'a': ['c', 'b']}
+        )
+        self.assertEqual(
+            '{"dependencies":{"a":["b","c"]},"enum":["a","b",1]}',
+            jsch.canonical_json(schema)
+        )
+
+    def test_canonicalizes_sub_schemas(self):
+        schema = jsch.Object(properties={'a': jsch.Integer(maximum=2.0)})
+        self.assertEqual(
+            '{"properties":{"a":{"maximum":2,"type":"integer"}},'
+            '"type":"object"}',
+            jsch.canonical_json(schema)
+        )
+
+    def test_matches_canonical_dict(self):
+        shared = jsch.String(title='é', enum=['b', 'a'])
+        schema = jsch.Array(
+            items=[shared, jsch.Number(maximum=1.0)],
+            additional_items=shared,
+            default=[{'b': 1, 'a': [2.0]}],
+            all_of=[jsch.Schema(dependencies={'a': shared, 'b': ['d', 'c']})]
+        )
+        self.assertEqual(
+            json.dumps(
+                canonical_dict(schema), sort_keys=True,
+                separators=(',', ':')
+            ),
+            jsch.canonical_json(schema)
+        )
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_equal_for_equivalent_schemas(self):
+        a = jsch.Object(
+            properties={'x': jsch.Integer(minimum=1)}, required=['x', 'y']
+        )
+        b = jsch.Object(
+            properties={'x': jsch.Integer(minimum=1.0)}, required=['y', 'x']
+        )
+        self.assertEqual(jsch.fingerprint(a), jsch.fingerprint(b))
+
+    def test_differs_for_different_schemas(self):
+        a = jsch.Object(properties={'x': jsch.Integer(minimum=1)})
+        b = jsch.Object(properties={'x': jsch.Integer(minimum=2)})
+        self.assertNotEqual(jsch.fingerprint(a), jsch.fingerprint(b))
+
+    def test_distinguishes_sub_schema_from_string(self):
+        a = jsch.Schema(dependencies={'a': jsch.Schema()})
+        b = jsch.Schema(dependencies={'a': [jsch.fingerprint(jsch.Schema())]})
+        self.assertNotEqual(jsch.fingerprint(a), jsch.fingerprint(b))
+
+    def test_cached_per_node(self):
+        schema = jsch.Array(items=jsch.String())
+        digest = jsch.fingerprint(schema)
+        self.assertEqual(digest, schema._fingerprint)
+        self.assertIsNotNone(schema.items._fingerprint)
+
+    def test_reuses_unchanged_sub_schema_fingerprints(self):
+        shared = jsch.Object(properties={'x': jsch.Integer()})
+        jsch.fingerprint(jsch.Array(items=shared))
+        shared._fingerprint = 'cached'
+        a = jsch.Array(items=shared)
+        b = jsch.Array(items=jsch.Object(properties={'x': jsch.Integer()}))
+        self.assertNotEqual(jsch.fingerprint(a), jsch.fingerprint(b))
@@ -0,0 +1,179 @@
+import unittest
+
+import jsch
+
+
+class TestCoerce(unittest.TestCase):
+    def test_converts_integer(self):
+        self.assertEqual(12, jsch.coerce(jsch.Integer(), '12'))
+        self.assertEqual(-3, jsch.coerce(jsch.Integer(), '-3'))
+        self.assertEqual(4, jsch.coerce(jsch.Integer(), '4.0'))
+
+    def test_converts_number(self):
+        self.assertEqual(1.5, jsch.coerce(jsch.Number(), '1.5'))
+        self.assertIs(int, type(jsch.coerce(jsch.Number(), '7')))
+
+    def test_keeps_large_integer_precision(self):
+        self.assertEqual(
+            2 ** 63 + 1, jsch.coerce(jsch.Number(), str(2 ** 63 + 1))
+        )
+
+    def test_rejects_digit_separators(self):
+        with self.assertRaises(jsch.ValidationError):
+            jsch.coerce(jsch.Integer(), '1_000')
+
+    def test_converts_boolean(self):
+        self.assertIs(True, jsch.coerce(jsch.Boolean(), 'true'))
+        self.assertIs(False, jsch.coerce(jsch.Boolean(), 'False'))
+
+    def test_converts_null(self):
+        self.assertIsNone(jsch.coerce(jsch.Null(), ''))
+        self.assertIsNone(jsch.coerce(jsch.Null(), 'null'))
+
+    def test_keeps_string(self):
+        self.assertEqual('12', jsch.coerce(jsch.String(), '12'))
+        schema = jsch.Schema(type=['integer', 'string'])
+        self.assertEqual('12', jsch.coerce(schema, '12'))
+
+    def test_keeps_typed_values(self):
+        self.assertEqual(3, jsch.coerce(jsch.Integer(), 3))
+        self.assertEqual('x', jsch.coerce(jsch.Schema(), 'x'))
+
+    def test_type_list_order(self):
+        schema = jsch.Schema(type=['number', 'boolean', 'null'])
+        self.assertIsNone(jsch.coerce(schema, ''))
+        self.assertIs(True, jsch.coerce(schema, 'true'))
+        self.assertEqual(2.5, jsch.coerce(schema, '2.5'))
+
+    def test_rejects_non_finite_numbers(self):
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(jsch.Number(), 'nan')
+        self.assertEqual("must be of type 'number'", context.exception.message)
+
+    def test_reports_unconvertible_value(self):
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(jsch.Integer(), '1.5')
+        self.assertEqual(
+            "must be of type 'integer'", context.exception.message
+        )
+
+    def test_validates_converted_value(self):
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(jsch.Integer(maximum=5), '6')
+        self.assertEqual(
+            'must be less than or equal to 5', context.exception.message
+        )
+
+    def test_converts_properties(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Integer(), 'b': jsch.Boolean()},
+            required=['a']
+        )
+        self.assertEqual(
+            {'a': 1, 'b': True, 'c': '2'},
+            jsch.coerce(schema, {'a': '1', 'b': 'true', 'c': '2'})
+        )
+
+    def test_does_not_modify_document(self):
+        schema = jsch.Object(properties={'a': jsch.Integer()})
+        document = {'a': '1'}
+        jsch.coerce(schema, document)
+        self.assertEqual({'a': '1'}, document)
+
+    def test_converts_pattern_and_additional_properties(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Integer()},
+            pattern_properties={'^n_': jsch.Number()},
+            additional_properties=jsch.Boolean()
+        )
+        self.assertEqual(
+            {'a': 1, 'n_x': 0.5, 'flag': False},
+            jsch.coerce(schema, {'a': '1', 'n_x': '0.5', 'flag': 'false'})
+        )
+
+    def test_checks_every_matching_schema(self):
+        schema = jsch.Object(
+            properties={'n_a': jsch.Integer()},
+            pattern_properties={'^n_': jsch.Number(minimum=10)}
+        )
+        self.assertEqual({'n_a': 10}, jsch.coerce(schema, {'n_a': '10'}))
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(schema, {'n_a': '9'})
+        self.assertEqual('#/n_a', context.exception.pointer)
+
+    def test_checks_object_keywords(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Integer()},
+            required=['a'],
+            additional_properties=False
+        )
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(schema, {})
+        self.assertEqual(
+            "must have property 'a'", context.exception.message
+        )
+        with self.assertRaises(jsch.ValidationError):
+            jsch.coerce(schema, {'a': '1', 'b': '2'})
+
+    def test_converts_items(self):
+        schema = jsch.Array(items=jsch.Number(), max_items=3)
+        self.assertEqual([1, 2.5], jsch.coerce(schema, ['1', '2.5']))
+        with self.assertRaises(jsch.ValidationError):
+            jsch.coerce(schema, ['1', '2', '3', '4'])
+
+    def test_converts_tuple_items(self):
+        schema = jsch.Array(
+            items=[jsch.Integer(), jsch.Boolean()],
+            additional_items=jsch.Null()
+        )
+        self.assertEqual(
+            [1, True, None], jsch.coerce(schema, ['1', 'true', ''])
+        )
+
+    def test_checks_additional_items(self):
+        schema = jsch.Array(items=[jsch.Integer()], additional_items=False)
+        with self.assertRaises(jsch.ValidationError):
+            jsch.coerce(schema, ['1', '2'])
+
+    def test_reports_path(self):
+        schema = jsch.Object(properties={
+            'rows': jsch.Array(items=jsch.Object(properties={
+                'n': jsch.Integer()
+            }))
+        })
+        with self.assertRaises(jsch.ValidationError) as context:
+            jsch.coerce(schema, {'rows': [{'n': '1'}, {'n': 'x'}]})
+        self.assertEqual('#/rows/1/n', context.exception.pointer)
+
+    def test_follows_ref(self):
+        schema = jsch.Object(
+            definitions={'node': jsch.Object(properties={
+                'value': jsch.Integer(),
+                'next': jsch.Schema(ref='#/definitions/node')
+            })},
+            ref='#/definitions/node'
+        )
+        self.assertEqual(
+            {'value': 1, 'next': {'value': 2}},
+            jsch.coerce(schema, {'value': '1', 'next': {'value': '2'}})
+        )
+
+    def test_checks_combinators_on_converted_value(self):
+        schema = jsch.Integer(any_of=[
+            jsch.Schema(minimum=10), jsch.Schema(maximum=0)
+        ])
+        self.assertEqual(11, jsch.coerce(schema, '11'))
+        with self.assertRaises(jsch.ValidationError):
+            jsch.coerce(schema, '5')
+
+    def test_reuses_coercer(self):
+        coercer = jsch.Coercer(jsch.Array(items=jsch.Integer()))
+        self.assertEqual([1], coercer.coerce(['1']))
+        self.assertEqual([2, 3], coercer.coerce(['2', '3']))
+
+    def test_caches_coercer_on_schema(self):
+        schema = jsch.Integer()
+        jsch.coerce(schema, '1')
+        coercer = schema._coercer
+        jsch.coerce(schema, '2')
+        self.assertIs(coercer, schema._coercer)
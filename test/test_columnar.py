@@ -0,0 +1,295 @@
+import array
+import io
+import subprocess
+import sys
+import unittest
+
+import jsch
+from jsch import columnar
+
+
+NUMPY = columnar.import_numpy()
+
+
+class TestImport(unittest.TestCase):
+    def test_numpy_not_imported_with_jsch(self):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            "import sys, jsch; print('numpy' in sys.modules)"
+        ])
+        self.assertEqual(b'False', output.strip())
+
+
+@unittest.skipIf(NUMPY is None, 'numpy is not installed')
+class TestColumnValidator(unittest.TestCase):
+    def assertMatchesValidator(self, schema, values):
+        validator = jsch.compile_schema(schema)
+        expected = [validator.is_valid(value) for value in values]
+        mask = jsch.column_mask(schema, NUMPY.array(values))
+        self.assertEqual(expected, mask.tolist())
+
+    def test_minimum_and_maximum(self):
+        self.assertMatchesValidator(
+            jsch.Integer(minimum=0, maximum=10), [-1, 0, 5, 10, 11]
+        )
+
+    def test_exclusive_bounds(self):
+        self.assertMatchesValidator(
+            jsch.Number(
+                minimum=0, maximum=1, exclusive_minimum=True,
+                exclusive_maximum=True
+            ),
+            [0.0, 0.5, 1.0, 1e-300]
+        )
+
+    def test_integer_type_with_floats(self):
+        self.assertMatchesValidator(jsch.Integer(), [1.0, 1.5, -2.0])
+
+    def test_rejects_non_finite_floats(self):
+        numpy = NUMPY
+        mask = jsch.column_mask(
+            jsch.Number(), numpy.array([1.0, numpy.nan, numpy.inf])
+        )
+        self.assertEqual([True, False, False], mask.tolist())
+
+    def test_integer_multiple_of(self):
+        self.assertMatchesValidator(
+            jsch.Integer(multiple_of=3), list(range(-6, 7))
+        )
+
+    def test_float_multiple_of(self):
+        values = [0.3, 0.35, 0.7, 1.1, 2.0, 4.4, 1e-17]
+        self.assertMatchesValidator(jsch.Number(multiple_of=0.1), values)
+
+    def test_enum(self):
+        self.assertMatchesValidator(
+            jsch.Number(enum=[1, 2.5, 'a', None]), [1.0, 2.5, 3.0, 1.5]
+        )
+
+    def test_boolean_enum_values_ignored(self):
+        self.assertMatchesValidator(
+            jsch.Schema(enum=[True, 2]), [1, 2]
+        )
+
+    def test_type_without_numbers(self):
+        self.assertMatchesValidator(jsch.String(), [1, 2])
+
+    def test_boolean_array(self):
+        numpy = NUMPY
+        values = numpy.array([True, False])
+        self.assertEqual(
+            [False, False], jsch.column_mask(jsch.Integer(), values).tolist()
+        )
+        self.assertEqual(
+            [True, True], jsch.column_mask(jsch.Boolean(), values).tolist()
+        )
+
+    def test_boolean_array_enum(self):
+        numpy = NUMPY
+        values = numpy.array([True, False])
+        for enum in ([True], [False], [1, 0], [None]):
+            schema = jsch.Schema(enum=enum)
+            validator = jsch.compile_schema(schema)
+            self.assertEqual(
+                [validator.is_valid(value) for value in values.tolist()],
+                jsch.column_mask(schema, values).tolist()
+            )
+
+    def test_invalid_indices(self):
+        indices = jsch.invalid_indices(
+            jsch.Integer(maximum=5), NUMPY.arange(10)
+        )
+        self.assertEqual([6, 7, 8, 9], indices.tolist())
+
+    def test_buffer_protocol_array(self):
+        values = array.array('d', [1.0, 2.5, 7.0])
+        self.assertEqual(
+            [0, 2],
+            jsch.invalid_indices(jsch.Number(minimum=2, maximum=5), values)
+            .tolist()
+        )
+
+    def test_is_valid(self):
+        validator = jsch.ColumnValidator(jsch.Integer(minimum=0))
+        self.assertTrue(validator.is_valid(NUMPY.arange(5)))
+        self.assertFalse(validator.is_valid(NUMPY.arange(-1, 5)))
+
+    def test_rejects_non_numeric_array(self):
+        message = "^'values' must be a numeric array$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.column_mask(jsch.Number(), NUMPY.array(['a']))
+
+    def test_rejects_unsupported_keyword(self):
+        message = "^'any_of' is not supported for column validation$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.ColumnValidator(jsch.Schema(any_of=[jsch.Integer()]))
+
+
+@unittest.skipIf(NUMPY is not None, 'numpy is installed')
+class TestColumnValidatorWithoutNumpy(unittest.TestCase):
+    def test_raises(self):
+        message = "^'ColumnValidator' requires numpy to be installed$"
+        with self.assertRaisesRegex(ImportError, message):
+            jsch.ColumnValidator(jsch.Integer())
+
+
+SCHEMA = jsch.Object(
+    properties={
+        'id': jsch.Integer(minimum=1),
+        'price': jsch.Number(maximum=100, multiple_of=0.01),
+        'paid': jsch.Boolean(default=True),
+        'code': jsch.String(max_length=4, pattern='^[A-Z]+$')
+    },
+    required=['id', 'price']
+)
+
+
+@unittest.skipIf(NUMPY is None, 'numpy is not installed')
+class TestStructuredDtype(unittest.TestCase):
+    def test_derives_fields(self):
+        dtype = jsch.structured_dtype(SCHEMA)
+        self.assertEqual(['id', 'price', 'paid', 'code'], list(dtype.names))
+        self.assertEqual('<i8', dtype['id'].str)
+        self.assertEqual('<f8', dtype['price'].str)
+        self.assertEqual('|b1', dtype['paid'].str)
+        self.assertEqual('<U4', dtype['code'].str)
+
+    def test_string_needs_max_length(self):
+        message = "^property 'a' must have a 'max_length'$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.structured_dtype(jsch.Object(properties={'a': jsch.String()}))
+
+    def test_rejects_nested_object(self):
+        message = "^property 'a' must have 'type' 'boolean', 'integer', "
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.structured_dtype(jsch.Object(properties={'a': jsch.Object()}))
+
+    def test_rejects_type_list(self):
+        message = "^property 'a' must have 'type'"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.structured_dtype(jsch.Object(
+                properties={'a': jsch.Schema(type=['integer', 'null'])}
+            ))
+
+    def test_rejects_unsupported_object_keyword(self):
+        message = "^'min_properties' is not supported for structured layouts$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.structured_dtype(jsch.Object(
+                properties={'a': jsch.Integer()}, min_properties=1
+            ))
+
+    def test_requires_properties(self):
+        message = "^'schema' must be an object schema with 'properties'$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.structured_dtype(jsch.Integer())
+
+
+@unittest.skipIf(NUMPY is None, 'numpy is not installed')
+class TestLoadNdjson(unittest.TestCase):
+    def load(self, text, count=None):
+        return jsch.load_ndjson(SCHEMA, io.StringIO(text), count)
+
+    def assertLoadError(self, text, message):
+        with self.assertRaises(jsch.ValidationError) as context:
+            self.load(text)
+        self.assertEqual(message, str(context.exception))
+
+    def test_loads_records(self):
+        array = self.load(
+            '{"id": 1, "price": 2.5, "paid": false, "code": "AB"}\n'
+            '\n'
+            '{"id": 2, "price": 3}\n'
+        )
+        self.assertEqual(jsch.structured_dtype(SCHEMA), array.dtype)
+        self.assertEqual(
+            [(1, 2.5, False, 'AB'), (2, 3.0, True, '')], array.tolist()
+        )
+
+    def test_grows_beyond_count(self):
+        text = ''.join(
+            '{{"id": {0}, "price": 1}}\n'.format(index + 1)
+            for index in range(columnar.INITIAL_CAPACITY + 5)
+        )
+        array = self.load(text, count=2)
+        self.assertEqual(columnar.INITIAL_CAPACITY + 5, len(array))
+        self.assertEqual(
+            list(range(1, columnar.INITIAL_CAPACITY + 6)),
+            array['id'].tolist()
+        )
+
+    def test_loads_bytes_lines(self):
+        array = jsch.load_ndjson(
+            SCHEMA, io.BytesIO(b'{"id": 1, "price": 1}\n')
+        )
+        self.assertEqual([1], array['id'].tolist())
+
+    def test_missing_required(self):
+        self.assertLoadError(
+            '{"id": 1, "price": 1}\n{"id": 2}\n',
+            "'#/1' must have property 'price'"
+        )
+
+    def test_wrong_type(self):
+        self.assertLoadError(
+            '{"id": "a", "price": 1}\n',
+            "'#/0/id' must be of type 'integer'"
+        )
+
+    def test_null_value(self):
+        self.assertLoadError(
+            '{"id": 1, "price": 1, "paid": null}\n',
+            "'#/0/paid' must be of type 'boolean'"
+        )
+
+    def test_string_constraints(self):
+        self.assertLoadError(
+            '{"id": 1, "price": 1, "code": "abc"}\n',
+            "'#/0/code' must match pattern '^[A-Z]+$'"
+        )
+
+    def test_column_constraints(self):
+        self.assertLoadError(
+            '{"id": 1, "price": 1}\n{"id": 1, "price": 1.005}\n',
+            "'#/1/price' must be a multiple of 0.01"
+        )
+
+    def test_reports_first_invalid_record(self):
+        self.assertLoadError(
+            '{"id": 1, "price": 1}\n{"id": 0, "price": 1}\n'
+            '{"id": "a", "price": 1}\n',
+            "'#/1/id' must be greater than or equal to 1"
+        )
+
+    def test_missing_optional_not_range_checked(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Integer(minimum=5)}
+        )
+        array = jsch.load_ndjson(schema, ['{}\n'])
+        self.assertEqual([0], array['a'].tolist())
+
+    def test_integer_out_of_range(self):
+        self.assertLoadError(
+            '{"id": 18446744073709551616, "price": 1}\n',
+            "'#/0/id' must fit in a 64-bit integer"
+        )
+
+    def test_additional_properties(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Integer()}, additional_properties=False
+        )
+        with self.assertRaisesRegex(
+                jsch.ValidationError,
+                "^'#/0' must not have additional property 'b'$"):
+            jsch.load_ndjson(schema, ['{"a": 1, "b": 2}'])
+
+    def test_record_not_object(self):
+        self.assertLoadError('[1]\n', "'#/0' must be of type 'object'")
+
+    def test_boolean_enum(self):
+        schema = jsch.Object(properties={'a': jsch.Boolean(enum=[True])})
+        self.assertEqual(
+            [True], jsch.load_ndjson(schema, ['{"a": true}'])['a'].tolist()
+        )
+        with self.assertRaisesRegex(
+                jsch.ValidationError, "^'#/1/a' must be one of .*$"):
+            jsch.load_ndjson(schema, ['{"a": true}', '{"a": false}'])
@@ -0,0 +1,115 @@
+import io
+import threading
+import unittest
+
+import jsch
+from jsch.schema import publish_once
+
+
+THREADS = 8
+
+
+def run_threads(function):
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+    errors = []
+
+    def target(index):
+        barrier.wait()
+        try:
+            results[index] = function()
+        except Exception as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=target, args=(index,))
+        for index in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def make_schema():
+    return jsch.Object(properties={
+        'count': jsch.Integer(default=0),
+        'tags': jsch.Array(items=jsch.String(), default=[])
+    })
+
+
+class TestPublishOnce(unittest.TestCase):
+    def test_publishes_value(self):
+        schema = jsch.Schema()
+        value = publish_once(schema, '_value', lambda: [1])
+        self.assertEqual([1], value)
+        self.assertIs(value, publish_once(schema, '_value', lambda: [2]))
+
+    def test_threads_share_published_value(self):
+        schema = jsch.Schema()
+        results = run_threads(
+            lambda: publish_once(schema, '_value', lambda: object())
+        )
+        for result in results:
+            self.assertIs(results[0], result)
+
+
+class TestSharedSchemas(unittest.TestCase):
+    def test_fingerprint(self):
+        schema = make_schema()
+        results = run_threads(lambda: jsch.fingerprint(schema))
+        self.assertEqual({jsch.fingerprint(schema)}, set(results))
+
+    def test_defaults_template(self):
+        schema = make_schema()
+        results = run_threads(
+            lambda: (jsch.apply_defaults(schema, {}),
+                     schema._defaults_template)
+        )
+        for document, template in results:
+            self.assertEqual({'count': 0, 'tags': []}, document)
+            self.assertIs(results[0][1], template)
+
+    def test_coercer(self):
+        schema = make_schema()
+        results = run_threads(
+            lambda: (jsch.coerce(schema, {'count': '3'}), schema._coercer)
+        )
+        for document, coercer in results:
+            self.assertEqual({'count': 3}, document)
+            self.assertIs(results[0][1], coercer)
+
+    def test_validator(self):
+        validator = jsch.compile_schema(make_schema())
+        results = run_threads(lambda: [
+            validator.is_valid({'count': index}) and
+            not validator.is_valid({'count': 'x'})
+            for index in range(200)
+        ])
+        for result in results:
+            self.assertTrue(all(result))
+
+    def test_snapshot(self):
+        fp = io.BytesIO()
+        jsch.dump_snapshot({'schema': make_schema()}, fp)
+        snapshot = jsch.loads_snapshot(fp.getvalue())
+        results = run_threads(lambda: (
+            snapshot['schema'], snapshot['schema']._dict['properties']
+        ))
+        for schema, properties in results:
+            self.assertIs(results[0][0], schema)
+            self.assertIs(results[0][1], properties)
+
+    def test_memo(self):
+        memo = jsch.ValidationMemo(max_entries=4)
+        validator = jsch.compile_memoized(make_schema(), memo)
+        results = run_threads(lambda: [
+            validator.is_valid({'count': index % 10})
+            for index in range(500)
+        ])
+        for result in results:
+            self.assertTrue(all(result))
+        self.assertLessEqual(len(memo), 4)
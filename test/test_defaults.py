@@ -0,0 +1,129 @@
+import unittest
+
+import jsch
+
+
+class TestApplyDefaults(unittest.TestCase):
+    def test_fills_missing_property(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Integer(default=1), 'b': jsch.Integer()
+        })
+        self.assertEqual({'a': 1}, jsch.apply_defaults(schema, {}))
+
+    def test_fills_null_default(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Schema(default=None),
+            'b': jsch.Object(properties={'c': jsch.Schema(default=None)})
+        })
+        self.assertEqual(
+            {'a': None, 'b': {'c': None}},
+            jsch.apply_defaults(schema, {'b': {}})
+        )
+        schema = jsch.Schema.fromjson('{"properties":{"a":{"default":null}}}')
+        self.assertEqual({'a': None}, jsch.apply_defaults(schema, {}))
+
+    def test_keeps_present_property(self):
+        schema = jsch.Object(properties={'a': jsch.Integer(default=1)})
+        self.assertEqual({'a': 2}, jsch.apply_defaults(schema, {'a': 2}))
+
+    def test_fills_in_place(self):
+        schema = jsch.Object(properties={'a': jsch.Integer(default=1)})
+        document = {}
+        self.assertIs(document, jsch.apply_defaults(schema, document))
+        self.assertEqual({'a': 1}, document)
+
+    def test_copies_mutable_defaults(self):
+        schema = jsch.Object(properties={
+            'tags': jsch.Array(default=['a']),
+            'meta': jsch.Object(default={'b': [1]})
+        })
+        first = jsch.apply_defaults(schema, {})
+        first['tags'].append('b')
+        first['meta']['b'].append(2)
+        self.assertEqual(
+            {'tags': ['a'], 'meta': {'b': [1]}},
+            jsch.apply_defaults(schema, {})
+        )
+        self.assertEqual(['a'], schema.properties['tags'].default)
+
+    def test_shares_immutable_defaults(self):
+        schema = jsch.Object(properties={'a': jsch.String(default='x')})
+        self.assertIs(
+            schema.properties['a'].default,
+            jsch.apply_defaults(schema, {})['a']
+        )
+
+    def test_fills_nested_objects(self):
+        schema = jsch.Object(properties={'a': jsch.Object(
+            properties={'b': jsch.Integer(default=1)}
+        )})
+        self.assertEqual(
+            {'a': {'b': 1}}, jsch.apply_defaults(schema, {'a': {}})
+        )
+        self.assertEqual({}, jsch.apply_defaults(schema, {}))
+
+    def test_fills_nested_defaults_within_default(self):
+        schema = jsch.Object(properties={'a': jsch.Object(
+            properties={'b': jsch.Integer(default=1)}, default={}
+        )})
+        self.assertEqual({'a': {'b': 1}}, jsch.apply_defaults(schema, {}))
+
+    def test_fills_array_items(self):
+        schema = jsch.Array(items=jsch.Object(
+            properties={'a': jsch.Integer(default=1)}
+        ))
+        self.assertEqual(
+            [{'a': 1}, {'a': 2}, 3],
+            jsch.apply_defaults(schema, [{}, {'a': 2}, 3])
+        )
+
+    def test_fills_tuple_items(self):
+        schema = jsch.Array(items=[
+            jsch.Integer(),
+            jsch.Object(properties={'a': jsch.Integer(default=1)})
+        ])
+        self.assertEqual([{}, {'a': 1}], jsch.apply_defaults(schema, [{}, {}]))
+
+    def test_fills_all_of_and_ref(self):
+        schema = jsch.Object(
+            definitions={'base': jsch.Object(
+                properties={'a': jsch.Integer(default=1)}
+            )},
+            all_of=[
+                jsch.Schema(ref='#/definitions/base'),
+                jsch.Object(properties={'b': jsch.Integer(default=2)})
+            ]
+        )
+        self.assertEqual({'a': 1, 'b': 2}, jsch.apply_defaults(schema, {}))
+
+    def test_recursive_schema(self):
+        schema = jsch.Object(properties={
+            'value': jsch.Integer(default=0),
+            'child': jsch.Schema(ref='#')
+        })
+        self.assertEqual(
+            {'value': 0, 'child': {'value': 0, 'child': {'value': 5}}},
+            jsch.apply_defaults(schema, {'child': {'child': {'value': 5}}})
+        )
+
+    def test_ignores_non_matching_types(self):
+        schema = jsch.Object(properties={'a': jsch.Integer(default=1)})
+        self.assertEqual([1], jsch.apply_defaults(schema, [1]))
+
+    def test_template_prunes_paths_without_defaults(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Object(properties={'b': jsch.Integer()}),
+            'c': jsch.Integer(default=1)
+        })
+        template = jsch.DefaultsTemplate(schema)
+        self.assertIsNone(template.compile(schema.properties['a']))
+        self.assertIsNone(
+            jsch.DefaultsTemplate(jsch.Array(items=jsch.Integer())).fill
+        )
+
+    def test_template_cached_on_schema(self):
+        schema = jsch.Object(properties={'a': jsch.Integer(default=1)})
+        jsch.apply_defaults(schema, {})
+        template = schema._defaults_template
+        jsch.apply_defaults(schema, {})
+        self.assertIs(template, schema._defaults_template)
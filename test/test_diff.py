@@ -0,0 +1,159 @@
+import unittest
+
+import jsch
+
+
+class DiffTestCase(unittest.TestCase):
+    def assertChanges(self, old, new, expected):
+        actual = [
+            (change.pointer, change.key, change.backward_compatible,
+             change.forward_compatible)
+            for change in jsch.diff(old, new)
+        ]
+        self.assertEqual(expected, actual)
+
+
+class TestDiff(DiffTestCase):
+    def test_no_changes_for_identical_schemas(self):
+        schema = jsch.Object(properties={'a': jsch.Integer()})
+        self.assertEqual([], jsch.diff(schema, schema))
+
+    def test_no_changes_for_equivalent_schemas(self):
+        old = jsch.Object(
+            required=['a', 'b'], properties={'a': jsch.Number(maximum=1)}
+        )
+        new = jsch.Object(
+            required=['b', 'a'], properties={'a': jsch.Number(maximum=1.0)}
+        )
+        self.assertEqual([], jsch.diff(old, new))
+
+    def test_skips_unchanged_sub_schemas(self):
+        shared = jsch.Object(properties={'a': jsch.Integer()})
+        jsch.fingerprint(shared)
+        shared._fingerprint = 'cached'
+        old = jsch.Object(properties={'x': shared, 'y': jsch.String()})
+        new = jsch.Object(properties={'x': shared, 'y': jsch.Integer()})
+        self.assertChanges(old, new, [
+            ('#/properties/y/type', 'type', False, False)
+        ])
+
+    def test_no_changes_for_vacuous_defaults(self):
+        pairs = [
+            (jsch.Number(maximum=5, exclusive_maximum=False),
+             jsch.Number(maximum=5)),
+            (jsch.Number(minimum=5), jsch.Number(
+                minimum=5, exclusive_minimum=False
+            )),
+            (jsch.Object(additional_properties=True), jsch.Object()),
+            (jsch.Array(unique_items=False, min_items=0), jsch.Array()),
+            (jsch.String(min_length=0), jsch.String())
+        ]
+        for old, new in pairs:
+            with self.subTest(old=old.asjson()):
+                self.assertEqual([], jsch.diff(old, new))
+
+    def test_vacuous_default_to_constraint(self):
+        old = jsch.Number(maximum=5, exclusive_maximum=False)
+        new = jsch.Number(maximum=5, exclusive_maximum=True)
+        self.assertChanges(old, new, [
+            ('#/exclusiveMaximum', 'exclusive_maximum', False, True)
+        ])
+
+    def test_added_required_is_not_backward_compatible(self):
+        old = jsch.Object(required=['a'])
+        new = jsch.Object(required=['a', 'b'])
+        self.assertChanges(old, new, [('#/required', 'required', False, True)])
+
+    def test_removed_required_is_backward_compatible(self):
+        old = jsch.Object(required=['a', 'b'])
+        new = jsch.Object()
+        self.assertChanges(old, new, [('#/required', 'required', True, False)])
+
+    def test_tightened_maximum(self):
+        old = jsch.Object(properties={'a': jsch.Integer(maximum=10)})
+        new = jsch.Object(properties={'a': jsch.Integer(maximum=5)})
+        self.assertChanges(old, new, [
+            ('#/properties/a/maximum', 'maximum', False, True)
+        ])
+
+    def test_loosened_min_length(self):
+        old = jsch.String(min_length=5)
+        new = jsch.String(min_length=2)
+        self.assertChanges(old, new, [
+            ('#/minLength', 'min_length', True, False)
+        ])
+
+    def test_removed_enum_value(self):
+        old = jsch.String(enum=['a', 'b'])
+        new = jsch.String(enum=['a'])
+        self.assertChanges(old, new, [('#/enum', 'enum', False, True)])
+
+    def test_added_enum_value(self):
+        old = jsch.String(enum=['a'])
+        new = jsch.String(enum=['a', 'b'])
+        self.assertChanges(old, new, [('#/enum', 'enum', True, False)])
+
+    def test_widened_type(self):
+        old = jsch.Integer()
+        new = jsch.Schema(type=['number', 'null'])
+        self.assertChanges(old, new, [('#/type', 'type', True, False)])
+
+    def test_annotation_change_is_compatible(self):
+        old = jsch.String(title='a', description='b')
+        new = jsch.String(title='c', description='b')
+        self.assertChanges(old, new, [('#/title', 'title', True, True)])
+
+    def test_added_property(self):
+        old = jsch.Object(properties={'a': jsch.Integer()})
+        new = jsch.Object(properties={'a': jsch.Integer(), 'b': jsch.String()})
+        self.assertChanges(old, new, [
+            ('#/properties/b', 'properties', False, True)
+        ])
+
+    def test_additional_properties_disallowed(self):
+        old = jsch.Object()
+        new = jsch.Object(additional_properties=False)
+        self.assertChanges(old, new, [
+            ('#/additionalProperties', 'additional_properties', False, True)
+        ])
+
+    def test_any_of_branch_added(self):
+        old = jsch.Schema(any_of=[jsch.Integer()])
+        new = jsch.Schema(any_of=[jsch.Integer(), jsch.String()])
+        self.assertChanges(old, new, [('#/anyOf/1', 'any_of', True, False)])
+
+    def test_not_inverts_compatibility(self):
+        old = jsch.Schema(not_=jsch.Integer(maximum=10))
+        new = jsch.Schema(not_=jsch.Integer(maximum=5))
+        self.assertChanges(old, new, [
+            ('#/not/maximum', 'maximum', True, False)
+        ])
+
+    def test_one_of_changes_are_incompatible(self):
+        old = jsch.Schema(one_of=[jsch.Integer(maximum=10), jsch.String()])
+        new = jsch.Schema(one_of=[jsch.Integer(maximum=5), jsch.String()])
+        self.assertChanges(old, new, [
+            ('#/oneOf/0/maximum', 'maximum', False, False)
+        ])
+
+    def test_multiple_of(self):
+        self.assertChanges(
+            jsch.Integer(multiple_of=2), jsch.Integer(multiple_of=4),
+            [('#/multipleOf', 'multiple_of', False, True)]
+        )
+        self.assertChanges(
+            jsch.Integer(multiple_of=4), jsch.Integer(multiple_of=2),
+            [('#/multipleOf', 'multiple_of', True, False)]
+        )
+        self.assertChanges(
+            jsch.Integer(multiple_of=2), jsch.Integer(multiple_of=3),
+            [('#/multipleOf', 'multiple_of', False, False)]
+        )
+
+    def test_dependencies(self):
+        old = jsch.Object(dependencies={'a': ['b']})
+        new = jsch.Object(dependencies={'a': ['b', 'c'], 'd': ['e']})
+        self.assertChanges(old, new, [
+            ('#/dependencies/a', 'dependencies', False, True),
+            ('#/dependencies/d', 'dependencies', False, True)
+        ])
@@ -0,0 +1,147 @@
+import unittest
+
+import jsch
+from jsch import formats
+
+
+class FormatTestCase(unittest.TestCase):
+    def assertFormat(self, name, valid, invalid):
+        checker = formats.format_checker(name)
+        for value in valid:
+            with self.subTest(value=value):
+                self.assertTrue(checker(value))
+        for value in invalid:
+            with self.subTest(value=value):
+                self.assertFalse(checker(value))
+
+
+class TestBuiltinFormats(FormatTestCase):
+    def test_date_time(self):
+        self.assertFormat('date-time', [
+            '2024-02-29T12:30:00Z',
+            '1999-12-31t23:59:60.123+05:30',
+            '2001-01-01 00:00:00-00:00'
+        ], [
+            '2023-02-29T12:30:00Z', '2024-13-01T00:00:00Z',
+            '2024-01-01T24:00:00Z', '2024-01-01T00:00:00',
+            '2024-01-01', '2024-01-01T00:00:00Z\n',
+            '२०२४-01-01T00:00:00Z'
+        ])
+
+    def test_date(self):
+        self.assertFormat('date', ['2000-02-29', '2024-12-31'], [
+            '1900-02-29', '2024-04-31', '2024-1-01', '2024-01-01T00:00:00Z'
+        ])
+
+    def test_time(self):
+        self.assertFormat('time', ['23:59:59Z', '00:00:00.5+01:00'], [
+            '24:00:00Z', '12:60:00Z', '12:00:00', '12:00:00+24:00'
+        ])
+
+    def test_email(self):
+        self.assertFormat('email', [
+            'ada@example.com', 'first.last+tag@mail.example.org',
+            'root@localhost'
+        ], [
+            'ada', 'ada@', '@example.com', 'a b@example.com',
+            'ada@-example.com', 'ada@example..com'
+        ])
+
+    def test_hostname(self):
+        self.assertFormat('hostname', [
+            'example.com', 'a-b.example.com', 'localhost', 'example.com.'
+        ], [
+            '-example.com', 'example-.com', 'exa_mple.com', '',
+            'a' * 64 + '.com', '.'.join(['a'] * 128)
+        ])
+
+    def test_ipv4(self):
+        self.assertFormat('ipv4', ['0.0.0.0', '192.168.1.255'], [
+            '256.0.0.1', '1.2.3', '01.2.3.4', '1.2.3.4.5', '1.2.3.4 '
+        ])
+
+    def test_ipv6(self):
+        self.assertFormat('ipv6', [
+            '::', '::1', '1::', 'fe80::1:2', '2001:db8:0:0:0:0:2:1',
+            '::ffff:192.168.1.1', '1:2:3:4:5:6:1.2.3.4'
+        ], [
+            '', ':', ':::', '1:2', '1::2::3', '12345::', 'g::1',
+            '1:2:3:4:5:6:7:8:9', '1::2:3:4:5:6:7:8', '::1.2.3.256',
+            '1.2.3.4::'
+        ])
+
+    def test_uri(self):
+        self.assertFormat('uri', [
+            'http://example.com/a?b=c#d', 'urn:isbn:0451450523',
+            'mailto:ada@example.com'
+        ], [
+            'example.com', '/relative/path', 'http://exa mple.com',
+            '1http://example.com'
+        ])
+
+    def test_uuid(self):
+        self.assertFormat('uuid', [
+            '123e4567-e89b-12d3-a456-426614174000',
+            '123E4567-E89B-12D3-A456-426614174000'
+        ], [
+            '123e4567e89b12d3a456426614174000',
+            '123e4567-e89b-12d3-a456-42661417400g',
+            '{123e4567-e89b-12d3-a456-426614174000}'
+        ])
+
+
+class TestFormatValidation(unittest.TestCase):
+    def test_fails_when_not_in_format(self):
+        validator = jsch.compile_schema(jsch.String(format='uuid'))
+        self.assertFalse(validator.is_valid('not-a-uuid'))
+        with self.assertRaisesRegex(
+                jsch.ValidationError, "^'#' must be of format 'uuid'$"):
+            validator.validate('not-a-uuid')
+
+    def test_ignores_other_types(self):
+        validator = jsch.compile_schema(jsch.Schema(format='ipv4'))
+        self.assertTrue(validator.is_valid(1))
+        self.assertTrue(validator.is_valid(None))
+
+    def test_ignores_unknown_formats(self):
+        validator = jsch.compile_schema(jsch.String(format='unknown'))
+        self.assertTrue(validator.is_valid('anything'))
+
+    def test_array_of_formatted_strings(self):
+        schema = jsch.Array(items=jsch.String(format='date'))
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(['2024-01-01', '2024-01-02']))
+        self.assertEqual(
+            "'#/1' must be of format 'date'",
+            str(validator.first_error(['2024-01-01', '2024-02-30']))
+        )
+
+
+class TestRegisterFormat(unittest.TestCase):
+    def tearDown(self):
+        formats.FORMAT_CHECKERS.pop('even-length', None)
+
+    def test_custom_format(self):
+        jsch.register_format('even-length', lambda value: len(value) % 2 == 0)
+        validator = jsch.compile_schema(jsch.String(format='even-length'))
+        self.assertTrue(validator.is_valid('ab'))
+        self.assertFalse(validator.is_valid('abc'))
+
+    def test_format_is_resolved_when_compiled(self):
+        validator = jsch.compile_schema(jsch.String(format='even-length'))
+        jsch.register_format('even-length', lambda value: len(value) % 2 == 0)
+        self.assertTrue(validator.is_valid('abc'))
+        validator = jsch.compile_schema(jsch.String(format='even-length'))
+        self.assertFalse(validator.is_valid('abc'))
+
+    def test_fails_when_name_not_str(self):
+        with self.assertRaisesRegex(TypeError, "^'name' must be a str$"):
+            jsch.register_format(1, lambda value: True)
+
+    def test_fails_when_checker_not_callable(self):
+        with self.assertRaisesRegex(TypeError, "^'checker' must be callable$"):
+            jsch.register_format('even-length', 'checker')
+
+
+if __name__ == '__main__':
+    unittest.main()
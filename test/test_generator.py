@@ -0,0 +1,138 @@
+import io
+import json
+import unittest
+
+import jsch
+from jsch import columnar
+
+
+NUMPY = columnar.import_numpy()
+
+SCHEMA = jsch.Object(
+    definitions={'node': jsch.Object(
+        properties={
+            'value': jsch.Integer(),
+            'children': jsch.Array(
+                items=jsch.Schema(ref='#/definitions/node')
+            )
+        },
+        required=['value']
+    )},
+    properties={
+        'id': jsch.Integer(minimum=1, multiple_of=3),
+        'price': jsch.Number(
+            minimum=0, maximum=100, exclusive_minimum=True
+        ),
+        'step': jsch.Number(minimum=0.5, maximum=10, multiple_of=0.25),
+        'cost': jsch.Number(minimum=0, maximum=1000, multiple_of=0.01),
+        'rate': jsch.Integer(minimum=-3, maximum=20, multiple_of=0.5),
+        'name': jsch.String(min_length=2, max_length=10),
+        'kind': jsch.Schema(enum=['a', 'b', [1]]),
+        'tags': jsch.Array(items=jsch.String(), min_items=1, max_items=5),
+        'pair': jsch.Array(
+            items=[jsch.Integer(), jsch.Boolean()], additional_items=False
+        ),
+        'maybe': jsch.Schema(type=['null', 'integer']),
+        'tree': jsch.Schema(ref='#/definitions/node')
+    },
+    required=['id', 'name', 'extra']
+)
+
+
+class TestDocumentGenerator(unittest.TestCase):
+    def assertConforms(self, schema, documents):
+        validator = jsch.compile_schema(schema)
+        for document in documents:
+            self.assertEqual([], validator.errors(document), document)
+
+    def test_batch_conforms(self):
+        documents = jsch.DocumentGenerator(SCHEMA, seed=1).batch(500)
+        self.assertEqual(500, len(documents))
+        self.assertConforms(SCHEMA, documents)
+
+    def test_generate_conforms(self):
+        document_generator = jsch.DocumentGenerator(SCHEMA, seed=2)
+        self.assertConforms(
+            SCHEMA, [document_generator.generate() for _ in range(50)]
+        )
+
+    def test_required_properties_always_present(self):
+        for document in jsch.DocumentGenerator(SCHEMA, seed=3).batch(100):
+            self.assertTrue({'id', 'name', 'extra'} <= set(document))
+
+    def test_optional_properties_sometimes_present(self):
+        documents = jsch.DocumentGenerator(SCHEMA, seed=4).batch(100)
+        present = sum('price' in document for document in documents)
+        self.assertTrue(0 < present < 100)
+
+    def test_seed_is_reproducible(self):
+        a = jsch.DocumentGenerator(SCHEMA, seed=5).batch(20)
+        b = jsch.DocumentGenerator(SCHEMA, seed=5).batch(20)
+        c = jsch.DocumentGenerator(SCHEMA, seed=6).batch(20)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_infers_type(self):
+        schema = jsch.Schema(properties={'a': jsch.Schema(maximum=-5)})
+        document = jsch.DocumentGenerator(schema, seed=7).generate()
+        self.assertIsInstance(document, dict)
+        self.assertConforms(schema, [document])
+
+    def test_enum_containers_are_copied(self):
+        schema = jsch.Schema(enum=[[1]])
+        documents = jsch.DocumentGenerator(schema, seed=8).batch(2)
+        documents[0].append(2)
+        self.assertEqual([[1, 2], [1]], documents)
+
+    def test_unsatisfiable_range(self):
+        message = "^'maximum' must allow at least one value$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.DocumentGenerator(jsch.Integer(
+                minimum=1, maximum=1, exclusive_maximum=True
+            ))
+
+    def test_unsatisfiable_multiple_of(self):
+        message = "^'multiple_of' must allow at least one value$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.DocumentGenerator(jsch.Integer(
+                minimum=1, maximum=4, multiple_of=5
+            ))
+
+    def test_iter_batches(self):
+        document_generator = jsch.DocumentGenerator(SCHEMA, seed=9)
+        sizes = [
+            len(batch) for batch in document_generator.iter_batches(25, 10)
+        ]
+        self.assertEqual([10, 10, 5], sizes)
+
+    def test_dump_ndjson(self):
+        fp = io.StringIO()
+        jsch.DocumentGenerator(SCHEMA, seed=10).dump_ndjson(fp, 30, 7)
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(30, len(lines))
+        self.assertConforms(SCHEMA, [json.loads(line) for line in lines])
+        self.assertTrue(fp.getvalue().endswith('\n'))
+
+
+@unittest.skipIf(NUMPY is None, 'numpy is not installed')
+class TestNumpyDocumentGenerator(unittest.TestCase):
+    def test_batch_conforms(self):
+        documents = jsch.DocumentGenerator(
+            SCHEMA, seed=1, use_numpy=True
+        ).batch(500)
+        validator = jsch.compile_schema(SCHEMA)
+        for document in documents:
+            self.assertTrue(validator.is_valid(document), document)
+
+    def test_seed_is_reproducible(self):
+        a = jsch.DocumentGenerator(SCHEMA, seed=5, use_numpy=True).batch(20)
+        b = jsch.DocumentGenerator(SCHEMA, seed=5, use_numpy=True).batch(20)
+        self.assertEqual(a, b)
+
+
+@unittest.skipIf(NUMPY is not None, 'numpy is installed')
+class TestNumpyNotInstalled(unittest.TestCase):
+    def test_raises(self):
+        message = "^'use_numpy' requires numpy to be installed$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.DocumentGenerator(SCHEMA, use_numpy=True)
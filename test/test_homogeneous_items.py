@@ -0,0 +1,173 @@
+import unittest
+
+import jsch
+from jsch.validator import compile_homogeneous_test
+
+
+class TestHomogeneousTest(unittest.TestCase):
+    def test_applies_to_simple_item_schemas(self):
+        self.assertIsNotNone(compile_homogeneous_test(jsch.Integer()))
+        self.assertIsNotNone(
+            compile_homogeneous_test(jsch.String(max_length=3, title='a'))
+        )
+
+    def test_does_not_apply_to_other_keywords(self):
+        self.assertIsNone(compile_homogeneous_test(jsch.Integer(enum=[1])))
+        self.assertIsNone(
+            compile_homogeneous_test(jsch.Number(multiple_of=2))
+        )
+
+    def test_does_not_apply_without_a_single_type(self):
+        self.assertIsNone(compile_homogeneous_test(jsch.Schema()))
+        self.assertIsNone(
+            compile_homogeneous_test(jsch.Schema(type=['integer', 'null']))
+        )
+        self.assertIsNone(compile_homogeneous_test(jsch.Array()))
+
+    def test_rejects_lists_of_other_types(self):
+        test = compile_homogeneous_test(jsch.Integer())
+        self.assertTrue(test([1, 2, 3]))
+        self.assertFalse(test([1, True]))
+        self.assertFalse(test([1, 2.0]))
+
+
+class TestHomogeneousItems(unittest.TestCase):
+    def assertValid(self, schema, instance):
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(instance))
+        self.assertEqual([], validator.errors(instance))
+
+    def assertInvalid(self, schema, instance, message):
+        validator = jsch.compile_schema(schema)
+        self.assertFalse(validator.is_valid(instance))
+        self.assertEqual(message, str(validator.first_error(instance)))
+
+    def test_empty_array(self):
+        self.assertValid(jsch.Array(items=jsch.String(min_length=1)), [])
+
+    def test_integers(self):
+        schema = jsch.Array(items=jsch.Integer(minimum=0, maximum=9))
+        self.assertValid(schema, list(range(10)))
+        self.assertInvalid(schema, [1, 10], "'#/1' must be less than or "
+                           "equal to 9")
+        self.assertInvalid(schema, [1, -1], "'#/1' must be greater than or "
+                           "equal to 0")
+
+    def test_every_item_out_of_range(self):
+        schema = jsch.Array(items=jsch.Number(minimum=0, maximum=10))
+        self.assertInvalid(schema, [50], "'#/0' must be less than or "
+                           "equal to 10")
+        self.assertInvalid(schema, [-5], "'#/0' must be greater than or "
+                           "equal to 0")
+        self.assertEqual(1, len(jsch.compile_schema(schema).errors([50])))
+
+    def test_integers_accept_integral_floats(self):
+        schema = jsch.Array(items=jsch.Integer(maximum=9))
+        self.assertValid(schema, [1, 2.0])
+        self.assertInvalid(schema, [1, 2.5], "'#/1' must be of type "
+                           "'integer'")
+
+    def test_integers_reject_booleans(self):
+        schema = jsch.Array(items=jsch.Integer())
+        self.assertInvalid(schema, [1, True], "'#/1' must be of type "
+                           "'integer'")
+
+    def test_exclusive_bounds(self):
+        schema = jsch.Array(items=jsch.Number(
+            minimum=0, exclusive_minimum=True,
+            maximum=1, exclusive_maximum=True
+        ))
+        self.assertValid(schema, [0.5, 0.25])
+        self.assertInvalid(schema, [0.5, 1], "'#/1' must be less than 1")
+        self.assertInvalid(schema, [0, 0.5], "'#/0' must be greater than 0")
+
+    def test_numbers_reject_nan(self):
+        schema = jsch.Array(items=jsch.Number(maximum=1))
+        self.assertFalse(jsch.compile_schema(schema).is_valid(
+            [0.5, float('nan')]
+        ))
+
+    def test_strings(self):
+        schema = jsch.Array(items=jsch.String(
+            min_length=1, max_length=3, pattern='^[a-z]+$'
+        ))
+        self.assertValid(schema, ['a', 'abc'])
+        self.assertInvalid(schema, ['a', 'abcd'], "'#/1' must be at most 3 "
+                           "characters long")
+        self.assertInvalid(schema, ['', 'a'], "'#/0' must be at least 1 "
+                           "characters long")
+        self.assertInvalid(schema, ['a', 'A'], "'#/1' must match pattern "
+                           "'^[a-z]+$'")
+        self.assertInvalid(schema, ['a', 1], "'#/1' must be of type "
+                           "'string'")
+
+    def test_string_subclasses_are_checked_item_by_item(self):
+        class Name(str):
+            pass
+        schema = jsch.Array(items=jsch.String(max_length=3))
+        self.assertValid(schema, ['a', Name('b')])
+        self.assertInvalid(schema, [Name('abcd')], "'#/0' must be at most "
+                           "3 characters long")
+
+    def test_booleans_and_nulls(self):
+        self.assertValid(jsch.Array(items=jsch.Boolean()), [True, False])
+        self.assertValid(jsch.Array(items=jsch.Null()), [None, None])
+        self.assertInvalid(jsch.Array(items=jsch.Null()), [None, 0],
+                           "'#/1' must be of type 'null'")
+
+    def test_other_item_schemas_are_unchanged(self):
+        schema = jsch.Array(items=jsch.Integer(enum=[1, 2]))
+        self.assertValid(schema, [1, 2, 1])
+        self.assertInvalid(schema, [1, 3], "'#/1' must be one of the enum "
+                           "values")
+
+
+class TestTupleItems(unittest.TestCase):
+    def setUp(self):
+        self.schema = jsch.Array(
+            items=[jsch.String(), jsch.Integer()],
+            additional_items=jsch.Number(maximum=1)
+        )
+        self.validator = jsch.compile_schema(self.schema)
+
+    def test_passes_with_valid_additional_items(self):
+        self.assertTrue(self.validator.is_valid(['a', 1, 0.5, 1]))
+        self.assertTrue(self.validator.is_valid(['a']))
+
+    def test_fails_on_tuple_item(self):
+        self.assertFalse(self.validator.is_valid([1, 1, 0.5]))
+
+    def test_fails_on_additional_item(self):
+        instance = ['a', 1, 0.5, 2]
+        self.assertFalse(self.validator.is_valid(instance))
+        self.assertEqual(
+            "'#/3' must be less than or equal to 1",
+            str(self.validator.first_error(instance))
+        )
+
+    def test_fails_on_every_additional_item_out_of_range(self):
+        schema = jsch.Array(
+            items=[jsch.String()],
+            additional_items=jsch.Integer(minimum=0, maximum=10)
+        )
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(['a', 0, 10]))
+        self.assertFalse(validator.is_valid(['a', 99]))
+        self.assertFalse(validator.is_valid(['a', -1]))
+
+    def test_errors_are_in_index_order(self):
+        errors = self.validator.errors([1, 1, 2])
+        self.assertEqual(['#/0', '#/2'], [error.pointer for error in errors])
+
+    def test_forbidden_additional_items(self):
+        schema = jsch.Array(items=[jsch.String()], additional_items=False)
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(['a']))
+        self.assertEqual(
+            "'#' must not have additional items",
+            str(validator.first_error(['a', 'b']))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
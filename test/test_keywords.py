@@ -0,0 +1,147 @@
+import unittest
+
+import jsch
+from jsch.schema import validate_is_positive_int_or_zero
+from jsch.validator import fail
+
+
+def compile_max_bytes(schema, compiler):
+    max_bytes = schema.x_max_bytes
+    test = lambda instance: (
+        not isinstance(instance, str) or
+        len(instance.encode('utf-8')) <= max_bytes
+    )
+    return test, fail("must be at most {0} bytes long".format(max_bytes))
+
+
+class CustomKeywordTestCase(unittest.TestCase):
+    # Registers the keywords for each test class only, as they would
+    # otherwise change every schema in the rest of the test run.
+    @classmethod
+    def setUpClass(cls):
+        jsch.register_keyword(
+            'x_max_bytes', 'x-maxBytes',
+            validate=lambda kwargs:
+                validate_is_positive_int_or_zero('x_max_bytes', kwargs),
+            compile=compile_max_bytes
+        )
+        jsch.register_keyword('x_tenant_scoped', 'x-tenantScoped')
+
+    @classmethod
+    def tearDownClass(cls):
+        jsch.unregister_keyword('x_max_bytes')
+        jsch.unregister_keyword('x_tenant_scoped')
+
+
+class TestCustomKeywordSchema(CustomKeywordTestCase):
+    def test_read_property(self):
+        schema = jsch.String(x_max_bytes=4)
+        self.assertEqual(4, schema.x_max_bytes)
+        self.assertIsNone(jsch.String().x_max_bytes)
+
+    def test_validates_value(self):
+        message = "^'x_max_bytes' must be an int$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.String(x_max_bytes='4')
+
+    def test_default_validation_allows_primitive_types(self):
+        jsch.Schema(x_tenant_scoped=True)
+        message = "^'x_tenant_scoped' must be a primitive type$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.Schema(x_tenant_scoped=object())
+
+    def test_round_trips_through_json(self):
+        schema = jsch.String(x_max_bytes=4, x_tenant_scoped=True)
+        self.assertEqual(
+            '{"type":"string","x-maxBytes":4,"x-tenantScoped":true}',
+            schema.asjson()
+        )
+        self.assertEqual(schema, jsch.Schema.fromjson(schema.asjson()))
+
+    def test_fingerprint_includes_custom_keywords(self):
+        self.assertNotEqual(
+            jsch.fingerprint(jsch.String(x_max_bytes=4)),
+            jsch.fingerprint(jsch.String(x_max_bytes=5))
+        )
+
+    def test_diff_reports_custom_keywords_as_incompatible(self):
+        changes = jsch.diff(
+            jsch.String(x_max_bytes=4), jsch.String(x_max_bytes=5)
+        )
+        self.assertEqual(1, len(changes))
+        self.assertEqual('x_max_bytes', changes[0].key)
+
+
+class TestCustomKeywordValidation(CustomKeywordTestCase):
+    def test_checks_instances(self):
+        validator = jsch.compile_schema(jsch.String(x_max_bytes=4))
+        self.assertTrue(validator.is_valid('abcd'))
+        self.assertFalse(validator.is_valid('abcé'))
+        self.assertEqual(
+            "'#' must be at most 4 bytes long",
+            str(validator.first_error('abcé'))
+        )
+
+    def test_checks_items(self):
+        schema = jsch.Array(items=jsch.String(x_max_bytes=1))
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(['a', 'b']))
+        self.assertFalse(validator.is_valid(['a', 'é']))
+
+    def test_keyword_without_checker_is_not_validated(self):
+        validator = jsch.compile_schema(jsch.Schema(x_tenant_scoped=True))
+        self.assertEqual((), validator._tests)
+
+    def test_schemas_without_custom_keywords_are_unchanged(self):
+        validator = jsch.compile_schema(jsch.String(max_length=2))
+        self.assertEqual(2, len(validator._tests))
+
+
+class TestRegisterKeyword(CustomKeywordTestCase):
+    def test_fails_when_key_not_str(self):
+        with self.assertRaisesRegex(TypeError, "^'key' must be a str$"):
+            jsch.register_keyword(1, 'x-one')
+
+    def test_fails_when_key_not_identifier(self):
+        message = "^'key' must be an identifier$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.register_keyword('x-one', 'x-one')
+
+    def test_fails_when_keyword_not_str(self):
+        with self.assertRaisesRegex(TypeError, "^'keyword' must be a str$"):
+            jsch.register_keyword('x_one', 1)
+
+    def test_fails_when_key_in_use(self):
+        message = "^'key' must not already be in use$"
+        for key in ['max_length', 'x_max_bytes', 'asdict']:
+            with self.subTest(key=key):
+                with self.assertRaisesRegex(ValueError, message):
+                    jsch.register_keyword(key, 'x-one')
+
+    def test_fails_when_keyword_in_use(self):
+        message = "^'keyword' must not already be in use$"
+        with self.assertRaisesRegex(ValueError, message):
+            jsch.register_keyword('x_one', 'maxLength')
+
+
+class TestUnregisterKeyword(unittest.TestCase):
+    def test_removes_keyword(self):
+        jsch.register_keyword('x_one', 'x-one', compile=compile_max_bytes)
+        jsch.unregister_keyword('x_one')
+        schema = jsch.String(x_one=4)
+        self.assertEqual('{"type":"string"}', schema.asjson())
+        self.assertFalse(hasattr(schema, 'x_one'))
+        self.assertTrue(jsch.compile_schema(schema).is_valid('abcde'))
+        jsch.register_keyword('x_one', 'x-one')
+        jsch.unregister_keyword('x_one')
+
+    def test_fails_when_key_not_registered(self):
+        message = "^'key' must be a registered keyword$"
+        for key in ['max_length', 'x_unknown']:
+            with self.subTest(key=key):
+                with self.assertRaisesRegex(ValueError, message):
+                    jsch.unregister_keyword(key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+
+import jsch
+
+
+def make_schema():
+    device = jsch.Object(
+        properties={
+            'os': jsch.String(enum=['ios', 'android']),
+            'version': jsch.Integer(minimum=1)
+        },
+        required=['os']
+    )
+    return jsch.Array(items=jsch.Object(properties={
+        'device': device, 'count': jsch.Integer()
+    }))
+
+
+class TestValidationMemo(unittest.TestCase):
+    def test_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError) as context:
+            jsch.ValidationMemo(policy='random')
+        self.assertEqual(
+            "'policy' must be one of 'lru', 'fifo'", str(context.exception)
+        )
+
+    def test_rejects_empty_memo(self):
+        with self.assertRaises(ValueError):
+            jsch.ValidationMemo(max_entries=0)
+
+    def test_starts_empty(self):
+        memo = jsch.ValidationMemo()
+        self.assertEqual(0, len(memo))
+        self.assertEqual(0.0, memo.hit_rate)
+
+
+class TestCompileMemoized(unittest.TestCase):
+    def test_matches_validator(self):
+        schema = make_schema()
+        validator = jsch.compile_schema(schema)
+        memoized = jsch.compile_memoized(schema)
+        documents = [
+            [{'device': {'os': 'ios', 'version': 2}, 'count': 1}],
+            [{'device': {'os': 'web'}}],
+            [{'device': {'version': 2}}],
+            [{'device': {'os': 'ios', 'version': 0}}],
+            [{'device': {'os': 'ios', 'version': 2.0}}],
+            [{'device': {'os': 'ios', 'version': True}}],
+            [{'device': {'os': 'ios'}, 'count': 'x'}]
+        ]
+        for document in documents * 2:
+            self.assertEqual(
+                validator.is_valid(document), memoized.is_valid(document)
+            )
+
+    def test_counts_hits(self):
+        memoized = jsch.compile_memoized(make_schema())
+        device = {'os': 'ios', 'version': 2}
+        document = [{'device': dict(device), 'count': n} for n in range(4)]
+        self.assertTrue(memoized.is_valid(document))
+        memo = memoized.memo
+        self.assertEqual(3, memo.hits)
+        self.assertEqual(6, memo.misses)
+        self.assertEqual(3 / 9, memo.hit_rate)
+
+    def test_caches_invalid_results(self):
+        memoized = jsch.compile_memoized(make_schema())
+        document = [{'device': {'os': 'web'}}]
+        self.assertFalse(memoized.is_valid(document))
+        self.assertFalse(memoized.is_valid(document))
+        self.assertEqual(1, memoized.memo.hits)
+
+    def test_reports_errors(self):
+        memoized = jsch.compile_memoized(make_schema())
+        document = [{'device': {'os': 'web'}}]
+        memoized.is_valid(document)
+        with self.assertRaises(jsch.ValidationError) as context:
+            memoized.validate(document)
+        self.assertEqual('#/0/device/os', context.exception.pointer)
+
+    def test_skips_large_documents(self):
+        memo = jsch.ValidationMemo(max_size=8)
+        memoized = jsch.compile_memoized(make_schema(), memo)
+        self.assertTrue(memoized.is_valid([{'device': {'os': 'android'}}]))
+        self.assertEqual(0, len(memo))
+        self.assertEqual(0, memo.hits + memo.misses)
+
+    def test_does_not_serialize_large_nested_documents(self):
+        class Unserializable(list):
+            def __repr__(self):
+                raise AssertionError('document was serialized')
+
+        schema = jsch.Array(items=jsch.Array(items=jsch.Integer()))
+        document = Unserializable([list(range(20000)) for _ in range(50)])
+        memo = jsch.ValidationMemo()
+        self.assertIsNone(memo.key(schema, document))
+        memoized = jsch.compile_memoized(schema, memo)
+        self.assertTrue(memoized.is_valid(document))
+        self.assertEqual(0, len(memo))
+
+    def test_lru_eviction(self):
+        memo = jsch.ValidationMemo(max_entries=2)
+        memoized = jsch.compile_memoized(
+            jsch.Object(properties={'a': jsch.Integer()}), memo
+        )
+        memoized.is_valid({'a': 1})
+        memoized.is_valid({'a': 2})
+        memoized.is_valid({'a': 1})
+        memoized.is_valid({'a': 3})
+        self.assertEqual(1, memo.evictions)
+        memoized.is_valid({'a': 1})
+        self.assertEqual(2, memo.hits)
+
+    def test_fifo_eviction(self):
+        memo = jsch.ValidationMemo(max_entries=2, policy='fifo')
+        memoized = jsch.compile_memoized(
+            jsch.Object(properties={'a': jsch.Integer()}), memo
+        )
+        memoized.is_valid({'a': 1})
+        memoized.is_valid({'a': 2})
+        memoized.is_valid({'a': 1})
+        memoized.is_valid({'a': 3})
+        memoized.is_valid({'a': 1})
+        self.assertEqual(1, memo.hits)
+        self.assertEqual(2, memo.evictions)
+
+    def test_shares_memo_between_validators(self):
+        memo = jsch.ValidationMemo()
+        first = jsch.compile_memoized(jsch.Object(required=['a']), memo)
+        second = jsch.compile_memoized(jsch.Object(required=['b']), memo)
+        self.assertTrue(first.is_valid({'a': 1}))
+        self.assertFalse(second.is_valid({'a': 1}))
+
+    def test_follows_ref(self):
+        schema = jsch.Object(
+            definitions={'node': jsch.Object(properties={
+                'next': jsch.Schema(ref='#/definitions/node'),
+                'value': jsch.Integer()
+            })},
+            ref='#/definitions/node'
+        )
+        memoized = jsch.compile_memoized(schema)
+        self.assertTrue(memoized.is_valid({'next': {'value': 1}}))
+        self.assertFalse(memoized.is_valid({'next': {'value': 'x'}}))
+
+    def test_clear(self):
+        memoized = jsch.compile_memoized(make_schema())
+        memoized.is_valid([{'device': {'os': 'ios'}}])
+        memoized.memo.clear()
+        self.assertEqual(0, len(memoized.memo))
+        self.assertEqual(0, memoized.memo.misses)
+
+    def test_stops_memoizing_unrepeated_documents(self):
+        memoized = jsch.compile_memoized(
+            jsch.Object(properties={'a': jsch.Integer()})
+        )
+        for value in range(jsch.memo.TRIAL_LOOKUPS + 10):
+            self.assertTrue(memoized.is_valid({'a': value}))
+        self.assertEqual(jsch.memo.TRIAL_LOOKUPS + 1, memoized.memo.misses)
+        self.assertFalse(memoized.is_valid({'a': 'x'}))
@@ -0,0 +1,146 @@
+import unittest
+
+import jsch
+
+
+class OptimizeTestCase(unittest.TestCase):
+    def assertOptimizesTo(self, schema, expected):
+        optimized, _ = jsch.optimize(schema)
+        self.assertEqual(expected.asdict(), optimized.asdict())
+
+    def assertEquivalent(self, schema, instances):
+        optimized, _ = jsch.optimize(schema)
+        validator = jsch.compile_schema(schema)
+        optimized_validator = jsch.compile_schema(optimized)
+        for instance in instances:
+            self.assertEqual(
+                validator.is_valid(instance),
+                optimized_validator.is_valid(instance),
+                instance
+            )
+
+
+class TestOptimize(OptimizeTestCase):
+    def test_flattens_nested_all_of(self):
+        schema = jsch.Schema(all_of=[
+            jsch.Schema(all_of=[jsch.Integer(), jsch.Schema(minimum=1)]),
+            jsch.Schema(pattern='a', title='b')
+        ])
+        self.assertOptimizesTo(schema, jsch.Integer(
+            minimum=1, all_of=[jsch.Schema(pattern='a', title='b')]
+        ))
+
+    def test_replaces_single_member_any_of(self):
+        schema = jsch.Schema(any_of=[jsch.String(max_length=2)])
+        self.assertOptimizesTo(schema, jsch.String(max_length=2))
+
+    def test_replaces_single_member_one_of(self):
+        schema = jsch.Schema(one_of=[jsch.String(max_length=2)])
+        self.assertOptimizesTo(schema, jsch.String(max_length=2))
+
+    def test_dedupes_any_of(self):
+        schema = jsch.Schema(any_of=[
+            jsch.Integer(), jsch.String(), jsch.Integer()
+        ])
+        self.assertOptimizesTo(schema, jsch.Schema(any_of=[
+            jsch.Integer(), jsch.String()
+        ]))
+
+    def test_keeps_duplicate_one_of(self):
+        schema = jsch.Schema(one_of=[jsch.Integer(), jsch.Integer()])
+        self.assertOptimizesTo(schema, schema)
+
+    def test_drops_any_of_with_empty_member(self):
+        schema = jsch.Integer(any_of=[jsch.String(), jsch.Schema()])
+        self.assertOptimizesTo(schema, jsch.Integer())
+
+    def test_intersects_bounds(self):
+        schema = jsch.Number(maximum=10, all_of=[
+            jsch.Schema(maximum=5),
+            jsch.Schema(minimum=1),
+            jsch.Schema(minimum=1, exclusive_minimum=True),
+            jsch.Schema(max_length=4),
+            jsch.Schema(max_length=2, min_length=1)
+        ])
+        self.assertOptimizesTo(schema, jsch.Number(
+            maximum=5, minimum=1, exclusive_minimum=True, max_length=2,
+            min_length=1
+        ))
+
+    def test_unions_required(self):
+        schema = jsch.Object(required=['a'], all_of=[
+            jsch.Schema(required=['b', 'a'])
+        ])
+        self.assertOptimizesTo(schema, jsch.Object(required=['a', 'b']))
+
+    def test_keeps_members_with_conflicting_type(self):
+        schema = jsch.Integer(all_of=[jsch.String()])
+        self.assertOptimizesTo(schema, schema)
+
+    def test_drops_vacuous_keywords(self):
+        schema = jsch.Object(
+            additional_properties=True,
+            min_properties=0,
+            properties={'a': jsch.Schema(), 'b': jsch.String()},
+            items=jsch.Schema(),
+            additional_items=False
+        )
+        self.assertOptimizesTo(
+            schema, jsch.Object(properties={'b': jsch.String()})
+        )
+
+    def test_keeps_empty_properties_when_additional_properties_false(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Schema()}, additional_properties=False
+        )
+        self.assertOptimizesTo(schema, schema)
+
+    def test_optimizes_sub_schemas(self):
+        schema = jsch.Array(items=jsch.Schema(any_of=[jsch.Integer()]))
+        self.assertOptimizesTo(schema, jsch.Array(items=jsch.Integer()))
+
+    def test_keeps_nodes_on_local_ref_pointers(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Schema(all_of=[jsch.Integer(minimum=1)]),
+            'b': jsch.Schema(ref='#/properties/a/allOf/0'),
+            'c': jsch.Schema(),
+            'd': jsch.Schema(ref='#/properties/c')
+        })
+        self.assertOptimizesTo(schema, schema)
+        self.assertEquivalent(schema, [{'b': 1}, {'b': 0}, {'d': 'a'}])
+
+    def test_optimizes_through_definitions_refs(self):
+        schema = jsch.Schema(
+            definitions={'a': jsch.Schema(any_of=[jsch.Integer()])},
+            properties={'b': jsch.Schema(ref='#/definitions/a')},
+            min_length=0
+        )
+        self.assertOptimizesTo(schema, jsch.Schema(
+            definitions={'a': jsch.Integer()},
+            properties={'b': jsch.Schema(ref='#/definitions/a')}
+        ))
+
+    def test_preserves_validation(self):
+        schema = jsch.Schema(
+            all_of=[
+                jsch.Schema(all_of=[jsch.Number(maximum=10)]),
+                jsch.Schema(maximum=10, exclusive_maximum=True),
+                jsch.Schema(minimum=-1)
+            ],
+            any_of=[jsch.Integer(), jsch.Integer(), jsch.Number(maximum=2)]
+        )
+        self.assertEquivalent(schema, [-2, -1, 0, 1.5, 2.5, 9, 10, 11, 'a'])
+
+
+class TestOptimizationReport(unittest.TestCase):
+    def test_counts_eliminated_nodes_and_keywords(self):
+        schema = jsch.Schema(all_of=[
+            jsch.Schema(all_of=[jsch.Integer(), jsch.Schema(minimum=1)])
+        ])
+        _, report = jsch.optimize(schema)
+        self.assertEqual(4, report.nodes_before)
+        self.assertEqual(1, report.nodes_after)
+        self.assertEqual(3, report.nodes_eliminated)
+        self.assertEqual(4, report.keywords_before)
+        self.assertEqual(2, report.keywords_after)
+        self.assertEqual(2, report.keywords_eliminated)
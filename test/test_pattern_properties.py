@@ -0,0 +1,122 @@
+import unittest
+
+import jsch
+from jsch.validator import (
+    MAX_MATCHED_NAMES,
+    compile_pattern_search,
+    is_anchored
+)
+
+
+class TestIsAnchored(unittest.TestCase):
+    def test_anchored_patterns(self):
+        self.assertTrue(is_anchored('^a'))
+        self.assertTrue(is_anchored('^(a|b)c'))
+        self.assertTrue(is_anchored(r'^a\|b'))
+        self.assertTrue(is_anchored('^[|]'))
+
+    def test_unanchored_patterns(self):
+        self.assertFalse(is_anchored('a'))
+        self.assertFalse(is_anchored('^a|b'))
+        self.assertFalse(is_anchored('^(a)|b'))
+
+
+class TestPatternSearch(unittest.TestCase):
+    def assertMatches(self, patterns, name, expected):
+        search, matches_any = compile_pattern_search(patterns)
+        self.assertEqual(expected, search(name))
+        self.assertEqual(bool(expected), matches_any(name))
+
+    def test_no_patterns(self):
+        self.assertMatches([], 'a', ())
+
+    def test_finds_every_matching_pattern(self):
+        patterns = ['^a', 'b', 'c$', '^x']
+        self.assertMatches(patterns, 'abc', (0, 1, 2))
+        self.assertMatches(patterns, 'cab', (1,))
+        self.assertMatches(patterns, 'y', ())
+
+    def test_anchors_only_match_at_the_ends(self):
+        self.assertMatches(['^b', 'b$'], 'abc', ())
+
+    def test_overlapping_patterns(self):
+        self.assertMatches(['ab', 'bc', 'abc'], 'xabcx', (0, 1, 2))
+
+    def test_empty_pattern_matches_everything(self):
+        self.assertMatches(['', 'z'], 'a', (0,))
+
+    def test_alternation_is_kept_within_its_pattern(self):
+        self.assertMatches(['^a|b$', 'c'], 'xb', (0,))
+
+    def test_patterns_with_groups(self):
+        patterns = [r'^(a)\1', '(?P<b>b)']
+        self.assertMatches(patterns, 'aab', (0, 1))
+        self.assertMatches(patterns, 'ab', (1,))
+
+    def test_patterns_with_inline_flags(self):
+        self.assertMatches(['(?i)^a', 'b'], 'Ab', (0, 1))
+
+
+class TestPatternProperties(unittest.TestCase):
+    def setUp(self):
+        self.schema = jsch.Object(
+            properties={'id': jsch.Integer()},
+            pattern_properties={
+                '^x-': jsch.String(),
+                'count$': jsch.Integer(minimum=0),
+                'id': jsch.Integer(maximum=10)
+            },
+            additional_properties=False
+        )
+        self.validator = jsch.compile_schema(self.schema)
+
+    def test_declared_property_also_matches_patterns(self):
+        self.assertTrue(self.validator.is_valid({'id': 5}))
+        self.assertEqual(
+            "'#/id' must be less than or equal to 10",
+            str(self.validator.first_error({'id': 11}))
+        )
+
+    def test_name_matching_several_patterns(self):
+        self.assertFalse(self.validator.is_valid({'x-count': 1}))
+        messages = [str(error) for error in self.validator.errors(
+            {'x-count': -1}
+        )]
+        self.assertEqual([
+            "'#/x-count' must be of type 'string'",
+            "'#/x-count' must be greater than or equal to 0"
+        ], messages)
+
+    def test_additional_properties_are_decided_from_the_same_match(self):
+        self.assertTrue(self.validator.is_valid(
+            {'id': 1, 'x-name': 'a', 'count': 2, 'grid': 3}
+        ))
+        self.assertEqual(
+            "'#' must not have additional property 'name'",
+            str(self.validator.first_error({'name': 'a'}))
+        )
+
+    def test_additional_properties_schema(self):
+        schema = jsch.Object(
+            pattern_properties={'^x-': jsch.String()},
+            additional_properties=jsch.Integer()
+        )
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid({'x-a': 'a', 'b': 1}))
+        self.assertFalse(validator.is_valid({'x-a': 'a', 'b': 'b'}))
+
+    def test_matched_names_are_bounded(self):
+        validator = jsch.compile_schema(self.schema)
+        names = ['x-{0}'.format(index)
+                 for index in range(MAX_MATCHED_NAMES + 10)]
+        self.assertTrue(validator.is_valid({name: 'a' for name in names}))
+        matcher = validator.compiler.property_matcher(self.schema)
+        self.assertEqual(MAX_MATCHED_NAMES, len(matcher._names))
+        self.assertEqual(
+            "'#' must not have additional property 'y-0'",
+            str(validator.first_error({names[-1]: 'a', 'y-0': 'a'}))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+import jsch
+
+
+class TestValidationProfiler(unittest.TestCase):
+    def setUp(self):
+        self.schema = jsch.Object(
+            definitions={'tag': jsch.String(pattern='^[a-z]+$')},
+            properties={
+                'name': jsch.String(max_length=8),
+                'tags': jsch.Array(
+                    items=jsch.Schema(ref='#/definitions/tag')
+                )
+            }
+        )
+        self.profiler = jsch.ValidationProfiler(self.schema)
+
+    def test_results_match_validator(self):
+        validator = jsch.compile_schema(self.schema)
+        for instance in [{'name': 'a'}, {'name': 'abcdefghi'},
+                         {'tags': ['a', 'B']}, 1]:
+            self.assertEqual(
+                validator.is_valid(instance),
+                self.profiler.is_valid(instance)
+            )
+            self.assertEqual(
+                [str(error) for error in validator.errors(instance)],
+                [str(error) for error in self.profiler.errors(instance)]
+            )
+
+    def test_counts_keywords(self):
+        self.profiler.is_valid({'name': 'a', 'tags': ['a', 'b', 'c']})
+        keywords = self.profiler.keywords
+        self.assertEqual(1, keywords['properties'].calls)
+        self.assertEqual(1, keywords['items'].calls)
+        self.assertEqual(3, keywords['ref'].calls)
+        self.assertEqual(3, keywords['pattern'].calls)
+        self.assertEqual(6, keywords['type'].calls)
+
+    def test_counts_nodes_by_pointer(self):
+        self.profiler.is_valid({'name': 'a', 'tags': ['a', 'b', 'c']})
+        nodes = self.profiler.nodes
+        self.assertEqual(1, nodes['#'].calls)
+        self.assertEqual(1, nodes['#/properties/name'].calls)
+        self.assertEqual(3, nodes['#/properties/tags/items'].calls)
+        self.assertEqual(3, nodes['#/definitions/tag'].calls)
+
+    def test_shared_node_uses_shortest_pointer(self):
+        shared = jsch.String()
+        schema = jsch.Object(properties={
+            'a': jsch.Array(items=shared),
+            'b': shared
+        })
+        profiler = jsch.ValidationProfiler(schema)
+        profiler.is_valid({'a': ['x', 'y'], 'b': 'z'})
+        self.assertEqual(3, profiler.nodes['#/properties/b'].calls)
+        self.assertNotIn('#/properties/a/items', profiler.nodes)
+
+    def test_self_time_excludes_children(self):
+        self.profiler.is_valid({'name': 'a', 'tags': ['a', 'b', 'c']})
+        stats = self.profiler.nodes['#']
+        self.assertGreater(stats.time, 0)
+        self.assertLessEqual(stats.self_time, stats.time)
+        self.assertGreaterEqual(
+            stats.time,
+            self.profiler.nodes['#/properties/tags'].time
+        )
+
+    def test_hottest(self):
+        self.profiler.is_valid({'name': 'a', 'tags': ['a', 'b', 'c']})
+        hottest = self.profiler.hottest(2, sort_key='calls')
+        self.assertEqual(2, len(hottest))
+        self.assertEqual(3, hottest[0][1].calls)
+
+    def test_hottest_with_invalid_sort_key(self):
+        with self.assertRaisesRegex(ValueError, "^'sort_key' must be one of"):
+            self.profiler.hottest(sort_key='name')
+
+    def test_report(self):
+        self.profiler.is_valid({'name': 'a', 'tags': ['a']})
+        report = self.profiler.report()
+        self.assertIn('#/definitions/tag', report)
+        self.assertIn('pattern', report)
+
+    def test_reset(self):
+        self.profiler.is_valid({'name': 'a'})
+        self.profiler.reset()
+        self.assertEqual([], self.profiler.hottest())
+        self.assertEqual(0, self.profiler.keywords['properties'].calls)
+
+    def test_validator_is_not_instrumented(self):
+        jsch.compile_schema(self.schema).is_valid({'name': 'a'})
+        self.assertEqual([], self.profiler.hottest())
@@ -0,0 +1,77 @@
+import io
+import unittest
+
+import jsch
+
+
+def make_schema():
+    sku = jsch.String()
+    return jsch.Object(
+        definitions={'sku': sku},
+        properties={
+            'order': jsch.Object(properties={
+                'items': jsch.Array(items=jsch.Object(properties={
+                    'sku': sku
+                }))
+            }),
+            'a/b': jsch.Integer()
+        }
+    )
+
+
+class TestSchemaAt(unittest.TestCase):
+    def test_root(self):
+        schema = make_schema()
+        self.assertIs(schema, schema.at('#'))
+        self.assertIs(schema, schema.at(''))
+
+    def test_json_pointer(self):
+        schema = make_schema()
+        pointer = '/properties/order/properties/items/items/properties/sku'
+        self.assertIs(schema.definitions['sku'], schema.at(pointer))
+
+    def test_uri_fragment(self):
+        schema = make_schema()
+        self.assertIs(
+            schema.properties['order'], schema.at('#/properties/order')
+        )
+
+    def test_escaped_name(self):
+        schema = make_schema()
+        self.assertIs(
+            schema.properties['a/b'], schema.at('/properties/a~1b')
+        )
+
+    def test_missing_pointer(self):
+        schema = make_schema()
+        with self.assertRaises(KeyError):
+            schema.at('/properties/missing')
+        with self.assertRaises(KeyError):
+            schema.at('/definitions')
+
+    def test_caches_index(self):
+        schema = make_schema()
+        schema.at('#')
+        index = schema._index
+        schema.at('/properties/order')
+        self.assertIs(index, schema._index)
+
+    def test_pointers_of(self):
+        schema = make_schema()
+        self.assertCountEqual(
+            [
+                '#/definitions/sku',
+                '#/properties/order/properties/items/items/properties/sku'
+            ],
+            schema.pointers_of(schema.definitions['sku'])
+        )
+        self.assertEqual(['#'], schema.pointers_of(schema))
+
+    def test_pointers_of_unknown_schema(self):
+        self.assertEqual([], make_schema().pointers_of(jsch.String()))
+
+    def test_snapshot_schema(self):
+        fp = io.BytesIO()
+        jsch.dump_snapshot({'order': make_schema()}, fp)
+        schema = jsch.loads_snapshot(fp.getvalue())['order']
+        self.assertEqual('integer', schema.at('/properties/a~1b').type)
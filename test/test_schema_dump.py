@@ -0,0 +1,66 @@
+import gzip
+import io
+import unittest
+
+import jsch
+
+
+def make_schema():
+    return jsch.Object(
+        title='Order',
+        properties={
+            'id': jsch.Integer(minimum=1),
+            'lines': jsch.Array(items=jsch.Object(
+                properties={'sku': jsch.String(max_length=16)},
+                required=['sku']
+            ))
+        },
+        required=['id']
+    )
+
+
+class TestSchemaIterencode(unittest.TestCase):
+    def test_matches_asjson(self):
+        schema = make_schema()
+        self.assertEqual(schema.asjson(), ''.join(schema.iterencode()))
+
+    def test_matches_asjson_when_pretty_root(self):
+        schema = make_schema()
+        self.assertEqual(
+            schema.asjson(pretty=True, root=True),
+            ''.join(schema.iterencode(pretty=True, root=True))
+        )
+
+    def test_yields_chunks_lazily(self):
+        chunks = make_schema().iterencode()
+        self.assertEqual('{', next(chunks))
+
+
+class TestSchemaDump(unittest.TestCase):
+    def test_writes_asjson(self):
+        schema = make_schema()
+        fp = io.StringIO()
+        schema.dump(fp, pretty=True)
+        self.assertEqual(schema.asjson(pretty=True), fp.getvalue())
+
+    def test_writes_in_chunks(self):
+        schema = make_schema()
+        writes = []
+
+        class Writer(object):
+            def write(self, text):
+                writes.append(text)
+
+        schema.dump(Writer(), chunk_size=16)
+        self.assertGreater(len(writes), 1)
+        self.assertEqual(schema.asjson(), ''.join(writes))
+
+    def test_writes_to_gzip_stream(self):
+        schema = make_schema()
+        data = io.BytesIO()
+        with gzip.open(data, 'wt') as fp:
+            schema.dump(fp, root=True, schema='http://jsch.org/custom#')
+        self.assertEqual(
+            schema.asjson(root=True, schema='http://jsch.org/custom#'),
+            gzip.decompress(data.getvalue()).decode('utf-8')
+        )
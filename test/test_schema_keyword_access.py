@@ -185,6 +185,22 @@ class TestExclusiveMinimumKeywordAccess(KeywordAccessTestCase):
             schema.exclusive_minimum = True
 
 
+class TestFormatKeywordAccess(KeywordAccessTestCase):
+    def test_read_property(self):
+        schema = jsch.Schema(format='date-time')
+        self.assertEqual('date-time', schema.format)
+
+    def test_read_unassigned_property(self):
+        schema = jsch.Schema()
+        self.assertIsNone(schema.format)
+
+    def test_set_property(self):
+        schema = jsch.Schema()
+        message = "can't set keyword attribute"
+        with self.assertRaisesAttributeError(message):
+            schema.format = 'date-time'
+
+
 class TestIdKeywordAccess(KeywordAccessTestCase):
     def test_read_property(self):
         schema = jsch.Schema(id='#def')
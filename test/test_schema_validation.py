@@ -273,6 +273,16 @@ class TestExclusiveMinimumValidation(SchemaValidationTestCase):
             jsch.Schema(minimum=1, exclusive_minimum='True')
 
 
+class TestFormatValidation(SchemaValidationTestCase):
+    def test_passes_when_str(self):
+        jsch.Schema(format='uuid')
+
+    def test_fails_when_not_str(self):
+        message = "'format' must be a str"
+        with self.assertRaisesSchemaValidationError(message):
+            jsch.Schema(format=1)
+
+
 class TestIdValidation(SchemaValidationTestCase):
     def test_passes_when_str(self):
         jsch.Schema(id='#def')
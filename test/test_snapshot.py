@@ -0,0 +1,92 @@
+import io
+import os
+import tempfile
+import unittest
+
+import jsch
+
+
+def make_schema():
+    return jsch.Array(
+        items=jsch.Object(
+            properties={'name': jsch.String(max_length=8)},
+            dependencies={'name': ['id'], 'id': jsch.Schema()},
+            required=['name']
+        ),
+        additional_items=False,
+        all_of=[jsch.Schema(min_items=1)],
+        default=[{'name': 'a'}]
+    )
+
+
+def dumps_snapshot(schemas):
+    fp = io.BytesIO()
+    jsch.dump_snapshot(schemas, fp)
+    return fp.getvalue()
+
+
+class TestSchemaFromDict(unittest.TestCase):
+    def test_round_trips_asjson(self):
+        schema = make_schema()
+        self.assertEqual(schema, jsch.Schema.fromjson(schema.asjson()))
+
+    def test_validates_keywords(self):
+        message = "^'max_length' must be an int$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.Schema.fromdict({'items': {'maxLength': 'eight'}})
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_round_trips_schemas(self):
+        schemas = {'a': make_schema(), 'b': jsch.Integer(minimum=0)}
+        snapshot = jsch.loads_snapshot(dumps_snapshot(schemas))
+        self.assertEqual(['a', 'b'], sorted(snapshot))
+        self.assertEqual(schemas['a'], snapshot['a'])
+        self.assertEqual(schemas['b'].asjson(), snapshot['b'].asjson())
+
+    def test_keyword_access(self):
+        snapshot = jsch.loads_snapshot(dumps_snapshot({'a': make_schema()}))
+        schema = snapshot['a']
+        self.assertEqual(8, schema.items.properties['name'].max_length)
+        self.assertEqual(['id'], schema.items.dependencies['name'])
+        self.assertFalse(schema.additional_items)
+
+    def test_returns_same_object_on_repeated_access(self):
+        snapshot = jsch.loads_snapshot(dumps_snapshot({'a': make_schema()}))
+        self.assertIs(snapshot['a'], snapshot['a'])
+        self.assertIs(snapshot['a'].items, snapshot['a'].items)
+
+    def test_sub_schemas_materialized_lazily(self):
+        snapshot = jsch.loads_snapshot(dumps_snapshot({'a': make_schema()}))
+        schema = snapshot['a']
+        self.assertIsNone(schema._materialized)
+        schema.items
+        self.assertIsNotNone(schema._materialized)
+        self.assertIsNone(schema._dict['items']._materialized)
+
+    def test_load_from_file(self):
+        schemas = {'a': make_schema()}
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'registry.snap')
+        with open(path, 'wb') as fp:
+            jsch.dump_snapshot(schemas, fp)
+        with jsch.load_snapshot(path) as snapshot:
+            self.assertEqual(schemas['a'], snapshot['a'])
+
+    def test_fails_when_magic_unrecognised(self):
+        data = b'NOTASNAP' + dumps_snapshot({})[8:]
+        message = "^snapshot has an unrecognised format$"
+        with self.assertRaisesRegex(jsch.SnapshotError, message):
+            jsch.loads_snapshot(data)
+
+    def test_fails_when_version_unsupported(self):
+        data = bytearray(dumps_snapshot({}))
+        data[8] = 99
+        message = "^snapshot version 99 is not supported$"
+        with self.assertRaisesRegex(jsch.SnapshotError, message):
+            jsch.loads_snapshot(bytes(data))
+
+    def test_fails_when_truncated(self):
+        message = "^snapshot is truncated$"
+        with self.assertRaisesRegex(jsch.SnapshotError, message):
+            jsch.loads_snapshot(b'JSCH')
@@ -0,0 +1,187 @@
+import io
+import json
+import unittest
+
+import jsch
+
+
+def chunks(text, size=3):
+    data = text.encode('utf-8')
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+class StreamValidationTestCase(unittest.TestCase):
+    def assertStreamInvalid(self, schema, text, message):
+        regex = '^{0}$'.format(message)
+        with self.assertRaisesRegex(jsch.ValidationError, regex):
+            jsch.validate_stream(schema, chunks(text))
+
+
+class TestJsonEventParser(unittest.TestCase):
+    def parse(self, text):
+        parser = jsch.stream.JsonEventParser()
+        events = []
+        for chunk in text:
+            events.extend(parser.feed(chunk))
+        events.extend(parser.close())
+        return events
+
+    def test_events(self):
+        text = '{"a": [1, -2.5e1, "x\\"y"], "b": {"c": true, "d": null}}'
+        self.assertEqual([
+            ('start_object', None),
+            ('key', 'a'),
+            ('start_array', None),
+            ('value', 1),
+            ('value', -25.0),
+            ('value', 'x"y'),
+            ('end_array', None),
+            ('key', 'b'),
+            ('start_object', None),
+            ('key', 'c'),
+            ('value', True),
+            ('key', 'd'),
+            ('value', None),
+            ('end_object', None),
+            ('end_object', None)
+        ], self.parse(text))
+
+    def test_top_level_number(self):
+        self.assertEqual([('value', 123)], self.parse('123'))
+
+    def test_fails_when_truncated(self):
+        message = "^unexpected end of input at offset 5$"
+        with self.assertRaisesRegex(jsch.JsonStreamError, message):
+            self.parse('[1, 2')
+
+    def test_fails_when_trailing_comma(self):
+        message = "^expected value at offset 3$"
+        with self.assertRaisesRegex(jsch.JsonStreamError, message):
+            self.parse('[1,]')
+
+    def test_fails_when_extra_data(self):
+        message = "^unexpected data after JSON value at offset 3$"
+        with self.assertRaisesRegex(jsch.JsonStreamError, message):
+            self.parse('{} 1')
+
+
+class TestStreamValidation(StreamValidationTestCase):
+    def setUp(self):
+        self.schema = jsch.Object(
+            properties={
+                'name': jsch.String(max_length=4),
+                'tags': jsch.Array(items=jsch.Integer(), max_items=2),
+                'kind': jsch.Schema(enum=['a', 'b'])
+            },
+            required=['name'],
+            additional_properties=False
+        )
+
+    def test_passes_valid_document(self):
+        text = json.dumps({'name': 'ab', 'tags': [1, 2], 'kind': 'a'})
+        jsch.validate_stream(self.schema, chunks(text))
+
+    def test_passes_file_object(self):
+        text = json.dumps({'name': 'ab'})
+        jsch.validate_stream(self.schema, io.BytesIO(text.encode('utf-8')))
+
+    def test_passes_multibyte_characters_split_across_chunks(self):
+        text = json.dumps({'name': 'éé'}, ensure_ascii=False)
+        jsch.validate_stream(self.schema, chunks(text, 1))
+
+    def test_fails_wrong_root_type_on_first_token(self):
+        validator = jsch.StreamValidator(self.schema)
+        message = "^'#' must be of type 'object'$"
+        with self.assertRaisesRegex(jsch.ValidationError, message):
+            validator.feed(b'[')
+
+    def test_fails_long_string_before_document_ends(self):
+        validator = jsch.StreamValidator(self.schema)
+        message = "^'#/name' must be at most 4 characters long$"
+        with self.assertRaisesRegex(jsch.ValidationError, message):
+            validator.feed(b'{"name": "abcdef", ')
+
+    def test_fails_long_string_fed_byte_by_byte(self):
+        validator = jsch.StreamValidator(self.schema)
+        message = "^'#/name' must be at most 4 characters long$"
+        text = b'{"name": "ab\\"\\u00e9\\ud83d\\ude00' + b'x' * 65536
+        with self.assertRaisesRegex(jsch.ValidationError, message):
+            for index in range(len(text)):
+                validator.feed(text[index:index + 1])
+        self.assertLess(index, 40)
+
+    def test_passes_long_string_fed_byte_by_byte(self):
+        schema = jsch.Array(items=jsch.String(max_length=65541))
+        text = b'["ab\\"\\u00e9\\ud83d\\ude00' + b'x' * 65536 + b'"]'
+        validator = jsch.StreamValidator(schema)
+        for index in range(len(text)):
+            validator.feed(text[index:index + 1])
+        validator.close()
+
+    def test_fails_additional_property_on_key(self):
+        validator = jsch.StreamValidator(self.schema)
+        message = "^'#' must not have additional property 'x'$"
+        with self.assertRaisesRegex(jsch.ValidationError, message):
+            validator.feed(b'{"x"')
+
+    def test_fails_max_items_on_extra_item(self):
+        validator = jsch.StreamValidator(self.schema)
+        message = "^'#/tags' must have at most 2 items$"
+        with self.assertRaisesRegex(jsch.ValidationError, message):
+            validator.feed(b'{"tags": [1, 2, 3,')
+
+    def test_fails_item_type(self):
+        message = "'#/tags/1' must be of type 'integer'"
+        text = json.dumps({'name': 'a', 'tags': [1, 'x']})
+        self.assertStreamInvalid(self.schema, text, message)
+
+    def test_fails_required(self):
+        message = "'#' must have property 'name'"
+        self.assertStreamInvalid(self.schema, '{}', message)
+
+    def test_fails_enum(self):
+        message = "'#/kind' must be one of the enum values"
+        text = json.dumps({'name': 'a', 'kind': 'c'})
+        self.assertStreamInvalid(self.schema, text, message)
+
+
+class TestStreamValidationMaterialized(StreamValidationTestCase):
+    def test_any_of_on_container(self):
+        schema = jsch.Array(items=jsch.Schema(
+            any_of=[jsch.Object(required=['a']), jsch.Object(required=['b'])]
+        ))
+        jsch.validate_stream(schema, chunks('[{"a": 1}, {"b": [2]}]'))
+        message = ("'#/1' must be valid against at least one 'any_of' "
+                   "schema")
+        self.assertStreamInvalid(schema, '[{"a": 1}, {"c": [2]}]', message)
+
+    def test_unique_items(self):
+        schema = jsch.Array(unique_items=True)
+        message = "'#' must have unique items"
+        self.assertStreamInvalid(schema, '[{"a": 1}, {"a": 1}]', message)
+
+    def test_nested_errors_include_path(self):
+        schema = jsch.Object(properties={'a': jsch.Schema(
+            not_=jsch.Object(required=['b'])
+        )})
+        message = "'#/a' must not be valid against the 'not_' schema"
+        self.assertStreamInvalid(schema, '{"a": {"b": [1, {}]}}', message)
+
+
+class TestStreamValidationRefs(StreamValidationTestCase):
+    def test_follows_recursive_ref(self):
+        schema = jsch.Object(
+            properties={'child': jsch.Schema(ref='#')},
+            additional_properties=False
+        )
+        message = "'#/child/child' must not have additional property 'a'"
+        text = '{"child": {"child": {"a": 1}}}'
+        self.assertStreamInvalid(schema, text, message)
+
+    def test_all_of_streams_every_member(self):
+        schema = jsch.Schema(all_of=[
+            jsch.Object(required=['a']),
+            jsch.Object(properties={'a': jsch.String()})
+        ])
+        message = "'#/a' must be of type 'string'"
+        self.assertStreamInvalid(schema, '{"a": 1}', message)
@@ -0,0 +1,171 @@
+import unittest
+
+import jsch
+
+
+class StrictTestCase(unittest.TestCase):
+    def assertStrictError(self, message, **kwargs):
+        with self.assertRaises(jsch.SchemaValidationError) as context:
+            jsch.SchemaStrict(**kwargs)
+        self.assertEqual(message, str(context.exception))
+
+
+class TestNumericRange(StrictTestCase):
+    def test_minimum_greater_than_maximum(self):
+        self.assertStrictError(
+            "'minimum' must be less than or equal to 'maximum'",
+            minimum=2, maximum=1
+        )
+
+    def test_minimum_equal_to_exclusive_maximum(self):
+        self.assertStrictError(
+            "'minimum' must be less than 'maximum'",
+            minimum=1, maximum=1, exclusive_maximum=True
+        )
+
+    def test_minimum_equal_to_maximum(self):
+        schema = jsch.SchemaStrict(minimum=1, maximum=1)
+        self.assertEqual(1, schema.minimum)
+
+    def test_minimum_only(self):
+        jsch.SchemaStrict(minimum=5)
+
+
+class TestRanges(StrictTestCase):
+    def test_min_length_greater_than_max_length(self):
+        self.assertStrictError(
+            "'min_length' must be less than or equal to 'max_length'",
+            min_length=3, max_length=2
+        )
+
+    def test_min_items_greater_than_max_items(self):
+        self.assertStrictError(
+            "'min_items' must be less than or equal to 'max_items'",
+            min_items=3, max_items=2
+        )
+
+    def test_min_properties_greater_than_max_properties(self):
+        self.assertStrictError(
+            "'min_properties' must be less than or equal to "
+            "'max_properties'",
+            min_properties=3, max_properties=2
+        )
+
+    def test_equal_bounds(self):
+        jsch.SchemaStrict(min_length=2, max_length=2)
+
+
+class TestRequiredDefined(StrictTestCase):
+    def test_required_not_in_properties(self):
+        self.assertStrictError(
+            "'required' list item 'b' must be defined in 'properties'",
+            properties={'a': jsch.Schema()}, required=['a', 'b']
+        )
+
+    def test_required_matched_by_pattern_properties(self):
+        jsch.SchemaStrict(
+            properties={'a': jsch.Schema()},
+            pattern_properties={'^b': jsch.Schema()},
+            required=['a', 'bc']
+        )
+
+    def test_required_without_properties(self):
+        jsch.SchemaStrict(required=['a'])
+
+    def test_required_without_properties_and_no_additional(self):
+        self.assertStrictError(
+            "'required' list item 'a' must be defined in 'properties'",
+            additional_properties=False, required=['a']
+        )
+
+
+class TestEnumType(StrictTestCase):
+    def test_enum_item_does_not_match_type(self):
+        self.assertStrictError(
+            "'enum' list item must match 'type'",
+            type='string', enum=['a', 1]
+        )
+
+    def test_enum_item_matches_one_of_types(self):
+        jsch.SchemaStrict(type=['string', 'null'], enum=['a', None])
+
+    def test_bool_is_not_integer(self):
+        self.assertStrictError(
+            "'enum' list item must match 'type'",
+            type='integer', enum=[2, True]
+        )
+
+
+class TestDefaultValid(StrictTestCase):
+    def test_default_invalid(self):
+        self.assertStrictError(
+            "'default' must be valid against the schema",
+            type='integer', maximum=5, default=6
+        )
+
+    def test_default_valid(self):
+        jsch.SchemaStrict(type='integer', maximum=5, default=5)
+
+    def test_default_checked_against_sub_schemas(self):
+        self.assertStrictError(
+            "'default' must be valid against the schema",
+            type='object',
+            properties={'a': jsch.String()},
+            default={'a': 1}
+        )
+
+    def test_default_with_unresolvable_ref_is_skipped(self):
+        jsch.SchemaStrict(ref='#/definitions/missing', default=1)
+
+    def test_failed_compile_not_reused(self):
+        # Checking the outer default reaches the unresolvable ref, which
+        # must not leave the inner schema accepting every default.
+        self.assertStrictError(
+            "'default' must be valid against the schema",
+            type='object',
+            properties={'a': jsch.Schema(
+                type='integer',
+                not_=jsch.Schema(ref='#/definitions/missing'),
+                default='x'
+            )},
+            default={'a': 1}
+        )
+
+
+class TestSubSchemas(StrictTestCase):
+    def test_checks_nested_sub_schemas(self):
+        self.assertStrictError(
+            "'min_length' must be less than or equal to 'max_length'",
+            type='array',
+            items=[jsch.Object(properties={
+                'a': jsch.String(min_length=3, max_length=2)
+            })]
+        )
+
+    def test_checks_dependency_schemas(self):
+        self.assertStrictError(
+            "'minimum' must be less than or equal to 'maximum'",
+            dependencies={'a': jsch.Schema(minimum=2, maximum=1)}
+        )
+
+
+class TestValidateStrict(unittest.TestCase):
+    def test_marks_checked_sub_schemas(self):
+        shared = jsch.Integer(minimum=0)
+        schema = jsch.Array(items=[shared, shared])
+        jsch.validate_strict(schema)
+        self.assertTrue(schema._strict)
+        self.assertTrue(shared._strict)
+
+    def test_skips_checked_sub_schemas(self):
+        shared = jsch.Integer(minimum=0)
+        jsch.validate_strict(shared)
+        shared._dict['maximum'] = -1
+        jsch.validate_strict(jsch.Array(items=shared))
+
+    def test_does_not_mark_on_failure(self):
+        valid = jsch.Integer(minimum=0)
+        schema = jsch.Array(items=[valid, jsch.Integer(minimum=1, maximum=0)])
+        with self.assertRaises(jsch.SchemaValidationError):
+            jsch.validate_strict(schema)
+        self.assertFalse(hasattr(valid, '_strict'))
@@ -0,0 +1,86 @@
+import unittest
+
+import jsch
+from jsch.validator import are_instance_items_unique
+
+
+class TestUniqueItems(unittest.TestCase):
+    def assertUnique(self, items):
+        self.assertTrue(are_instance_items_unique(items))
+
+    def assertNotUnique(self, items):
+        self.assertFalse(are_instance_items_unique(items))
+
+    def test_empty_array_is_unique(self):
+        self.assertUnique([])
+
+    def test_distinct_scalars_are_unique(self):
+        self.assertUnique([1, 1.5, 'a', None, True])
+
+    def test_repeated_strings_are_not_unique(self):
+        self.assertNotUnique(['a', 'b', 'a'])
+
+    def test_integer_equals_integral_float(self):
+        self.assertNotUnique([1, 1.0])
+
+    def test_true_is_distinct_from_one(self):
+        self.assertUnique([1, True])
+        self.assertUnique([1.0, True])
+
+    def test_false_is_distinct_from_zero(self):
+        self.assertUnique([0, False])
+
+    def test_false_is_distinct_from_null(self):
+        self.assertUnique([None, False])
+
+    def test_repeated_booleans_are_not_unique(self):
+        self.assertNotUnique([True, False, True])
+
+    def test_repeated_nulls_are_not_unique(self):
+        self.assertNotUnique([None, None])
+
+    def test_equal_arrays_are_not_unique(self):
+        self.assertNotUnique([[1, 'a'], [1.0, 'a']])
+
+    def test_arrays_in_different_order_are_unique(self):
+        self.assertUnique([[1, 2], [2, 1]])
+
+    def test_arrays_of_true_and_one_are_unique(self):
+        self.assertUnique([[1], [True]])
+
+    def test_array_is_distinct_from_its_items(self):
+        self.assertUnique([[1], 1])
+
+    def test_objects_in_different_order_are_not_unique(self):
+        self.assertNotUnique([{'a': 1, 'b': 2}, {'b': 2.0, 'a': 1}])
+
+    def test_objects_with_different_values_are_unique(self):
+        self.assertUnique([{'a': 1}, {'a': True}, {'a': None}, {'b': 1}])
+
+    def test_nested_containers(self):
+        self.assertNotUnique([{'a': [{'b': 1}]}, {'a': [{'b': 1.0}]}])
+        self.assertUnique([{'a': [{'b': 1}]}, {'a': [{'b': False}]}])
+
+    def test_object_is_distinct_from_array(self):
+        self.assertUnique([{}, []])
+
+    def test_large_array_of_scalars(self):
+        items = list(range(100000))
+        self.assertUnique(items)
+        items.append(99999.0)
+        self.assertNotUnique(items)
+
+    def test_large_array_of_objects(self):
+        items = [{'id': index, 'tags': ['a']} for index in range(100000)]
+        self.assertUnique(items)
+        items.append({'tags': ['a'], 'id': 0})
+        self.assertNotUnique(items)
+
+    def test_validator_uses_json_equality(self):
+        validator = jsch.compile_schema(jsch.Array(unique_items=True))
+        self.assertTrue(validator.is_valid([1, True, [0], [False]]))
+        self.assertFalse(validator.is_valid([{'a': [1]}, {'a': [1.0]}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,296 @@
+import unittest
+
+import jsch
+
+
+class InstanceValidationTestCase(unittest.TestCase):
+    def assertValid(self, schema, instance):
+        validator = jsch.compile_schema(schema)
+        self.assertTrue(validator.is_valid(instance))
+        validator.validate(instance)
+
+    def assertInvalid(self, schema, instance, message):
+        validator = jsch.compile_schema(schema)
+        self.assertFalse(validator.is_valid(instance))
+        regex = '^{0}$'.format(message)
+        with self.assertRaisesRegex(jsch.ValidationError, regex):
+            validator.validate(instance)
+
+
+class TestTypeValidation(InstanceValidationTestCase):
+    def test_passes_when_type_matches(self):
+        self.assertValid(jsch.String(), 'a')
+
+    def test_fails_when_type_does_not_match(self):
+        message = "'#' must be of type 'string'"
+        self.assertInvalid(jsch.String(), 1, message)
+
+    def test_integer_accepts_integral_float(self):
+        self.assertValid(jsch.Integer(), 1.0)
+
+    def test_integer_rejects_bool(self):
+        message = "'#' must be of type 'integer'"
+        self.assertInvalid(jsch.Integer(), True, message)
+
+    def test_type_list(self):
+        schema = jsch.Schema(type=['integer', 'null'])
+        self.assertValid(schema, None)
+        message = "'#' must be of type 'integer' or 'null'"
+        self.assertInvalid(schema, 'a', message)
+
+
+class TestEnumValidation(InstanceValidationTestCase):
+    def test_passes_when_equal_number(self):
+        self.assertValid(jsch.Schema(enum=[1, 'a']), 1.0)
+
+    def test_fails_when_bool_compared_to_number(self):
+        message = "'#' must be one of the enum values"
+        self.assertInvalid(jsch.Schema(enum=[1, 'a']), True, message)
+
+
+class TestNumericValidation(InstanceValidationTestCase):
+    def test_maximum(self):
+        schema = jsch.Number(maximum=5)
+        self.assertValid(schema, 5)
+        message = "'#' must be less than or equal to 5"
+        self.assertInvalid(schema, 6, message)
+
+    def test_exclusive_maximum(self):
+        message = "'#' must be less than 5"
+        schema = jsch.Number(maximum=5, exclusive_maximum=True)
+        self.assertInvalid(schema, 5, message)
+
+    def test_minimum(self):
+        message = "'#' must be greater than or equal to 5"
+        self.assertInvalid(jsch.Number(minimum=5), 4, message)
+
+    def test_exclusive_minimum(self):
+        message = "'#' must be greater than 5"
+        schema = jsch.Number(minimum=5, exclusive_minimum=True)
+        self.assertInvalid(schema, 5, message)
+
+    def test_multiple_of(self):
+        self.assertValid(jsch.Number(multiple_of=0.1), 0.3)
+        message = "'#' must be a multiple of 3"
+        self.assertInvalid(jsch.Number(multiple_of=3), 4, message)
+
+    def test_ignores_non_numbers(self):
+        self.assertValid(jsch.Schema(maximum=5), 'abcdef')
+
+
+class TestStringValidation(InstanceValidationTestCase):
+    def test_max_length(self):
+        message = "'#' must be at most 2 characters long"
+        self.assertInvalid(jsch.String(max_length=2), 'abc', message)
+
+    def test_min_length(self):
+        message = "'#' must be at least 2 characters long"
+        self.assertInvalid(jsch.String(min_length=2), 'a', message)
+
+    def test_pattern(self):
+        schema = jsch.String(pattern='^[0-9]+$')
+        self.assertValid(schema, '123')
+        message = "'#' must match pattern '\\^\\[0-9\\]\\+\\$'"
+        self.assertInvalid(schema, '12a', message)
+
+
+class TestArrayValidation(InstanceValidationTestCase):
+    def test_items_schema(self):
+        message = "'#/1' must be of type 'integer'"
+        schema = jsch.Array(items=jsch.Integer())
+        self.assertInvalid(schema, [1, 'a'], message)
+
+    def test_items_list_with_additional_items_false(self):
+        schema = jsch.Array(items=[jsch.Integer()], additional_items=False)
+        self.assertValid(schema, [1])
+        message = "'#' must not have additional items"
+        self.assertInvalid(schema, [1, 2], message)
+
+    def test_items_list_with_additional_items_schema(self):
+        schema = jsch.Array(
+            items=[jsch.Integer()], additional_items=jsch.String()
+        )
+        message = "'#/2' must be of type 'string'"
+        self.assertInvalid(schema, [1, 'a', 2], message)
+
+    def test_max_items(self):
+        message = "'#' must have at most 1 items"
+        self.assertInvalid(jsch.Array(max_items=1), [1, 2], message)
+
+    def test_min_items(self):
+        message = "'#' must have at least 1 items"
+        self.assertInvalid(jsch.Array(min_items=1), [], message)
+
+    def test_unique_items(self):
+        schema = jsch.Array(unique_items=True)
+        self.assertValid(schema, [1, True, [1], {'a': 1}])
+        message = "'#' must have unique items"
+        self.assertInvalid(schema, [{'a': 1}, {'a': 1.0}], message)
+
+
+class TestObjectValidation(InstanceValidationTestCase):
+    def test_properties(self):
+        schema = jsch.Object(properties={'a': jsch.Integer()})
+        message = "'#/a' must be of type 'integer'"
+        self.assertInvalid(schema, {'a': 'b'}, message)
+
+    def test_required(self):
+        message = "'#' must have property 'a'"
+        self.assertInvalid(jsch.Object(required=['a']), {}, message)
+
+    def test_additional_properties_false(self):
+        schema = jsch.Object(
+            properties={'a': jsch.Schema()},
+            pattern_properties={'^x-': jsch.Schema()},
+            additional_properties=False
+        )
+        self.assertValid(schema, {'a': 1, 'x-b': 2})
+        message = "'#' must not have additional property 'b'"
+        self.assertInvalid(schema, {'a': 1, 'b': 2}, message)
+
+    def test_additional_properties_schema(self):
+        schema = jsch.Object(additional_properties=jsch.Integer())
+        message = "'#/b' must be of type 'integer'"
+        self.assertInvalid(schema, {'b': 'c'}, message)
+
+    def test_pattern_properties(self):
+        schema = jsch.Object(pattern_properties={'^x-': jsch.Integer()})
+        message = "'#/x-a' must be of type 'integer'"
+        self.assertInvalid(schema, {'x-a': 'b'}, message)
+
+    def test_max_properties(self):
+        message = "'#' must have at most 1 properties"
+        schema = jsch.Object(max_properties=1)
+        self.assertInvalid(schema, {'a': 1, 'b': 2}, message)
+
+    def test_min_properties(self):
+        message = "'#' must have at least 1 properties"
+        self.assertInvalid(jsch.Object(min_properties=1), {}, message)
+
+    def test_dependencies_list(self):
+        schema = jsch.Object(dependencies={'a': ['b']})
+        self.assertValid(schema, {'b': 1})
+        message = "'#' must have property 'b' when property 'a' is present"
+        self.assertInvalid(schema, {'a': 1}, message)
+
+    def test_dependencies_schema(self):
+        schema = jsch.Object(dependencies={'a': jsch.Object(required=['b'])})
+        message = "'#' must have property 'b'"
+        self.assertInvalid(schema, {'a': 1}, message)
+
+
+class TestCombinatorValidation(InstanceValidationTestCase):
+    def test_all_of(self):
+        schema = jsch.Schema(all_of=[jsch.Integer(), jsch.Schema(minimum=2)])
+        message = "'#' must be greater than or equal to 2"
+        self.assertInvalid(schema, 1, message)
+
+    def test_any_of(self):
+        schema = jsch.Schema(any_of=[jsch.Integer(), jsch.String()])
+        self.assertValid(schema, 'a')
+        message = "'#' must be valid against at least one 'any_of' schema"
+        self.assertInvalid(schema, None, message)
+
+    def test_one_of(self):
+        schema = jsch.Schema(one_of=[jsch.Integer(), jsch.Number()])
+        self.assertValid(schema, 1.5)
+        message = "'#' must be valid against exactly one 'one_of' schema"
+        self.assertInvalid(schema, 1, message)
+
+    def test_not(self):
+        message = "'#' must not be valid against the 'not_' schema"
+        self.assertInvalid(jsch.Schema(not_=jsch.Integer()), 1, message)
+
+
+class TestRefValidation(InstanceValidationTestCase):
+    def test_resolves_local_ref(self):
+        schema = jsch.Object(
+            definitions={'name': jsch.String()},
+            properties={'a': jsch.Schema(ref='#/definitions/name')}
+        )
+        message = "'#/a' must be of type 'string'"
+        self.assertInvalid(schema, {'a': 1}, message)
+
+    def test_resolves_recursive_ref(self):
+        schema = jsch.Object(
+            properties={'child': jsch.Schema(ref='#')},
+            additional_properties=False
+        )
+        self.assertValid(schema, {'child': {'child': {}}})
+        message = "'#/child/child' must not have additional property 'a'"
+        self.assertInvalid(schema, {'child': {'child': {'a': 1}}}, message)
+
+    def test_fails_when_ref_cannot_be_resolved(self):
+        message = "^'ref' '#/definitions/a' cannot be resolved$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.compile_schema(jsch.Schema(ref='#/definitions/a'))
+
+    def test_fails_when_ref_fragment_not_pointer(self):
+        message = "^'ref' '#foo' cannot be resolved$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.compile_schema(jsch.Object(
+                properties={'a': jsch.Schema(ref='#foo')}
+            ))
+
+    def test_fails_when_ref_not_local(self):
+        message = "^'ref' 'a.json' must be a local reference$"
+        with self.assertRaisesRegex(jsch.SchemaValidationError, message):
+            jsch.compile_schema(jsch.Schema(ref='a.json'))
+
+
+class TestValidationModes(unittest.TestCase):
+    def setUp(self):
+        self.validator = jsch.compile_schema(jsch.Object(
+            properties={
+                'name': jsch.String(max_length=3),
+                'tags': jsch.Array(items=jsch.String())
+            },
+            required=['name', 'id']
+        ))
+        self.instance = {'name': 'abcd', 'tags': ['a', 1, 2]}
+
+    def test_first_error(self):
+        error = self.validator.first_error(self.instance)
+        self.assertEqual("'#' must have property 'id'", str(error))
+
+    def test_first_error_when_valid(self):
+        self.assertIsNone(self.validator.first_error({'name': 'a', 'id': 1}))
+
+    def test_errors_collects_all(self):
+        self.assertEqual(
+            [
+                "'#' must have property 'id'",
+                "'#/name' must be at most 3 characters long",
+                "'#/tags/1' must be of type 'string'",
+                "'#/tags/2' must be of type 'string'"
+            ],
+            [str(error) for error in self.validator.errors(self.instance)]
+        )
+
+    def test_errors_when_valid(self):
+        self.assertEqual([], self.validator.errors({'name': 'a', 'id': 1}))
+
+    def test_iter_errors_is_lazy(self):
+        errors = self.validator.iter_errors(self.instance)
+        self.assertEqual('must have property \'id\'', next(errors).message)
+
+    def test_path_built_on_access(self):
+        error = self.validator.errors(self.instance)[-1]
+        self.assertIsNone(error._path)
+        self.assertEqual(['tags', 2], list(error.path))
+        self.assertEqual('#/tags/2', error.pointer)
+
+    def test_message_not_reformatted_without_params(self):
+        validator = jsch.compile_schema(jsch.String(pattern='^a{2}$'))
+        error = validator.first_error('b')
+        self.assertEqual("must match pattern '^a{2}$'", error.message)
+
+
+class TestValidationError(unittest.TestCase):
+    def test_path(self):
+        error = jsch.ValidationError('must be valid', ['a', 0])
+        self.assertEqual("'#/a/0' must be valid", str(error))
+
+    def test_params(self):
+        error = jsch.ValidationError('must have property {0}', params=('a',))
+        self.assertEqual("'#' must have property a", str(error))
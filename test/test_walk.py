@@ -0,0 +1,178 @@
+import unittest
+
+import jsch
+
+
+DEEP = 5000
+
+
+def make_deep_schema(depth=DEEP):
+    schema = jsch.Integer()
+    for _ in range(depth):
+        schema = jsch.Schema(not_=schema)
+    return schema
+
+
+class TestWalk(unittest.TestCase):
+    def test_yields_root(self):
+        schema = jsch.Schema()
+        self.assertEqual([('#', schema)], list(jsch.walk(schema)))
+
+    def test_follows_every_subschema_keyword(self):
+        leaf = jsch.Schema
+        schema = jsch.Schema(
+            properties={'a': leaf()},
+            pattern_properties={'^b': leaf()},
+            additional_properties=leaf(),
+            items=[leaf()],
+            additional_items=leaf(),
+            all_of=[leaf()],
+            any_of=[leaf()],
+            one_of=[leaf()],
+            not_=leaf(),
+            definitions={'c': leaf()},
+            dependencies={'d': leaf(), 'e': ['a']}
+        )
+        self.assertCountEqual(
+            [
+                '#',
+                '#/properties/a',
+                '#/patternProperties/^b',
+                '#/additionalProperties',
+                '#/items/0',
+                '#/additionalItems',
+                '#/allOf/0',
+                '#/anyOf/0',
+                '#/oneOf/0',
+                '#/not',
+                '#/definitions/c',
+                '#/dependencies/d'
+            ],
+            [pointer for pointer, _ in jsch.walk(schema)]
+        )
+
+    def test_depth_first_in_keyword_order(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Array(items=jsch.String()),
+            'b': jsch.Integer()
+        })
+        self.assertEqual(
+            ['#', '#/properties/a', '#/properties/a/items', '#/properties/b'],
+            [pointer for pointer, _ in jsch.walk(schema)]
+        )
+
+    def test_breadth_first_in_keyword_order(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Array(items=jsch.String()),
+            'b': jsch.Integer()
+        })
+        self.assertEqual(
+            ['#', '#/properties/a', '#/properties/b', '#/properties/a/items'],
+            [pointer for pointer, _ in jsch.walk(schema, breadth_first=True)]
+        )
+
+    def test_yields_schemas(self):
+        items = jsch.String()
+        schema = jsch.Array(items=items)
+        self.assertEqual(
+            [('#', schema), ('#/items', items)], list(jsch.walk(schema))
+        )
+
+    def test_escapes_names(self):
+        schema = jsch.Object(properties={'a/b~c': jsch.Schema()})
+        self.assertEqual(
+            ['#', '#/properties/a~1b~0c'],
+            [pointer for pointer, _ in jsch.walk(schema)]
+        )
+
+    def test_does_not_follow_ref(self):
+        schema = jsch.Object(
+            definitions={'a': jsch.Integer()},
+            properties={'b': jsch.Schema(ref='#/definitions/a')}
+        )
+        self.assertCountEqual(
+            ['#', '#/properties/b', '#/definitions/a'],
+            [pointer for pointer, _ in jsch.walk(schema)]
+        )
+
+    def test_prune(self):
+        schema = jsch.Object(properties={
+            'a': jsch.Object(properties={'b': jsch.Schema()}),
+            'c': jsch.Schema()
+        })
+        walked = jsch.walk(
+            schema, prune=lambda pointer, node: pointer == '#/properties/a'
+        )
+        self.assertEqual(
+            ['#', '#/properties/c'], [pointer for pointer, _ in walked]
+        )
+
+    def test_is_lazy(self):
+        walked = jsch.walk(make_deep_schema())
+        self.assertEqual('#', next(walked)[0])
+        self.assertEqual('#/not', next(walked)[0])
+
+    def test_walks_deep_schema(self):
+        pointers = [pointer for pointer, _ in jsch.walk(make_deep_schema())]
+        self.assertEqual(DEEP + 1, len(pointers))
+        self.assertEqual('#' + '/not' * DEEP, pointers[-1])
+
+
+class TestDeepSchemas(unittest.TestCase):
+    def test_equality(self):
+        self.assertEqual(make_deep_schema(), make_deep_schema())
+        self.assertNotEqual(make_deep_schema(), make_deep_schema(DEEP - 1))
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            jsch.fingerprint(make_deep_schema()),
+            jsch.fingerprint(make_deep_schema())
+        )
+
+    def test_canonical_json(self):
+        self.assertEqual(
+            '{"not":' * DEEP + '{"type":"integer"}' + '}' * DEEP,
+            jsch.canonical_json(make_deep_schema())
+        )
+
+    def test_deep_default(self):
+        default = []
+        for _ in range(DEEP):
+            default = [default]
+        jsch.Schema(default=default)
+
+
+class TestSchemaEquality(unittest.TestCase):
+    def test_ignores_property_order(self):
+        self.assertEqual(
+            jsch.Object(properties={'a': jsch.String(), 'b': jsch.Null()}),
+            jsch.Object(properties={'b': jsch.Null(), 'a': jsch.String()})
+        )
+
+    def test_compares_subschemas(self):
+        self.assertNotEqual(
+            jsch.Array(items=[jsch.String()]),
+            jsch.Array(items=[jsch.Integer()])
+        )
+        self.assertNotEqual(
+            jsch.Array(items=[jsch.String()]),
+            jsch.Array(items=[jsch.String(), jsch.String()])
+        )
+        self.assertNotEqual(
+            jsch.Object(additional_properties=False),
+            jsch.Object(additional_properties=jsch.Schema())
+        )
+
+    def test_compares_property_dependencies(self):
+        self.assertEqual(
+            jsch.Object(dependencies={'a': ['b']}),
+            jsch.Object(dependencies={'a': ['b']})
+        )
+        self.assertNotEqual(
+            jsch.Object(dependencies={'a': ['b']}),
+            jsch.Object(dependencies={'a': jsch.Schema()})
+        )
+
+    def test_other_types(self):
+        self.assertNotEqual(jsch.Schema(), {})
+        self.assertFalse(jsch.Schema() == None)